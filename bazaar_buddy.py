@@ -2,11 +2,11 @@ import threading
 
 from logging import Logger
 from overlay import Overlay
-from system_handler import BaseSystemHandler
 from configuration import Configuration
-from worker_framework import ThreadController
-from timer_worker import TimerWorker
-from text_extractor_worker import TextExtractorWorkerFactory
+from worker_framework import ThreadController, CircuitBreakerRestart
+from process_discovery import ProcessDiscoveryJob
+from scheduler_worker import SchedulerWorker
+from text_extractor_worker import MessageCoalescer, TextExtractorWorkerFactory
 
 
 class BazaarBuddy:
@@ -16,70 +16,87 @@ class BazaarBuddy:
         logger: Logger,
         thread_controller: ThreadController,
         text_extractor_worker_factory: TextExtractorWorkerFactory,
-        one_second_timer: TimerWorker,
-        system_handler: BaseSystemHandler,
+        scheduler: SchedulerWorker,
+        process_discovery_job: ProcessDiscoveryJob,
         configuration: Configuration,
     ):
         self.overlay = overlay
         self.logger = logger
         self.thread_controller = thread_controller
         self.text_extractor_worker_factory = text_extractor_worker_factory
-        self.text_extractor_worker = None
-        self.one_second_timer = one_second_timer
-        self.system_handler = system_handler
+        self.text_extractor_pool: str | None = None
+        self.message_coalescer: MessageCoalescer | None = None
+        self.scheduler = scheduler
+        self.process_discovery_job = process_discovery_job
         self.configuration = configuration
         self.thread_name = threading.current_thread().name
 
     def start_polling(self):
         self.logger.info(f"[{self.thread_name}] Start Polling")
         self.overlay.set_message("Waiting for The Bazaar to start…")
-        self.thread_controller.add_worker(self.one_second_timer)
-        # saving connection so we can disconnect later
-        self.attempt_start_connection = self.one_second_timer.timer_tick.connect(self._attempt_start)
-        self.thread_controller.start_worker(self.one_second_timer.name)
+        # discovery scans on the scheduler thread and reports back here
+        self.process_discovery_job.process_found.connect(self._on_process_found)
+        self.process_discovery_job.process_lost.connect(self.restart_polling)
+        self.scheduler.add_job(
+            ProcessDiscoveryJob.NAME,
+            self.process_discovery_job,
+            1.0,
+            max_interval_s=self.configuration.process_scan_max_interval_s,
+        )
 
     def restart_polling(self):
         self.logger.info(f"[{self.thread_name}] Restarting Polling")
 
-        try:
-            self.thread_controller.stop_worker(self.text_extractor_worker.name)
-            self.text_extractor_worker = None
-        except Exception as e:
-            self.logger.warning(f"[{self.thread_name}] Error stopping text extractor: {e}")
-
-        self.attempt_start_connection = self.one_second_timer.timer_tick.connect(self._attempt_start)
-
-    def _attempt_start(self):
-
-        self.logger.info(f"[{self.thread_name}] attempting to find the Bazaar process…")
-
-        process_name = "TheBazaar.exe" if self.configuration.operating_system == "Windows" else "The Bazaar"
-        bazaar_proc = self.system_handler.get_process_by_name(process_name)
-
-        if not bazaar_proc:
-            self.logger.info(f"[{self.thread_name}] could not find process with name: {process_name}")
+        if self.text_extractor_pool is not None:
+            try:
+                self.thread_controller.stop_pool(self.text_extractor_pool)
+            except Exception as e:
+                self.logger.warning(f"[{self.thread_name}] Error stopping text extractors: {e}")
+            self.text_extractor_pool = None
+        if self.message_coalescer is not None:
+            self.message_coalescer.close()
+            self.message_coalescer.deleteLater()
+            self.message_coalescer = None
+
+        self.process_discovery_job.rescan()
+        self.scheduler.run_now(ProcessDiscoveryJob.NAME)
+
+    def _on_process_found(self, pid: int, window_handle: int):
+        if self.text_extractor_pool is not None:
             return
 
-        self.logger.info(f"[{self.thread_name}] found Bazaar process with PID: {bazaar_proc.pid}")
-        window_handle = self.system_handler.find_process_main_window_handle(bazaar_proc.pid)
-
-        if not window_handle:
-            self.logger.info(f"[{self.thread_name}] could not find main window handle for process")
-            return
-
-        self.logger.info(f"[{self.thread_name}] found window handle: {window_handle}")
+        self.logger.info(f"[{self.thread_name}] found Bazaar process with PID: {pid}, window handle: {window_handle}")
 
         self.overlay.set_message("Bazaar process found, watching…")
 
-        self.logger.info(f"[{self.thread_name}] Bazaar process found")
-
-        self.logger.info(f"[{self.thread_name}] stopping trying to _attempt_start")
-        self.one_second_timer.disconnect(self.attempt_start_connection)
-
-        self.text_extractor_worker = self.text_extractor_worker_factory.create("text-extractor-worker")
-
-        self.thread_controller.add_worker(self.text_extractor_worker)
-        self.text_extractor_worker.message_ready.connect(self.overlay.set_message)
-        self.text_extractor_worker.window_closed.connect(self.restart_polling)
-        self.logger.info(f"[{self.thread_name}] starting text extractor worker")
-        self.thread_controller.start_worker(self.text_extractor_worker.name)
+        # several workers OCR frames from one capture source; the newest result reaches
+        # the overlay at most once per display refresh
+        self.message_coalescer = MessageCoalescer(self.logger)
+        self.message_coalescer.message_ready.connect(self.overlay.set_message)
+        workers = self.text_extractor_worker_factory.create_pool(
+            "text-extractor-worker", self.configuration.ocr_workers, self.message_coalescer
+        )
+        for worker in workers:
+            worker.window_closed.connect(self._on_window_closed)
+        self.text_extractor_pool = "text-extractors"
+        self.thread_controller.add_pool(self.text_extractor_pool, workers)
+        for worker in workers:
+            # a crashed extractor is back within seconds; a crash loop backs off and is eventually reported
+            self.thread_controller.supervise(
+                worker.name,
+                CircuitBreakerRestart(max_failures=5, window_s=60, cooldown_s=60, delay_s=1.0, max_opens=3),
+                on_give_up=self._on_extractor_given_up,
+            )
+        self.logger.info(f"[{self.thread_name}] starting {len(workers)} text extractor workers")
+        self.thread_controller.start_pool(self.text_extractor_pool)
+
+    def _on_extractor_given_up(self, worker_name: str, errors: list[str]):
+        self.logger.error(f"[{self.thread_name}] {worker_name} keeps crashing, last errors: {errors[-3:]}")
+        self.overlay.set_message(
+            "An internal error occurred while capturing a screenshot and extracting text. Please visit the Bazaar Buddy discord server and report this issue."
+        )
+
+    def _on_window_closed(self):
+        # every worker of the pool reports it; restart once
+        if self.text_extractor_pool is not None:
+            self.restart_polling()
@@ -0,0 +1,189 @@
+"""Catalogue build benchmark.
+
+Builds the entity catalogue from the full ``client-data`` sources (items,
+monsters, expeditions, events) in memory, the way
+``client-data/entity_processor.py`` does, and reports:
+
+* the whole build, with the per-rule decoration and cleanup regexes the
+  processor used to run (kept below as the reference) and with
+  :class:`entity_processor.DecorationEngine`,
+* the decoration stage alone,
+* whether the output is byte-identical to the committed ``entities.json``.
+
+Then runs the processor's ``main`` (incremental build, output files and
+hot-update bundle) against a copy of the sources in a temporary directory:
+cold (no build cache), warm (nothing changed) and after changing a single
+item, with how many entities were built and files rewritten.
+
+    python -m benchmarks.catalogue_build [--repeat 5] [--jobs N]
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import io
+import json
+import re
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Callable
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / "client-data"))
+
+import entity_processor as processor  # noqa: E402
+
+
+# ─── the processor's decoration before DecorationEngine ────────────────────
+_LEGACY_CLEANUP = [(r" \.", "."), (r" \)", ")"), (r"\( ", "("), (r"\+ ", "+"), (r" :", ":"), (r" %", "%")]
+
+
+def legacy_cleanup(text: str) -> str:
+    for pattern, replacement in _LEGACY_CLEANUP:
+        text = re.sub(pattern, replacement, text)
+    return text
+
+
+class LegacyDecorator:
+    """Every rule as its own ``re.sub`` over every non-bold segment."""
+
+    def __init__(self, rules: list[dict]) -> None:
+        self._rules = rules
+
+    def decorate(self, text: str) -> str:
+        segments = re.split(r"(<b>.*?</b>)", text, flags=re.IGNORECASE | re.DOTALL)
+        for i, seg in enumerate(segments):
+            if seg.lower().startswith("<b>"):
+                continue
+            for rule in self._rules:
+                span = rule["decorate"]
+                seg = re.sub(
+                    rf"\b{re.escape(rule['word'])}\b",
+                    lambda m, span=span: span.format(word=m.group(0)),
+                    seg,
+                    flags=re.IGNORECASE,
+                )
+            segments[i] = seg
+        return "".join(segments)
+
+
+def load_sources() -> tuple[list, list, list, list, list]:
+    def load(path: Path) -> Any:
+        with path.open(encoding="utf-8") as fp:
+            return json.load(fp)
+
+    return (
+        load(processor.EVENTS_PATH),
+        load(processor.ITEMS_PATH).get("items", []),
+        processor.reformat_monsters(load(processor.MONSTERS_PATH)),
+        load(processor.EXPEDITIONS_PATH),
+        load(processor.DECORATOR_PATH),
+    )
+
+
+def timed(function: Callable[[], Any], repeat: int) -> tuple[float, Any]:
+    timings, result = [], None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = function()
+        timings.append(time.perf_counter() - started)
+    return statistics.median(timings) * 1000, result
+
+
+def incremental_runs(jobs: int | None) -> None:
+    outputs = (
+        "ENTITY_OUT_PATH",
+        "WINDOWS_TERMS_PATH",
+        "MAC_TERMS_PATH",
+        "WINDOWS_CHAR_SET_PATH",
+        "MAC_CHAR_SET_PATH",
+        "BUNDLE_DIR",
+        "BUILD_CACHE_PATH",
+    )
+    saved = {name: getattr(processor, name) for name in (*outputs, "ITEMS_PATH")}
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        for name in outputs:
+            setattr(processor, name, root / saved[name].relative_to(processor.ROOT_DIR))
+        processor.ITEMS_PATH = root / "items.json"
+        shutil.copyfile(saved["ITEMS_PATH"], processor.ITEMS_PATH)
+
+        def run() -> dict[str, Any]:
+            with contextlib.redirect_stdout(io.StringIO()):
+                return processor.main([] if jobs is None else ["--jobs", str(jobs)])
+
+        def change_one_item() -> None:
+            with processor.ITEMS_PATH.open(encoding="utf-8") as fp:
+                data = json.load(fp)
+            item = data["items"][0]
+            item["tiers"][item["startingTier"]]["tooltips"].append("Changed for the benchmark")
+            with processor.ITEMS_PATH.open("w", encoding="utf-8") as fp:
+                json.dump(data, fp)
+
+        try:
+            print()
+            print(f"{'incremental build':32s} {'time':>10s} {'built':>7s} {'cached':>7s} {'written':>8s}")
+            for name, prepare in (("cold", None), ("warm", None), ("one item changed", change_one_item)):
+                if prepare:
+                    prepare()
+                result = run()
+                print(
+                    f"{name:32s} {result['seconds'] * 1000:7.0f} ms {result['built']:7d} "
+                    f"{result['reused']:7d} {result['written']:8d}"
+                )
+        finally:
+            for name, value in saved.items():
+                setattr(processor, name, value)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=5, help="builds per variant (the median is reported)")
+    parser.add_argument("--jobs", type=int, help="processes for the incremental build (default: one per CPU)")
+    args = parser.parse_args()
+
+    sources = load_sources()
+    rules = sources[-1]
+    expected = (ROOT / "entities.json").read_text(encoding="utf-8")
+    # the undecorated messages, for the decoration stage on its own
+    messages = [
+        processor.cleanup_display_message(message)
+        for message in (
+            [processor.build_event_message(event) for event in sources[0]]
+            + [processor.build_item_message(item) for item in sources[1]]
+            + [processor.build_monster_message(monster) for monster in sources[2] + sources[3]]
+        )
+    ]
+
+    def build(decorator_class, cleanup) -> str:
+        engine, clean = processor.DecorationEngine, processor.cleanup_display_message
+        processor.DecorationEngine, processor.cleanup_display_message = decorator_class, cleanup
+        try:
+            entities = processor.build_entities(*sources, jobs=1)
+        finally:
+            processor.DecorationEngine, processor.cleanup_display_message = engine, clean
+        return processor.catalogue_json(entities)
+
+    print(f"🏗️  {len(messages)} entities, {len(rules)} decoration rules, median of {args.repeat}")
+    print("─" * 72)
+    print(f"{'variant':32s} {'build':>10s} {'decorate':>10s} {'identical':>10s}")
+    for name, decorator_class, cleanup in (
+        ("per-rule regexes (before)", LegacyDecorator, legacy_cleanup),
+        ("DecorationEngine", processor.DecorationEngine, processor.cleanup_display_message),
+    ):
+        build_ms, output = timed(lambda: build(decorator_class, cleanup), args.repeat)
+        decorator = decorator_class(rules)
+        decorate_ms, _ = timed(lambda: [decorator.decorate(message) for message in messages], args.repeat)
+        print(f"{name:32s} {build_ms:7.0f} ms {decorate_ms:7.0f} ms {str(output == expected):>10s}")
+
+    incremental_runs(args.jobs)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
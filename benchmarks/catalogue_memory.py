@@ -0,0 +1,97 @@
+"""Catalogue source memory benchmark.
+
+Peak Python memory (``tracemalloc``) of reading and transforming the big
+catalogue sources, ``items.json`` and ``monsters.json``, scaled up to
+``--scales`` times their size (records repeated), either loaded whole with
+``json.load`` (how ``entity_processor`` read them before) or streamed with
+:func:`json_stream.iter_json`.  Every record is turned into its entity and
+dropped, so what is measured is the cost of getting the records in, not of
+the catalogue being built.
+
+    python -m benchmarks.catalogue_memory [--scales 1,2,4,8]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Callable, Iterable
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / "client-data"))
+
+import entity_processor as processor  # noqa: E402
+from json_stream import iter_json  # noqa: E402
+
+
+def scaled_sources(directory: Path, scale: int) -> tuple[Path, Path]:
+    with processor.ITEMS_PATH.open(encoding="utf-8") as fp:
+        items = json.load(fp)
+    with processor.MONSTERS_PATH.open(encoding="utf-8") as fp:
+        monsters = json.load(fp)
+    items["items"] = items["items"] * scale
+    monsters["monsterEncounterDays"] = monsters["monsterEncounterDays"] * scale
+
+    items_path, monsters_path = directory / f"items-{scale}.json", directory / f"monsters-{scale}.json"
+    with items_path.open("w", encoding="utf-8") as fp:
+        json.dump(items, fp, indent=2, ensure_ascii=False)
+    with monsters_path.open("w", encoding="utf-8") as fp:
+        json.dump(monsters, fp, indent=2, ensure_ascii=False)
+    return items_path, monsters_path
+
+
+def loaded(items_path: Path, monsters_path: Path) -> Iterable[tuple[str, dict]]:
+    with items_path.open(encoding="utf-8") as fp:
+        items = json.load(fp).get("items", [])
+    with monsters_path.open(encoding="utf-8") as fp:
+        monsters = processor.reformat_monsters(json.load(fp))
+    return [*(("item", item) for item in items), *(("monster", monster) for monster in monsters)]
+
+
+def streamed(items_path: Path, monsters_path: Path) -> Iterable[tuple[str, dict]]:
+    yield from (("item", item) for item in iter_json(items_path, processor.ITEM_RECORDS))
+    yield from (("monster", monster) for monster in processor.iter_monsters(monsters_path))
+
+
+def measure(read: Callable[[Path, Path], Iterable[tuple[str, dict]]], paths: tuple[Path, Path]) -> tuple[float, float, int]:
+    decorator = processor.DecorationEngine(json.loads(processor.DECORATOR_PATH.read_text(encoding="utf-8")))
+    tracemalloc.start()
+    started = time.perf_counter()
+    count = 0
+    for kind, record in read(*paths):
+        processor.build_entity(kind, record, decorator)
+        count += 1
+    elapsed = time.perf_counter() - started
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak / 2**20, elapsed, count
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--scales", default="1,2,4,8", help="comma-separated source size multipliers")
+    args = parser.parse_args()
+
+    print("📈 peak traced memory reading + transforming items.json and monsters.json")
+    print("─" * 72)
+    print(f"{'scale':>6s} {'sources':>10s} {'records':>8s} {'json.load':>12s} {'streamed':>12s} {'time (load/stream)':>20s}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for scale in (int(value) for value in args.scales.split(",")):
+            paths = scaled_sources(Path(tmp), scale)
+            size_mb = sum(path.stat().st_size for path in paths) / 2**20
+            load_peak, load_s, count = measure(loaded, paths)
+            stream_peak, stream_s, _ = measure(streamed, paths)
+            print(
+                f"{scale:5d}x {size_mb:7.1f} MB {count:8d} {load_peak:9.1f} MB {stream_peak:9.1f} MB "
+                f"{load_s:9.2f}s / {stream_s:.2f}s"
+            )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,147 @@
+"""Catalogue size and client memory benchmark.
+
+Builds the catalogue from the ``client-data`` sources and compares the
+format 1 ``entities.json`` (a list of entities, every message in full) with
+format 2 (duplicates dropped, messages as references into a table of shared
+fragments, see ``client-data/entity_processor.py``):
+
+* the size of ``entities.json`` and of its xz hot-update bundle,
+* the memory the client holds for the catalogue once loaded: resident set
+  growth (``VmRSS``, Linux; freed memory is rarely given back, so it
+  follows the peak), and the Python allocations still held and at their
+  peak while loading (``tracemalloc``), each measured in a fresh
+  interpreter.  *before* is the format 1 file loaded as plain dicts, the
+  way ``MessageBuilder`` held it; *after* is the format 2 file through
+  :func:`message_builder.load_catalogue`.
+
+    python -m benchmarks.catalogue_size
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import json
+import lzma
+import subprocess
+import sys
+import tempfile
+import tracemalloc
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / "client-data"))
+
+import entity_processor as processor  # noqa: E402
+
+def resident_kb() -> int:
+    try:
+        with open("/proc/self/status", encoding="ascii") as fp:
+            return next(int(line.split()[1]) for line in fp if line.startswith("VmRSS:"))
+    except OSError:
+        return 0
+
+
+def measure(loader: str, path: Path, traced: bool) -> dict[str, float]:
+    """Run in a fresh interpreter: memory taken by loading the catalogue at *path*.
+
+    tracemalloc's own bookkeeping is resident too, so the resident set is
+    measured in a run without it.
+    """
+    from message_builder import load_catalogue
+
+    gc.collect()
+    rss = resident_kb()
+    if traced:
+        tracemalloc.start()
+    if loader == "json.load":
+        with path.open(encoding="utf-8") as fp:
+            catalogue = json.load(fp)
+    else:
+        catalogue = load_catalogue(path)
+    gc.collect()
+    if not traced:
+        return {"entities": len(catalogue), "rss_mb": (resident_kb() - rss) / 1024}
+    held, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {"entities": len(catalogue), "held_mb": held / 2**20, "peak_mb": peak / 2**20}
+
+
+def measure_in_subprocess(loader: str, path: Path) -> dict[str, float]:
+    result: dict[str, float] = {}
+    for mode in ("resident", "traced"):
+        output = subprocess.run(
+            [sys.executable, "-m", "benchmarks.catalogue_size", "--measure", loader, str(path), mode],
+            cwd=ROOT,
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout
+        result.update(json.loads(output.splitlines()[-1]))
+    return result
+
+
+def build_entities() -> list[dict]:
+    def load(path: Path):
+        with path.open(encoding="utf-8") as fp:
+            return json.load(fp)
+
+    return processor.build_entities(
+        load(processor.EVENTS_PATH),
+        load(processor.ITEMS_PATH).get("items", []),
+        processor.reformat_monsters(load(processor.MONSTERS_PATH)),
+        load(processor.EXPEDITIONS_PATH),
+        load(processor.DECORATOR_PATH),
+        jobs=1,
+    )
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--measure", nargs=3, metavar=("LOADER", "PATH", "MODE"), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.measure:
+        loader, path, mode = args.measure
+        print(json.dumps(measure(loader, Path(path), traced=mode == "traced")))
+        return 0
+
+    entities = build_entities()
+    catalogue = processor.intern_catalogue(entities)
+    lines = [line for entity in entities for line in entity.get("display_message", "").split(processor.MESSAGE_SEPARATOR)]
+    print(
+        f"📦 {len(entities)} entities → {len(catalogue['entities'])} distinct; "
+        f"{len(lines)} message lines → {len(catalogue['fragments'])} fragments"
+    )
+    print("─" * 72)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        files = {
+            "format 1 (list)": Path(tmp) / "entities-1.json",
+            "format 2 (interned)": Path(tmp) / "entities-2.json",
+        }
+        files["format 1 (list)"].write_text(json.dumps(entities, indent=2, ensure_ascii=False), encoding="utf-8")
+        files["format 2 (interned)"].write_text(processor.catalogue_json(entities), encoding="utf-8")
+
+        print(f"{'catalogue':24s} {'entities.json':>14s} {'xz bundle':>11s}")
+        for name, path in files.items():
+            raw = path.read_bytes()
+            bundle = lzma.compress(raw, preset=9 | lzma.PRESET_EXTREME)
+            print(f"{name:24s} {len(raw) / 1024:11.0f} KB {len(bundle) / 1024:8.0f} KB")
+
+        print()
+        print(f"{'client memory':24s} {'loader':>16s} {'resident':>11s} {'held':>11s} {'peak':>11s}")
+        for name, loader, path in (
+            ("before", "json.load", files["format 1 (list)"]),
+            ("format 1, interned", "load_catalogue", files["format 1 (list)"]),
+            ("after", "load_catalogue", files["format 2 (interned)"]),
+        ):
+            result = measure_in_subprocess(loader, path)
+            print(
+                f"{name:24s} {loader:>16s} {result['rss_mb']:8.1f} MB "
+                f"{result['held_mb']:8.1f} MB {result['peak_mb']:8.1f} MB"
+            )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,224 @@
+"""Event scraping benchmark.
+
+Serves a stand-in for the wiki from a local server: fixture pages
+generated from ``client-data/events.json`` (the category table plus one
+page per event, half of them in the "Function" layout and the others in
+the "Description" one), each answered after ``--latency-ms`` with an
+ETag, and ``304 Not Modified`` when the ETag is sent back.  Then scrapes
+it with:
+
+* the scraper as it was (kept below as the reference): one bare
+  ``requests.get`` per page, one after the other,
+* ``client-data/event_scraper.py`` with an empty HTTP cache,
+* ``event_scraper.py`` again, revalidating every page from its cache,
+* ``event_scraper.py`` with an empty cache while about one page in
+  ``--flaky`` fails with a 503 the first time it is asked for,
+
+reporting the time, the requests the server answered, the bytes of pages it
+sent, and whether ``events.json`` came out identical to the reference's.
+
+    python -m benchmarks.event_scraping [--latency-ms 40] [--workers 8]
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import hashlib
+import html
+import io
+import json
+import shutil
+import sys
+import tempfile
+import threading
+import time
+import zlib
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Callable
+from urllib.parse import quote, unquote
+
+import requests
+from bs4 import BeautifulSoup
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / "client-data"))
+
+import event_scraper as scraper  # noqa: E402
+
+
+# ─── the scraper before CachedFetcher ──────────────────────────────────────
+def legacy_scrape(base: str) -> list[dict]:
+    soup = BeautifulSoup(requests.get(f"{base}/wiki/Category:Event").text, "html.parser")
+    table = soup.select_one("table.wikitable.sortable")
+    links = []
+    for tr in table.select("tr")[1:]:
+        a = tr.select_one("td a[href^='/wiki/']")
+        if a:
+            links.append(base + a["href"])
+
+    events = []
+    for url in dict.fromkeys(links):
+        soup = BeautifulSoup(requests.get(url).text, "html.parser")
+        name = soup.select_one("#firstHeading").text.strip()
+        func = soup.find("span", id="Function")
+        if func:
+            lis = func.find_parent().find_next("ul")
+            options = [scraper.clean(li.get_text(" ", strip=True)) for li in lis.select("li")]
+        else:
+            desc = soup.find("span", id="Description")
+            options = [scraper.clean(desc.find_parent().find_next("p").text)]
+        events.append({"name": name, "options": options})
+    return events
+
+
+# ─── the stand-in wiki ─────────────────────────────────────────────────────
+def fixture_pages(events: list[dict]) -> dict[str, bytes]:
+    def path(name: str) -> str:
+        return "/wiki/" + quote(name.replace(" ", "_"))
+
+    def page(title: str, body: str) -> bytes:
+        return (
+            f'<!DOCTYPE html><html><head><title>{html.escape(title)}</title></head><body>'
+            f'<h1 id="firstHeading">{html.escape(title)}</h1>{body}</body></html>'
+        ).encode("utf-8")
+
+    rows = "".join(f'<tr><td><a href="{path(event["name"])}">{html.escape(event["name"])}</a></td></tr>' for event in events)
+    pages = {"/wiki/Category:Event": page("Category:Event", f'<table class="wikitable sortable"><tr><th>Event</th></tr>{rows}</table>')}
+    for index, event in enumerate(events):
+        if index % 2 == 0:
+            items = "".join(f"<li>{html.escape(option)}</li>" for option in event["options"])
+            body = f'<h2><span id="Function">Function</span></h2><ul>{items}</ul>'
+        else:
+            # "Description" pages hold a single paragraph
+            body = f'<h2><span id="Description">Description</span></h2><p>{html.escape(" ".join(event["options"]))}</p>'
+        pages[path(event["name"])] = page(event["name"], body)
+    return pages
+
+
+def expected_events(events: list[dict]) -> list[dict]:
+    return [
+        event if index % 2 == 0 else {"name": event["name"], "options": [scraper.clean(" ".join(event["options"]))]}
+        for index, event in enumerate(events)
+    ]
+
+
+class StandInWiki:
+    def __init__(self, pages: dict[str, bytes], latency_s: float) -> None:
+        self.pages = pages
+        self.latency_s = latency_s
+        self.flaky = 0
+        self.requests: Counter[str] = Counter()
+        self.bytes_sent = 0
+        self._failed: set[str] = set()
+        self._lock = threading.Lock()
+        wiki = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"  # keep-alive, so pooled connections are reused
+
+            def do_GET(self) -> None:  # noqa: N802
+                wiki.answer(self)
+
+            def log_message(self, *args: Any) -> None:
+                pass
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self._server.daemon_threads = True
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+        self.base = f"http://127.0.0.1:{self._server.server_port}"
+
+    def reset(self, flaky: int = 0) -> None:
+        self.flaky, self.requests, self.bytes_sent, self._failed = flaky, Counter(), 0, set()
+
+    def answer(self, handler: BaseHTTPRequestHandler) -> None:
+        time.sleep(self.latency_s)
+        path = unquote(handler.path)
+        body = self.pages.get(quote(path, safe="/:"))
+        with self._lock:
+            if body is not None and self.flaky and path not in self._failed and zlib.crc32(path.encode("utf-8")) % self.flaky == 0:
+                self._failed.add(path)
+                status = 503
+            elif body is None:
+                status = 404
+            else:
+                etag = '"' + hashlib.sha256(body).hexdigest()[:16] + '"'
+                status = 304 if handler.headers.get("If-None-Match") == etag else 200
+            self.requests[str(status)] += 1
+            if status == 200:
+                self.bytes_sent += len(body)
+
+        handler.send_response(status)
+        if status == 200:
+            handler.send_header("Content-Type", "text/html; charset=utf-8")
+            handler.send_header("ETag", etag)
+            handler.send_header("Content-Length", str(len(body)))
+            handler.end_headers()
+            handler.wfile.write(body)
+        else:
+            handler.send_header("Content-Length", "0")
+            handler.end_headers()
+
+    def close(self) -> None:
+        self._server.shutdown()
+
+
+def timed(function: Callable[[], Any]) -> tuple[float, Any]:
+    started = time.perf_counter()
+    result = function()
+    return time.perf_counter() - started, result
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--latency-ms", type=float, default=40.0, help="server time per request")
+    parser.add_argument("--workers", type=int, default=scraper.WORKERS, help="concurrent requests of the new scraper")
+    parser.add_argument("--flaky", type=int, default=5, help="about one page in FLAKY fails once with a 503")
+    args = parser.parse_args()
+
+    with (ROOT / "client-data" / "events.json").open(encoding="utf-8") as fp:
+        events = json.load(fp)
+    wiki = StandInWiki(fixture_pages(events), args.latency_ms / 1000)
+    expected = expected_events(events)
+    saved_cache_dir = scraper.HTTP_CACHE_DIR
+    tmp = Path(tempfile.mkdtemp())
+    scraper.HTTP_CACHE_DIR = tmp / "http-cache"
+
+    def scrape(out: Path, *flags: str) -> list[dict]:
+        with contextlib.redirect_stdout(io.StringIO()):
+            scraper.main(["--base-url", wiki.base, "--workers", str(args.workers), "--out", str(out), *flags])
+        return json.loads(out.read_text(encoding="utf-8"))
+
+    print(f"🕸️  {len(events)} event pages, {args.latency_ms:g} ms per request, {args.workers} workers")
+    print("─" * 72)
+    print(f"{'scraper':28s} {'time':>8s} {'200':>5s} {'304':>5s} {'503':>5s} {'sent':>9s} {'identical':>10s}")
+    try:
+        wiki.reset()
+        seconds, reference = timed(lambda: legacy_scrape(wiki.base))
+        runs = [("serial requests.get (before)", seconds, dict(wiki.requests), wiki.bytes_sent, reference)]
+        for name, flaky, flags in (
+            ("CachedFetcher, cold cache", 0, ()),
+            ("CachedFetcher, warm cache", 0, ()),
+            ("CachedFetcher, flaky server", args.flaky, ("--no-cache",)),
+        ):
+            wiki.reset(flaky)
+            seconds, output = timed(lambda: scrape(tmp / "events.json", *flags))
+            runs.append((name, seconds, dict(wiki.requests), wiki.bytes_sent, output))
+
+        for name, seconds, answered, sent, output in runs:
+            print(
+                f"{name:28s} {seconds:6.2f} s {answered.get('200', 0):5d} {answered.get('304', 0):5d} "
+                f"{answered.get('503', 0):5d} {sent / 1024:6.0f} KB {str(output == reference):>10s}"
+            )
+        print(f"\nreference matches the fixtures: {reference == expected}")
+    finally:
+        scraper.HTTP_CACHE_DIR = saved_cache_dir
+        wiki.close()
+        shutil.rmtree(tmp, ignore_errors=True)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
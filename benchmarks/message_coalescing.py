@@ -0,0 +1,153 @@
+"""Message coalescing benchmark.
+
+Simulates fast hovering: ``--producers`` threads (the OCR workers) each
+submit a message ``--rate`` times per second for ``--duration`` seconds,
+drawn from ``--distinct`` different entities, while the UI thread spends
+``--ui-cost-ms`` on every overlay update that changes the text.  Reports,
+for queued signals straight into the overlay (the old path) and for
+:class:`text_extractor_worker.MessageCoalescer`:
+
+* overlay updates run on the UI thread,
+* the largest number of messages waiting in the UI event queue,
+* how long the UI thread kept working after the last message was sent,
+  and whether it ended up showing that last message.
+
+    python -m benchmarks.message_coalescing [--producers 2] [--rate 200] [--ui-cost-ms 8]
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import random
+import sys
+import threading
+import time
+
+from PyQt6.QtCore import QCoreApplication, QObject, pyqtSignal, pyqtSlot
+
+from text_extractor_worker import MessageCoalescer
+
+
+class FakeOverlay(QObject):
+    """Costs ``cost_s`` of UI-thread time per changed message, like :py:meth:`overlay.Overlay.set_message`."""
+
+    def __init__(self, cost_s: float):
+        super().__init__()
+        self._cost_s = cost_s
+        self.text = ""
+        self.received = 0
+        self.updates = 0
+
+    @pyqtSlot(str)
+    def set_message(self, text: str) -> None:
+        self.received += 1
+        if text == self.text:
+            return
+        self.text = text
+        self.updates += 1
+        time.sleep(self._cost_s)
+
+
+class DirectSender(QObject):
+    """The old path: every result crosses to the UI thread as a queued signal."""
+
+    message_ready = pyqtSignal(str)
+
+    def __init__(self):
+        super().__init__()
+        self.sent = 0
+        self._lock = threading.Lock()
+
+    def submit(self, _sequence: int, message: str) -> bool:
+        with self._lock:
+            self.sent += 1
+        self.message_ready.emit(message)
+        return True
+
+
+def run(app: QCoreApplication, sink, overlay: FakeOverlay, args: argparse.Namespace) -> dict[str, float]:
+    messages = [f"entity {index}" for index in range(args.distinct)]
+    sequence = iter(range(1, sys.maxsize))
+    sequence_lock = threading.Lock()
+    last_sent: list[str] = []
+
+    def produce(seed: int) -> None:
+        rng = random.Random(seed)
+        deadline = time.perf_counter() + args.duration
+        while time.perf_counter() < deadline:
+            message = rng.choice(messages)
+            with sequence_lock:
+                # numbered and submitted together, so the last one sent is the newest frame
+                sink.submit(next(sequence), message)
+                last_sent[:] = [message]
+            time.sleep(1 / args.rate)
+
+    producers = [threading.Thread(target=produce, args=(seed,)) for seed in range(args.producers)]
+    for producer in producers:
+        producer.start()
+
+    submitted = lambda: sink.sent if isinstance(sink, DirectSender) else sink.submitted  # noqa: E731
+    backlog = 0
+    while any(producer.is_alive() for producer in producers):
+        app.processEvents()
+        if isinstance(sink, DirectSender):
+            backlog = max(backlog, submitted() - overlay.received)
+        time.sleep(0.001)
+    stopped = time.perf_counter()
+    # the UI thread is done once nothing is queued any more and the newest message is showing
+    while time.perf_counter() - stopped < 30:
+        if overlay.text == last_sent[0] and (not isinstance(sink, DirectSender) or overlay.received >= submitted()):
+            break
+        app.processEvents()
+        time.sleep(0.0005)
+    return {
+        "submitted": submitted(),
+        "updates": overlay.updates,
+        "max_queued": backlog if isinstance(sink, DirectSender) else 1,  # one wake-up at most, by construction
+        "drain_ms": (time.perf_counter() - stopped) * 1000,
+        "latest_shown": overlay.text == last_sent[0],
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--producers", type=int, default=2, help="threads submitting results")
+    parser.add_argument("--rate", type=float, default=200, help="results per second per thread")
+    parser.add_argument("--duration", type=float, default=2.0, help="seconds of hovering")
+    parser.add_argument("--distinct", type=int, default=30, help="distinct messages hovered")
+    parser.add_argument("--ui-cost-ms", type=float, default=8.0, help="UI-thread cost of one overlay update")
+    parser.add_argument("--refresh-hz", type=float, default=60.0, help="display refresh rate")
+    args = parser.parse_args()
+
+    logger = logging.getLogger("message-coalescing-benchmark")
+    logger.addHandler(logging.NullHandler())
+    logger.propagate = False
+    app = QCoreApplication.instance() or QCoreApplication(sys.argv)
+
+    print(
+        f"💬 {args.producers} × {args.rate:g} results/s for {args.duration:g} s, "
+        f"{args.ui_cost_ms:g} ms per overlay update, {args.refresh_hz:g} Hz"
+    )
+    print("─" * 72)
+    print(f"{'path':12s} {'submitted':>10s} {'updates':>8s} {'max queued':>11s} {'drain':>10s} {'latest shown':>13s}")
+
+    for name in ("queued", "coalesced"):
+        overlay = FakeOverlay(args.ui_cost_ms / 1000)
+        if name == "queued":
+            sink = DirectSender()
+        else:
+            sink = MessageCoalescer(logger, min_interval_s=1 / args.refresh_hz)
+        sink.message_ready.connect(overlay.set_message)
+        result = run(app, sink, overlay, args)
+        print(
+            f"{name:12s} {result['submitted']:10.0f} {result['updates']:8.0f} {result['max_queued']:11.0f} "
+            f"{result['drain_ms']:7.0f} ms {str(result['latest_shown']):>13s}"
+        )
+        if isinstance(sink, MessageCoalescer):
+            print(f"{'':12s} {sink.stats()}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
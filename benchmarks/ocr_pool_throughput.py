@@ -0,0 +1,147 @@
+"""OCR pool throughput benchmark.
+
+Replays a recorded session (see ``session_recorder.py``) through pools of
+1, 2, 4… text extractor workers sharing one
+:class:`capture_worker.SharedCaptureSource`, and reports for each pool size:
+
+* frames OCR'd per second and the speed-up over a single worker,
+* results that reached the overlay,
+* results dropped by the :class:`~text_extractor_worker.MessageCoalescer`
+  because a newer frame was already submitted, or replaced before the next
+  display refresh,
+* captures skipped because the frame had not changed.
+
+Without ``--session`` the PNGs in ``ocr_tests/`` are recorded into a
+temporary session first.  ``--simulate-ocr-ms`` replaces Tesseract with a
+fixed sleep (which, like the Tesseract subprocess, releases the GIL), for
+machines without the bundled binaries; it measures the pool mechanics only.
+
+    python -m benchmarks.ocr_pool_throughput [--session PATH] [--sizes 1,2,4] [--frames 48]
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from PIL import Image
+from PyQt6.QtCore import QCoreApplication
+
+from capture_worker import ReplayCaptureWorker
+from configuration import Configuration
+from message_builder import MessageBuilder
+from text_extractor_worker import MessageCoalescer, TextExtractor, TextExtractorWorkerFactory
+from worker_framework import ThreadController
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+class SimulatedExtractor:
+    """Stands in for :class:`TextExtractor` when Tesseract is not available."""
+
+    def __init__(self, cost_ms: float):
+        self._cost_s = cost_ms / 1000
+
+    def extract_text(self, image: Image.Image, **_kwargs) -> str:
+        time.sleep(self._cost_s)
+        return ""
+
+
+def record_corpus(logger: logging.Logger, output_dir: Path, version: str) -> Path:
+    from session_recorder import SessionRecorder
+
+    images = sorted((ROOT / "ocr_tests").glob("*.png"))
+    recorder = SessionRecorder(logger, output_dir, version, max_pending=len(images))
+    recorder.start()
+    for path in images:
+        with Image.open(path) as image:
+            recorder.record(image.convert("RGB"), "", None)
+    recorder.stop()
+    return recorder.session_path  # type: ignore[return-value]
+
+
+def run_pool(
+    app: QCoreApplication,
+    logger: logging.Logger,
+    cfg: Configuration,
+    message_builder: MessageBuilder,
+    extractor,
+    session: Path,
+    size: int,
+    frames: int,
+) -> dict[str, float]:
+    factory = TextExtractorWorkerFactory(
+        cfg, message_builder, extractor, ReplayCaptureWorker(logger, session, loop=True, preload=True), logger
+    )
+    coalescer = MessageCoalescer(logger)
+    shown: list[str] = []
+    coalescer.message_ready.connect(shown.append)
+    workers = factory.create_pool("bench-extractor", size, coalescer)
+    for worker in workers:
+        worker.window_closed.connect(lambda: None)
+    controller = ThreadController(logger)
+    controller.add_pool("bench", workers)
+
+    started = time.perf_counter()
+    controller.start_pool("bench")
+    while sum(worker.frames_processed for worker in workers) < frames:
+        app.processEvents()
+        time.sleep(0.005)
+    elapsed = time.perf_counter() - started
+    processed = sum(worker.frames_processed for worker in workers)
+    controller.stop_pool("bench")
+    controller.cleanup()
+    coalescer.close()
+
+    source = workers[0]._frame_source
+    return {
+        "frames_per_s": processed / elapsed,
+        "shown": len(shown),
+        "stale": coalescer.stale,
+        "coalesced": coalescer.coalesced,
+        "skipped": source.skipped,
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--session", type=Path, help="recorded session to replay (default: ocr_tests/*.png)")
+    parser.add_argument("--sizes", default="1,2,4", help="comma-separated pool sizes")
+    parser.add_argument("--frames", type=int, default=48, help="frames to OCR per pool size")
+    parser.add_argument("--simulate-ocr-ms", type=float, help="replace Tesseract with a sleep of this length")
+    args = parser.parse_args()
+
+    logger = logging.getLogger("ocr-pool-benchmark")
+    logger.addHandler(logging.NullHandler())
+    logger.propagate = False
+
+    app = QCoreApplication.instance() or QCoreApplication(sys.argv)
+    cfg = Configuration()
+    message_builder = MessageBuilder(cfg, logger)
+    extractor = SimulatedExtractor(args.simulate_ocr_ms) if args.simulate_ocr_ms else TextExtractor(cfg, logger)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        session = args.session or record_corpus(logger, Path(tmp), cfg.current_version)
+        mode = f"simulated OCR ({args.simulate_ocr_ms:g} ms)" if args.simulate_ocr_ms else "Tesseract"
+        print(f"⚙️  {args.frames} frames per pool size from {session.name}, {mode}")
+        print("─" * 72)
+        print(
+            f"{'workers':>8s} {'frames/s':>10s} {'speed-up':>10s} {'shown':>8s} {'stale':>8s} {'coalesced':>10s} {'skipped':>9s}"
+        )
+        baseline = None
+        for size in (int(value) for value in args.sizes.split(",")):
+            result = run_pool(app, logger, cfg, message_builder, extractor, session, size, args.frames)
+            baseline = baseline or result["frames_per_s"]
+            print(
+                f"{size:8d} {result['frames_per_s']:10.2f} {result['frames_per_s'] / baseline:9.2f}x "
+                f"{result['shown']:8.0f} {result['stale']:8.0f} {result['coalesced']:10.0f} {result['skipped']:9.0f}"
+            )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
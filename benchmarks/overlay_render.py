@@ -0,0 +1,147 @@
+"""Overlay update benchmark.
+
+Measures the UI-thread time of one overlay update (set the text, lay it
+out, paint it) for the old ``QLabel`` rich-text path and for
+:class:`rich_text_view.RichTextView` with its document cache:
+
+* ``revisit`` – the user keeps hovering a working set of ``--working-set``
+  random entities (``--updates`` updates),
+* ``monster → items`` – a monster is shown, then each of its items; the
+  cached view lays the items out ahead of time while the UI is idle
+  (reported separately as idle time, since it never delays an update).
+
+    python -m benchmarks.overlay_render [--updates 400] [--working-set 20] [--offscreen]
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Callable
+
+ROOT = Path(__file__).resolve().parent.parent
+WIDTH, HEIGHT = 300, 400
+
+
+def percentile(values: list[float], fraction: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(int(len(ordered) * fraction), len(ordered) - 1)]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--updates", type=int, default=400, help="updates in the revisit scenario")
+    parser.add_argument("--working-set", type=int, default=20, help="distinct entities in the revisit scenario")
+    parser.add_argument("--offscreen", action="store_true", help="use Qt's offscreen platform (CI)")
+    args = parser.parse_args()
+    if args.offscreen:
+        os.environ["QT_QPA_PLATFORM"] = "offscreen"
+
+    from PyQt6.QtCore import Qt
+    from PyQt6.QtGui import QColor, QFont
+    from PyQt6.QtWidgets import QApplication, QFrame, QLabel, QScrollArea
+
+    from configuration import Configuration
+    from message_builder import MessageBuilder, load_catalogue
+    from rich_text_view import DocumentCache, RichTextView
+
+    app = QApplication.instance() or QApplication(sys.argv)
+    font = QFont("Helvetica", 12)
+    entities = [entity for entity in load_catalogue(ROOT / "entities.json") if entity.get("display_message")]
+
+    def host(widget) -> QScrollArea:
+        area = QScrollArea()
+        area.setFrameShape(QFrame.Shape.NoFrame)
+        area.setWidgetResizable(True)
+        area.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        area.setWidget(widget)
+        area.resize(WIDTH, HEIGHT)
+        area.show()
+        app.processEvents()
+        return area
+
+    def label_view() -> tuple[QScrollArea, Callable[[str], None]]:
+        # the overlay before the document cache
+        label = QLabel("")
+        label.setWordWrap(True)
+        label.setAlignment(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignTop)
+        label.setFont(font)
+        label.setStyleSheet("color:white;background:transparent;")
+
+        def set_text(text: str) -> None:
+            label.setTextFormat(Qt.TextFormat.RichText)
+            label.setText(text)
+
+        return host(label), set_text
+
+    def cached_view(cache: DocumentCache) -> tuple[QScrollArea, Callable[[str], None]]:
+        view = RichTextView("", cache, QColor("white"))
+        return host(view), view.setText
+
+    def update_ms(area: QScrollArea, set_text: Callable[[str], None], text: str) -> float:
+        started = time.perf_counter()
+        set_text(text)
+        app.sendPostedEvents()
+        area.repaint()
+        return (time.perf_counter() - started) * 1000
+
+    rng = random.Random(0)
+    working_set = [entity["display_message"] for entity in rng.sample(entities, args.working_set)]
+    sequence = [rng.choice(working_set) for _ in range(args.updates)]
+
+    print(f"🖼️  {args.updates} updates over {args.working_set} entities, {WIDTH}×{HEIGHT} px")
+    print("─" * 72)
+    print(f"{'scenario':34s} {'median':>10s} {'p95':>10s} {'total':>12s}")
+
+    def report(name: str, timings: list[float], extra: str = "") -> None:
+        print(
+            f"{name:34s} {statistics.median(timings):7.2f} ms {percentile(timings, 0.95):7.2f} ms "
+            f"{sum(timings):9.1f} ms{extra}"
+        )
+
+    area, set_text = label_view()
+    report("revisit: QLabel", [update_ms(area, set_text, text) for text in sequence])
+    cache = DocumentCache(font)
+    area, set_text = cached_view(cache)
+    report("revisit: cached documents", [update_ms(area, set_text, text) for text in sequence], f"  {cache.stats()}")
+
+    builder = MessageBuilder(Configuration(), _quiet_logger())
+    monsters = [entity["display_message"] for entity in entities if entity["type"] == "monster"]
+    tours = [[monster, *builder.related_messages(monster)] for monster in monsters]
+
+    area, set_text = label_view()
+    report("monster → items: QLabel", [update_ms(area, set_text, text) for tour in tours for text in tour])
+
+    cache = DocumentCache(font, capacity=16)
+    area, set_text = cached_view(cache)
+    view: RichTextView = area.widget()  # type: ignore[assignment]
+    timings, idle_ms = [], 0.0
+    for tour in tours:
+        for index, text in enumerate(tour):
+            timings.append(update_ms(area, set_text, text))
+            if index == 0:
+                # what Overlay does between updates while the event loop is idle
+                started = time.perf_counter()
+                for related in tour[1:]:
+                    cache.prewarm(related, view.text_width())
+                idle_ms += (time.perf_counter() - started) * 1000
+    report("monster → items: cached + prewarm", timings, f"  (+{idle_ms:.0f} ms idle)")
+    return 0
+
+
+def _quiet_logger():
+    import logging
+
+    logger = logging.getLogger("overlay-render-benchmark")
+    logger.addHandler(logging.NullHandler())
+    logger.propagate = False
+    return logger
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,141 @@
+"""Cold-start benchmark for the Bazaar Buddy client.
+
+Launches ``main.py`` in a fresh interpreter several times with
+``-X importtime`` and ``BAZAAR_BUDDY_STARTUP_BENCHMARK=1`` (which makes the
+client print its startup timings and quit as soon as the overlay has been
+painted), then reports:
+
+* wall time from process spawn until the overlay was painted,
+* in-process time to build the container and to first overlay paint,
+* cumulative import time of the heaviest top-level modules.
+
+The medians are compared against ``benchmarks/startup_baseline.json``; the
+run fails if any tracked number regressed by more than ``--tolerance``.
+
+    python -m benchmarks.startup [--runs 5] [--offscreen] [--update-baseline]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from collections import defaultdict
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+BASELINE_PATH = Path(__file__).resolve().parent / "startup_baseline.json"
+MARKER = "BAZAAR_BUDDY_STARTUP "
+TRACKED = ("wall_s", "container_s", "first_overlay_s")
+
+
+def parse_importtime(stderr: str) -> dict[str, float]:
+    """Return ``{module: cumulative seconds}`` from ``-X importtime`` output.
+
+    Cumulative times include nested imports, so parents and children both
+    appear; the ranking shows where along the import tree the time goes.
+    """
+    modules: dict[str, float] = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        try:
+            _, cumulative, name = line[len("import time:") :].split("|")
+        except ValueError:
+            continue
+        modules[name.strip()] = int(cumulative) / 1_000_000
+    return modules
+
+
+def run_once(offscreen: bool) -> tuple[dict[str, float], dict[str, float]]:
+    env = dict(os.environ, BAZAAR_BUDDY_STARTUP_BENCHMARK="1")
+    if offscreen:
+        env["QT_QPA_PLATFORM"] = "offscreen"
+
+    started = time.perf_counter()
+    proc = subprocess.Popen(
+        [sys.executable, "-X", "importtime", str(ROOT / "main.py")],
+        cwd=ROOT,
+        env=env,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=True,
+    )
+
+    timings: dict[str, float] | None = None
+    assert proc.stdout is not None
+    for line in proc.stdout:
+        if line.startswith(MARKER):
+            timings = json.loads(line[len(MARKER) :])
+            timings["wall_s"] = round(time.perf_counter() - started, 4)
+            break
+
+    _, stderr = proc.communicate(timeout=120)
+    if timings is None:
+        raise RuntimeError(f"client exited with {proc.returncode} before painting the overlay:\n{stderr[-2000:]}")
+    return timings, parse_importtime(stderr)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=5, help="number of cold starts to measure")
+    parser.add_argument("--top", type=int, default=15, help="number of modules to list")
+    parser.add_argument("--tolerance", type=float, default=0.20, help="allowed regression as a fraction")
+    parser.add_argument("--baseline", type=Path, default=BASELINE_PATH)
+    parser.add_argument("--update-baseline", action="store_true", help="store this run as the new baseline")
+    parser.add_argument("--offscreen", action="store_true", help="use Qt's offscreen platform (CI)")
+    args = parser.parse_args()
+
+    runs: list[dict[str, float]] = []
+    imports: dict[str, list[float]] = defaultdict(list)
+    for run in range(1, args.runs + 1):
+        timings, modules = run_once(args.offscreen)
+        runs.append(timings)
+        for name, seconds in modules.items():
+            imports[name].append(seconds)
+        print(f"▶️  Run {run}/{args.runs}: " + "  ".join(f"{k}={timings[k]:.3f}" for k in TRACKED))
+
+    result = {key: round(statistics.median(run[key] for run in runs), 4) for key in TRACKED}
+    import_medians = {name: statistics.median(values) for name, values in imports.items()}
+
+    print("\n📦 Heaviest imports (median cumulative):")
+    print("─" * 72)
+    for name, seconds in sorted(import_medians.items(), key=lambda item: -item[1])[: args.top]:
+        print(f"{name:50s} {seconds * 1000:8.1f} ms")
+
+    print("\n⏱️  Startup (median of", args.runs, "runs):")
+    print("─" * 72)
+    for key in TRACKED:
+        print(f"{key:20s} {result[key]:.3f} s")
+
+    if args.update_baseline:
+        args.baseline.write_text(json.dumps(result, indent=2) + "\n", encoding="utf-8")
+        print(f"\n✅ Baseline written to {args.baseline}")
+        return 0
+
+    if not args.baseline.exists():
+        print(f"\n⚠️  No baseline at {args.baseline}; run with --update-baseline to create one")
+        return 0
+
+    baseline = json.loads(args.baseline.read_text(encoding="utf-8"))
+    regressions = [
+        f"{key}: {result[key]:.3f} s vs baseline {baseline[key]:.3f} s"
+        for key in TRACKED
+        if key in baseline and result[key] > baseline[key] * (1 + args.tolerance)
+    ]
+    if regressions:
+        print(f"\n❌ Startup regressed by more than {args.tolerance:.0%}:")
+        for line in regressions:
+            print("   " + line)
+        return 1
+
+    print(f"\n✅ Within {args.tolerance:.0%} of baseline")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,4 +1,9 @@
 from typing import Optional
+from pathlib import Path
+from dataclasses import dataclass
+import hashlib
+import io
+import time
 from PIL import Image
 import threading
 from abc import ABC, abstractmethod
@@ -150,17 +155,19 @@ class MacCaptureWorker(BaseCaptureWorker):
 
     def capture_image_sync(self, timeout: float = 2.5) -> Image.Image | None:
         with self._capture_lock:
-            self._logger.info(f"[{threading.current_thread().name}] Acquiring capture lock")
+            self._logger.debug("[%s] Acquiring capture lock", threading.current_thread().name)
 
             try:
                 self._target_window_id = self._find_target_window()
                 if not self._target_window_id:
                     self._logger.info(
-                        f"[{threading.current_thread().name}] Could not find window for identifier: {self.window_identifier}"
+                        "[%s] Could not find window for identifier: %s",
+                        threading.current_thread().name,
+                        self.window_identifier,
                     )
                     raise FailedToFindWindowError()
 
-                self._logger.info(f"[{threading.current_thread().name}] Starting capture")
+                self._logger.debug("[%s] Starting capture", threading.current_thread().name)
                 return self._capture_frame()
 
             except Exception as exc:
@@ -171,3 +178,112 @@ class MacCaptureWorker(BaseCaptureWorker):
                     raise FailedToFindWindowError()
                 self._logger.error(f"[{threading.current_thread().name}] Capture failed: {exc}")
                 raise exc
+
+
+class ReplayCaptureWorker(BaseCaptureWorker):
+    """Serves the frames of a recorded session instead of a live window.
+
+    Used for regression and benchmark replay.  Once the session is exhausted
+    it either starts over (``loop=True``) or behaves as if the game window had
+    been closed.  ``preload=True`` decodes every frame up front, so capturing
+    costs no more than with a live backend (which hands over decoded frames).
+    """
+
+    def __init__(
+        self,
+        logger: Logger,
+        session_path: Path | str,
+        *,
+        loop: bool = False,
+        preload: bool = False,
+    ):
+        super().__init__(logger)
+        from session_recorder import SessionReader
+
+        with SessionReader(session_path) as reader:
+            self._frames = [frame.png for frame in reader.records(with_frames_only=True)]
+        self._decoded = [Image.open(io.BytesIO(png)).convert("RGB") for png in self._frames] if preload else None
+        self._loop = loop
+        self._position = 0
+        self._logger.info(
+            "[%s] Replaying %d frames from %s", threading.current_thread().name, len(self._frames), session_path
+        )
+
+    def capture_image_sync(self, timeout: float = 2.5) -> Image.Image | None:
+        with self._capture_lock:
+            if self._position >= len(self._frames):
+                if not self._loop or not self._frames:
+                    raise FailedToFindWindowError()
+                self._position = 0
+            position = self._position
+            self._position += 1
+        if self._decoded is not None:
+            return self._decoded[position]
+        return Image.open(io.BytesIO(self._frames[position]))
+
+
+@dataclass(frozen=True)
+class CapturedFrame:
+    """A captured image and its position in capture order."""
+
+    sequence: int
+    image: Image.Image
+
+
+class SharedCaptureSource:
+    """Hands the frames of one capture worker to a pool of OCR workers.
+
+    Captures are serialised and every frame gets an increasing sequence
+    number, so results can be ordered however long each OCR took.  A frame
+    identical to the previous one is not handed out again (the Windows
+    backend returns the last frame until a new one arrives), so the pool
+    never OCRs the same screen twice.  Once the window is gone every caller
+    gets :class:`FailedToFindWindowError` without touching the backend.
+    """
+
+    def __init__(self, capture_worker: BaseCaptureWorker, *, idle_s: float = 0.05):
+        self._capture_worker = capture_worker
+        self._idle_s = idle_s
+        self._lock = threading.Lock()
+        self._sequence = 0
+        self._last_image: Image.Image | None = None
+        self._last_digest: bytes | None = None
+        self._window_closed = False
+
+        self.captured = 0
+        self.skipped = 0
+
+    def next_frame(self, timeout: float = 1.0) -> CapturedFrame | None:
+        """Next frame that differs from the last one handed out, or ``None`` after ``timeout``."""
+        deadline = time.monotonic() + timeout
+        while True:
+            with self._lock:
+                frame = self._capture_changed()
+            if frame is not None or time.monotonic() >= deadline:
+                return frame
+            time.sleep(self._idle_s)
+
+    def _capture_changed(self) -> CapturedFrame | None:
+        if self._window_closed:
+            raise FailedToFindWindowError()
+        try:
+            image = self._capture_worker.capture_image_sync()
+        except FailedToFindWindowError:
+            self._window_closed = True
+            raise
+        if image is None:
+            return None
+
+        self.captured += 1
+        if image is self._last_image:
+            self.skipped += 1
+            return None
+        self._last_image = image
+        digest = hashlib.blake2b(image.tobytes(), digest_size=16).digest()
+        if digest == self._last_digest:
+            self.skipped += 1
+            return None
+        self._last_digest = digest
+
+        self._sequence += 1
+        return CapturedFrame(self._sequence, image)
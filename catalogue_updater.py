@@ -0,0 +1,302 @@
+"""
+Catalogue Updater
+=================
+
+Hot updates of the entity catalogue (``entities.json``) without a full app
+update.
+
+The catalogue build publishes a small manifest and an xz-compressed bundle
+(see ``client-data/catalogue_bundle.py``).  In the background the client
+revalidates the manifest with a conditional request, downloads the bundle
+only when its digest differs from the catalogue in use, verifies it and
+stores it in the app data directory.  :class:`CatalogueStore` decides which
+copy is active: the downloaded one if it is intact and was installed by this
+client version, the bundled one otherwise.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import lzma
+import os
+import threading
+import time
+from datetime import datetime
+from logging import Logger
+from pathlib import Path
+from typing import Callable, Optional
+from urllib.parse import urljoin
+
+import requests
+from PyQt6.QtCore import Qt, pyqtSignal
+
+from file_writer import BaseFileWriter, CatalogueData
+from worker_framework import ThreadController, Worker
+
+FORMAT_VERSION = 2  # entities.json with interned fragments; older clients skip it
+ENTITIES_FILENAME = "entities.json"
+
+
+class CatalogueError(Exception):
+    """A published catalogue could not be downloaded or failed verification."""
+
+
+def _sha256(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+class CatalogueStore:
+    """The downloaded catalogue and its state file in the app data directory.
+
+    Parameters
+    ----------
+    state_writer
+        Writer for :class:`~file_writer.CatalogueData`; the catalogue itself
+        is stored next to the state file.
+    bundled_path
+        ``entities.json`` shipped with this build.
+    client_version
+        Catalogues installed by another client version are ignored, as the
+        catalogue format may change with the code that reads it.
+    """
+
+    def __init__(self, state_writer: BaseFileWriter, bundled_path: Path, client_version: str):
+        self._state_writer = state_writer
+        self.bundled_path = bundled_path
+        self.client_version = client_version
+        self.entities_path = state_writer.file_path.parent / ENTITIES_FILENAME
+        self._bundled_sha256: Optional[str] = None
+
+    def state(self) -> CatalogueData:
+        state = self._state_writer.read()
+        return state if isinstance(state, CatalogueData) else CatalogueData()
+
+    @property
+    def bundled_sha256(self) -> str:
+        if self._bundled_sha256 is None:
+            self._bundled_sha256 = _sha256(self.bundled_path.read_bytes())
+        return self._bundled_sha256
+
+    def installed_sha256(self) -> Optional[str]:
+        """Digest of the downloaded catalogue if it is usable, else ``None``."""
+        state = self.state()
+        if not state.sha256 or state.client_version != self.client_version:
+            return None
+        try:
+            if _sha256(self.entities_path.read_bytes()) != state.sha256:
+                return None
+        except OSError:
+            return None
+        return state.sha256
+
+    def active_path(self) -> Path:
+        """Catalogue the :class:`~message_builder.MessageBuilder` should load."""
+        return self.entities_path if self.installed_sha256() else self.bundled_path
+
+    def active_sha256(self) -> str:
+        return self.installed_sha256() or self.bundled_sha256
+
+    def install(self, raw: bytes, manifest: dict, etag: Optional[str], last_modified: Optional[str]) -> Path:
+        """Atomically replace the downloaded catalogue with ``raw``."""
+        temp_path = self.entities_path.with_name(ENTITIES_FILENAME + ".tmp")
+        temp_path.write_bytes(raw)
+        os.replace(temp_path, self.entities_path)
+        now = datetime.now()
+        self._state_writer.write(
+            CatalogueData(
+                etag=etag,
+                last_modified=last_modified,
+                checked_at=now,
+                version=manifest.get("version"),
+                sha256=manifest["sha256"],
+                client_version=self.client_version,
+                installed_at=now,
+            )
+        )
+        return self.entities_path
+
+    def use_bundled(self, etag: Optional[str], last_modified: Optional[str]) -> Path:
+        """Forget the downloaded catalogue (the bundled one is current)."""
+        self.entities_path.unlink(missing_ok=True)
+        self._state_writer.write(CatalogueData(etag=etag, last_modified=last_modified, checked_at=datetime.now()))
+        return self.bundled_path
+
+    def mark_checked(self, etag: Optional[str], last_modified: Optional[str]) -> None:
+        state = self.state()
+        state.etag, state.last_modified, state.checked_at = etag, last_modified, datetime.now()
+        self._state_writer.write(state)
+
+
+class CatalogueUpdateWorker(Worker):
+    """Revalidates the published manifest and installs a newer catalogue.
+
+    Signals:
+        catalogue_updated: Emitted with the path of the catalogue to load
+    """
+
+    catalogue_updated = pyqtSignal(str)
+
+    def __init__(
+        self,
+        logger: Logger,
+        store: CatalogueStore,
+        manifest_url: str,
+        name: str = "catalogue-update-worker",
+    ):
+        super().__init__(logger, name)
+        self._store = store
+        self._manifest_url = manifest_url
+
+    def _run(self):
+        try:
+            path = self.check()
+        except (CatalogueError, requests.RequestException, OSError, ValueError) as exc:
+            self._logger.warning(f"[{self._thread_name()}] Catalogue update failed: {exc}")
+        else:
+            if path is not None and not self.is_stopping:
+                self.catalogue_updated.emit(str(path))
+        self.finished.emit()
+
+    def check(self) -> Optional[Path]:
+        """Return the path of a newly activated catalogue, or ``None`` if unchanged."""
+        thread_name = self._thread_name()
+        state = self._store.state()
+
+        headers = {}
+        if state.etag:
+            headers["If-None-Match"] = state.etag
+        if state.last_modified:
+            headers["If-Modified-Since"] = state.last_modified
+
+        response = requests.get(self._manifest_url, headers=headers, timeout=(5, 30))
+        if response.status_code == 304:
+            self._logger.info(f"[{thread_name}] Catalogue unchanged since last check")
+            return None
+        response.raise_for_status()
+
+        manifest = response.json()
+        etag, last_modified = response.headers.get("ETag"), response.headers.get("Last-Modified")
+        if manifest.get("format") != FORMAT_VERSION:
+            self._logger.info(f"[{thread_name}] Catalogue format {manifest.get('format')!r} not supported, skipping")
+            self._store.mark_checked(etag, last_modified)
+            return None
+
+        if manifest["sha256"] == self._store.active_sha256():
+            self._logger.info(f"[{thread_name}] Catalogue {manifest.get('version')} already in use")
+            self._store.mark_checked(etag, last_modified)
+            return None
+
+        if manifest["sha256"] == self._store.bundled_sha256:
+            self._logger.info(f"[{thread_name}] Published catalogue matches the bundled one")
+            return self._store.use_bundled(etag, last_modified)
+
+        started = time.perf_counter()
+        raw = self._download(manifest)
+        path = self._store.install(raw, manifest, etag, last_modified)
+        self._logger.info(
+            f"[{thread_name}] Catalogue {manifest.get('version')} installed: "
+            f"{manifest.get('bundle_size')} bytes downloaded in {time.perf_counter() - started:.2f}s"
+        )
+        return path
+
+    def _download(self, manifest: dict) -> bytes:
+        bundle_url = urljoin(self._manifest_url, manifest["bundle"])
+        response = requests.get(bundle_url, timeout=(5, 60))
+        response.raise_for_status()
+        bundle = response.content
+        if _sha256(bundle) != manifest["bundle_sha256"]:
+            raise CatalogueError(f"Bundle digest mismatch for {bundle_url}")
+
+        # never inflate past the advertised size
+        decompressor = lzma.LZMADecompressor()
+        try:
+            raw = decompressor.decompress(bundle, max_length=manifest["size"] + 1)
+        except lzma.LZMAError as exc:
+            raise CatalogueError(f"Corrupt catalogue bundle: {exc}") from exc
+        if len(raw) != manifest["size"] or _sha256(raw) != manifest["sha256"]:
+            raise CatalogueError("Catalogue digest mismatch after decompression")
+        catalogue = json.loads(raw)
+        if not isinstance(catalogue, list) and not (
+            isinstance(catalogue, dict)
+            and isinstance(catalogue.get("entities"), list)
+            and isinstance(catalogue.get("fragments"), list)
+        ):
+            raise CatalogueError("Catalogue must contain a list of entities or fragments and entities")
+        return raw
+
+
+class CatalogueUpdater:
+    """Starts :class:`CatalogueUpdateWorker` runs and applies their result.
+
+    ``on_updated`` is called on the worker's thread, so the new catalogue
+    is parsed off the UI thread (see :py:meth:`MessageBuilder.reload`).
+    """
+
+    def __init__(
+        self,
+        logger: Logger,
+        thread_controller: ThreadController,
+        store: CatalogueStore,
+        manifest_url: str,
+        on_updated: Callable[[Path], None],
+    ):
+        self.logger = logger
+        self.thread_controller = thread_controller
+        self.store = store
+        self.manifest_url = manifest_url
+        self._on_updated = on_updated
+        self.thread_name = threading.current_thread().name
+
+    def check_for_update(self) -> None:
+        worker = CatalogueUpdateWorker(self.logger, self.store, self.manifest_url)
+        if worker.name in self.thread_controller.workers:
+            self.logger.info(f"[{self.thread_name}] Catalogue check already running")
+            return
+        worker.catalogue_updated.connect(self._apply, Qt.ConnectionType.DirectConnection)
+        self.thread_controller.add_worker(worker)
+        self.thread_controller.start_worker(worker.name)
+
+    def _apply(self, path: str) -> None:
+        started = time.perf_counter()
+        self._on_updated(Path(path))
+        self.logger.info(
+            f"[{threading.current_thread().name}] Catalogue {path} applied in "
+            f"{(time.perf_counter() - started) * 1000:.0f} ms"
+        )
+
+
+# --------------------------------------------------------------------- #
+# Quick self‑test — run `python catalogue_updater.py` to install a bundle
+# from a local stand-in for the release server.
+# --------------------------------------------------------------------- #
+if __name__ == "__main__":  # pragma: no cover
+    import sys
+    import tempfile
+    from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+    from functools import partial
+
+    from logger import logger
+    from file_writer import WindowsFileWriter
+
+    sys.path.insert(0, str(Path(__file__).parent / "client-data"))
+    from catalogue_bundle import MANIFEST_NAME, build_bundle
+
+    root = Path(tempfile.mkdtemp())
+    bundled = Path(__file__).parent / ENTITIES_FILENAME
+    published = root / "published.json"
+    catalogue = json.loads(bundled.read_text(encoding="utf-8"))
+    catalogue["fragments"].append("<b>Hot Fixed Item</b>")
+    catalogue["entities"].append({"name": "Hot Fixed Item", "type": "item", "message": [len(catalogue["fragments"]) - 1]})
+    published.write_text(json.dumps(catalogue, indent=2, ensure_ascii=False), encoding="utf-8")
+    build_bundle(published, root / "server")
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), partial(SimpleHTTPRequestHandler, directory=str(root / "server")))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    store = CatalogueStore(WindowsFileWriter(root / "app" / "catalogue.json", CatalogueData), bundled, "v0.0.0")
+    worker = CatalogueUpdateWorker(logger, store, f"http://127.0.0.1:{server.server_port}/{MANIFEST_NAME}")
+    print("installed:", worker.check())
+    print("second check:", worker.check())
+    print("active:", store.active_path())
+    server.shutdown()
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+catalogue_bundle.py
+
+• Reads:  entities.json
+• Writes: dist/catalogue/catalogue.json.xz
+          dist/catalogue/catalogue-manifest.json
+
+The bundle is the exact bytes of entities.json, xz-compressed.  The
+manifest is what clients poll; they only download the bundle when its
+``sha256`` differs from the catalogue they already have:
+
+{
+  "format": 2,
+  "version": "<first 12 hex digits of sha256>",
+  "generated_at": "<ISO timestamp>",
+  "bundle": "catalogue.json.xz",
+  "bundle_size": <bytes>,
+  "bundle_sha256": "<sha256 of the .xz>",
+  "size": <bytes>,
+  "sha256": "<sha256 of entities.json>"
+}
+
+Both files are published to the `catalogue` release by the
+publish-catalogue workflow.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import lzma
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict
+
+FORMAT_VERSION = 2  # entities.json with interned fragments, see entity_processor.py
+BUNDLE_NAME = "catalogue.json.xz"
+MANIFEST_NAME = "catalogue-manifest.json"
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+ENTITY_PATH = ROOT_DIR / "entities.json"
+BUNDLE_OUT_DIR = ROOT_DIR / "dist" / "catalogue"
+
+
+def is_catalogue(data: Any) -> bool:
+    """A list of entities, or ``{"fragments": [...], "entities": [...]}``."""
+    if isinstance(data, list):
+        return True
+    return isinstance(data, dict) and isinstance(data.get("entities"), list) and isinstance(data.get("fragments"), list)
+
+
+def build_bundle(entities_path: Path = ENTITY_PATH, out_dir: Path = BUNDLE_OUT_DIR) -> Dict[str, Any]:
+    """Compress *entities_path* into *out_dir* and write its manifest."""
+    raw = entities_path.read_bytes()
+    # the client refuses anything that is not a catalogue
+    if not is_catalogue(json.loads(raw)):
+        raise ValueError(f"{entities_path} must contain a catalogue (or a list of entities)")
+
+    bundle = lzma.compress(raw, preset=9 | lzma.PRESET_EXTREME)
+    digest = hashlib.sha256(raw).hexdigest()
+    manifest = {
+        "format": FORMAT_VERSION,
+        "version": digest[:12],
+        "generated_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "bundle": BUNDLE_NAME,
+        "bundle_size": len(bundle),
+        "bundle_sha256": hashlib.sha256(bundle).hexdigest(),
+        "size": len(raw),
+        "sha256": digest,
+    }
+
+    out_dir.mkdir(parents=True, exist_ok=True)
+    (out_dir / BUNDLE_NAME).write_bytes(bundle)
+    with (out_dir / MANIFEST_NAME).open("w", encoding="utf-8") as fp:
+        json.dump(manifest, fp, indent=2)
+    return manifest
+
+
+if __name__ == "__main__":
+    manifest = build_bundle()
+    print(
+        f"✔ catalogue {manifest['version']}: {manifest['size']} bytes → "
+        f"{manifest['bundle_size']} bytes ({manifest['bundle_size'] / manifest['size']:.1%})"
+    )
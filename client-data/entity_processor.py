@@ -4,43 +4,72 @@ build_entities.py
 
 • Reads:  events.json, items.json, monsters.json
 • Writes: entities.json
+          dist/catalogue/  (hot-update bundle, see catalogue_bundle.py)
           tools/tesseract/tessdata/eng.bazaar_terms
           tools/tesseract/tessdata/configs/bazaar_terms
 
-The output schema for entities.json is:
+The build is incremental: every source record is hashed, entities whose
+record (and this script, and decorate.json) did not change come from
+.build-cache/, the rest are built across a process pool, and each output is
+only rewritten when its content changes.  `--no-cache` rebuilds everything.
+
+items.json and monsters.json are streamed (see json_stream.py): records are
+parsed, transformed and built one at a time, so the sources are never held
+in memory as a whole.
+
+The output schema for entities.json (catalogue format 2) is:
+
+{
+  "format": 2,
+  "fragments": ["<line of a pre-formatted message>", ...],
+  "entities": [
+    {
+      "name": "<entity-name>",
+      "type": "event" | "item" | "monster",
+      "message": [<fragment index>, ...],   # ← absent for entities not displayed
+      "alt_text": "<alt text>"              # ← only present for monsters that have it
+    },
+    ...
+  ]
+}
 
-[
-  {
-    "name": "<entity-name>",
-    "type": "event" | "item" | "monster",
-    "display_message": null | "<pre-formatted message>",
-    "alt_text": "<alt text>"              # ← only present for monsters that have it
-  },
-  ...
-]
+A message is its fragments joined with "<br>".  Monsters repeat their
+items' lines, so each distinct line is stored once; identical entities
+(the same monster met on several days) are stored once too.
 """
 
 from __future__ import annotations
 
+import argparse
+import hashlib
 import json
+import os
+import time
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from itertools import chain
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Deque, Dict, Iterable, Iterator, List, Optional, Tuple
 import re
 
-_CLEANUP_REGEXES: list[tuple[str, str]] = [
-    (r" \.", "."),   # " ." → "."
-    (r" \)", ")"),   # " )" → ")"
-    (r"\( ", "("),   # "( " → "("
-    (r"\+ ", "+"),   # "+ " → "+"
-    (r" :", ":"),    # " :" → ":"
-    (r" %", "%"),    # " %" → "%"
+from catalogue_bundle import MANIFEST_NAME, build_bundle
+from json_stream import iter_json
+
+# literal fixes, applied in order (str.replace is what re.sub did for these)
+_CLEANUP_REPLACEMENTS: list[tuple[str, str]] = [
+    (" .", "."),
+    (" )", ")"),
+    ("( ", "("),
+    ("+ ", "+"),
+    (" :", ":"),
+    (" %", "%"),
 ]
 
 
 def cleanup_display_message(text: str) -> str:
     """Apply small whitespace/mark-up fixes required by OCR output."""
-    for pattern, replacement in _CLEANUP_REGEXES:
-        text = re.sub(pattern, replacement, text)
+    for old, new in _CLEANUP_REPLACEMENTS:
+        text = text.replace(old, new)
     return text
 
 # --------------------------------------------------------------------------- #
@@ -134,6 +163,15 @@ WINDOWS_TERMS_PATH   = WINDOWS_TESSDATA_PATH / "eng.bazaar_terms"
 MAC_TERMS_PATH = MAC_TESSDATA_PATH / "eng.bazaar_terms"
 WINDOWS_CHAR_SET_PATH = WINDOWS_TESSDATA_PATH / "configs" / "bazaar_terms"
 MAC_CHAR_SET_PATH = MAC_TESSDATA_PATH / "configs" / "bazaar_terms"
+BUNDLE_DIR = ROOT_DIR / "dist" / "catalogue"
+
+BUILD_CACHE_PATH = CURRENT_DIR / ".build-cache" / "entities.json"
+PARALLEL_MIN_RECORDS = 64  # fewer records to build are not worth starting a process pool
+BATCH_SIZE = 32  # records sent to a build process at a time
+
+# where the records sit in the (streamed) source files
+ITEM_RECORDS = ("items", "*")
+MONSTER_RECORDS = ("monsterEncounterDays", "*", "groups", "*", "*")
 
 
 # --------------------------------------------------------------------------- #
@@ -160,25 +198,33 @@ def collect_item_tooltips(card: Dict[str, Any], enchantment: Optional[str]) -> L
                 break
     return tips
 
+TIER_ORDER = ['Bronze', 'Silver', 'Gold', 'Diamond', 'Legendary']
+TIER_COLORS = {
+    "Bronze": '#cd7f32',
+    "Silver": '#aaa',
+    "Gold": '#e4b60e',
+    "Diamond": '#02a3d8',
+    "Legendary": '#fa3'
+}
+
+_QUANTITY_WORDS = ["double", "triple", "quadruple"]
+# a number or a quantity word: the values that change from tier to tier
+_VALUE_RE = re.compile(
+    r'([-+]?\d+(?:\.\d+)?)|(' + '|'.join(re.escape(q) for q in _QUANTITY_WORDS) + r')',
+    re.IGNORECASE,
+)
+_WHITESPACE_RE = re.compile(r'\s+')
+_BOLD_SEGMENT_RE = re.compile(r'(<b>.*?</b>)', re.IGNORECASE | re.DOTALL)
+
+
 def build_decorated_tier_message(item: dict[str, Any]):
-    tier_order = ['Bronze', 'Silver', 'Gold', 'Diamond', 'Legendary']
-    tier_colors = {
-        "Bronze": '#cd7f32',
-        "Silver": '#aaa',
-        "Gold": '#e4b60e',
-        "Diamond": '#02a3d8',
-        "Legendary": '#fa3'
-    }
+    tier_order = TIER_ORDER
+    tier_colors = TIER_COLORS
 
     start_index = tier_order.index(item['startingTier'])
     active_tiers = tier_order[start_index:] if item['startingTier'] == "Legendary" else tier_order[start_index:4]
     tooltip_groups = {}
 
-    quantity_words = ["double", "triple", "quadruple"]
-    quantity_word_pattern = r'(' + '|'.join(re.escape(q) for q in quantity_words) + r')'
-    number_pattern = r'([-+]?\d+(?:\.\d+)?)'
-    value_pattern = f'{number_pattern}|{quantity_word_pattern}'
-
     for tier in active_tiers:
         tier_data = item['tiers'].get(tier, {})
         tooltips = tier_data.get('tooltips', [])
@@ -189,10 +235,10 @@ def build_decorated_tier_message(item: dict[str, Any]):
                 continue  # Skip empty or static tooltips
 
             # Replace number/word values with placeholder
-            standardized = re.sub(value_pattern, '{{val}}', tooltip, flags=re.IGNORECASE)
+            standardized = _VALUE_RE.sub('{{val}}', tooltip)
 
             # Extract values (either numbers or words)
-            raw_values = re.findall(value_pattern, tooltip, flags=re.IGNORECASE)
+            raw_values = _VALUE_RE.findall(tooltip)
             values = []
             for num, word in raw_values:
                 if num:
@@ -213,9 +259,9 @@ def build_decorated_tier_message(item: dict[str, Any]):
         if '{{val}}' not in group_key:
             for placeholder_key in tooltip_groups:
                 if '{{val}}' in placeholder_key:
-                    normalized_placeholder = re.sub(r'\{\{val\}\}', '', placeholder_key)
-                    normalized_placeholder = re.sub(r'\s+', ' ', normalized_placeholder).strip()
-                    current_group_normalized = re.sub(r'\s+', ' ', group_key).strip()
+                    normalized_placeholder = placeholder_key.replace('{{val}}', '')
+                    normalized_placeholder = _WHITESPACE_RE.sub(' ', normalized_placeholder).strip()
+                    current_group_normalized = _WHITESPACE_RE.sub(' ', group_key).strip()
                     if normalized_placeholder == current_group_normalized:
                         del tooltip_groups[group_key]
                         break
@@ -250,34 +296,84 @@ def build_decorated_tier_message(item: dict[str, Any]):
 
     return unified_tooltips
 
-def decorate_display_message(text: str, rules: list[dict]) -> str:
-    """Apply decorators so Rich Text can parse and add colour to certain keywords,
-    but leave anything wrapped in <b>…</b> (entity names) untouched."""
-    # Split into “keep-as-is” bold segments and everything else
-    segments = re.split(r'(<b>.*?</b>)', text, flags=re.IGNORECASE | re.DOTALL)
-
-    for i, seg in enumerate(segments):
-        # Skip bold segments – they contain the entity names
-        if seg.lower().startswith('<b>'):
-            continue
-
-        def _make_replacer(span: str):
-            def _replacer(m: re.Match[str]) -> str:
-                return span.format(word=m.group(0))
-            return _replacer
+class DecorationEngine:
+    """The rules of decorate.json, compiled once and applied in a single pass.
+
+    Every run of consecutive rules whose word starts and ends with a word
+    character becomes one alternation, longest word first, so a message is
+    scanned once for all of them rather than once per rule.  Such rules
+    match whole words only, so they never compete for the same text, and
+    the result is the one applying them one by one gave as long as no
+    rule's word occurs in what an earlier rule of its run inserts (its
+    markup, e.g. ``span`` or ``color``, or its word).  That condition is
+    checked here: a rule set breaking it raises :class:`ValueError`, and
+    the rule needs a pass of its own.  Any other rule (the
+    ``"\\n"`` → ``<br>`` rule) keeps a pass of its own, in rule order, since
+    it sees the neighbours the rules before it decorated.
+
+    Text wrapped in <b>…</b> (entity names) is left untouched.
+    """
 
+    def __init__(self, rules: list[dict]) -> None:
+        self._passes: list[tuple[re.Pattern[str], Callable[[re.Match[str]], str]]] = []
+        run: list[dict] = []
         for rule in rules:
-            pattern = rf"\b{re.escape(rule['word'])}\b"
-            seg = re.sub(
-                pattern,
-                _make_replacer(rule['decorate']),
-                seg,
-                flags=re.IGNORECASE,
-            )
+            if re.fullmatch(r"\w(?:.*\w)?", rule['word'], flags=re.DOTALL):
+                run.append(rule)
+                continue
+            self._add_pass(run)
+            self._add_pass([rule])
+            run = []
+        self._add_pass(run)
+
+    def decorate(self, text: str) -> str:
+        # Split into “keep-as-is” bold segments and everything else
+        segments = _BOLD_SEGMENT_RE.split(text)
+        for i, seg in enumerate(segments):
+            # Skip bold segments – they contain the entity names
+            if seg.lower().startswith('<b>'):
+                continue
+            for pattern, replace in self._passes:
+                seg = pattern.sub(replace, seg)
+            segments[i] = seg
+        return "".join(segments)
+
+    def _add_pass(self, rules: list[dict]) -> None:
+        if not rules:
+            return
+        self._check_independent(rules)
+        # longest first: "Burned" is tried before "Burn" (ties keep rule order)
+        ordered = sorted(rules, key=lambda rule: len(rule['word']), reverse=True)
+        templates = [rule['decorate'] for rule in ordered]
+        alternation = "|".join(f"({re.escape(rule['word'])})" for rule in ordered)
+        # the lookahead skips most word starts without trying every alternative
+        first = "".join(sorted({re.escape(rule['word'][0]) for rule in ordered}))
+        pattern = re.compile(rf"\b(?=[{first}])(?:{alternation})\b", re.IGNORECASE)
+
+        def replace(m: re.Match[str]) -> str:
+            return templates[m.lastindex - 1].format(word=m.group(0))
+
+        self._passes.append((pattern, replace))
+
+    @staticmethod
+    def _check_independent(rules: list[dict]) -> None:
+        """Fail if a rule would, applied one by one, decorate what an earlier rule of *rules* inserted."""
+        for index, rule in enumerate(rules):
+            word = re.compile(rf"\b{re.escape(rule['word'])}\b", re.IGNORECASE)
+            for earlier in rules[:index]:
+                if word.search(earlier['decorate'].format(word=earlier['word'])):
+                    raise ValueError(
+                        f"decorate rule {rule['word']!r} matches inside the replacement of the earlier rule "
+                        f"{earlier['word']!r}; applied in one pass they would not give the same text"
+                    )
 
-        segments[i] = seg
 
-    return "".join(segments)
+def decorate_display_message(text: str, rules: list[dict]) -> str:
+    """Apply decorators so Rich Text can parse and add colour to certain keywords,
+    but leave anything wrapped in <b>…</b> (entity names) untouched.
+
+    Builds a :class:`DecorationEngine` per call; build one up front to decorate many messages."""
+    return DecorationEngine(rules).decorate(text)
 
 
 
@@ -287,46 +383,53 @@ def reformat_monsters(raw: Dict[str, Any]) -> List[Dict[str, Any]]:
     Flatten monsters.json into the format expected by the original runtime.
     Returns the list that used to go into monsters.json.
     """
-    result: List[Dict[str, Any]] = []
-
-    for day in raw.get("monsterEncounterDays", []):
-        for group in day.get("groups", []):
-            for monster in group:
-                name: str = monster.get("cardName", "")
-                m: Dict[str, Any] = {
-                    "name": name,
-                    "health": monster.get("health", ""),
-                    "items": [],
-                    "skills": [],
-                }
-
-                # ---- items ----
-                for itm in monster.get("items", []):
-                    card = itm["card"]
-                    tier: str = itm.get("tierType", "").strip()
-                    enchantment: Optional[str] = itm.get("enchantmentType")
-
-                    m["items"].append(
-                        {
-                            "name": build_item_name(tier, card["name"], enchantment),
-                            "tooltips": collect_item_tooltips(card, enchantment),
-                        }
-                    )
+    return [
+        reformat_monster(monster)
+        for day in raw.get("monsterEncounterDays", [])
+        for group in day.get("groups", [])
+        for monster in group
+    ]
+
+
+def iter_monsters(path: Path) -> Iterator[Dict[str, Any]]:
+    """:func:`reformat_monsters` for the monsters.json at *path*, one monster at a time."""
+    return map(reformat_monster, iter_json(path, MONSTER_RECORDS))
+
+
+def reformat_monster(monster: Dict[str, Any]) -> Dict[str, Any]:
+    name: str = monster.get("cardName", "")
+    m: Dict[str, Any] = {
+        "name": name,
+        "health": monster.get("health", ""),
+        "items": [],
+        "skills": [],
+    }
 
-                # ---- skills ----
-                for skl in monster.get("skills", []):
-                    card = skl["card"]
-                    tier: str = skl.get("tierType", "").strip()
-                    m["skills"].append(
-                        {
-                            "name": f"{tier} {card['name']}".strip(),
-                            "tooltips": list(card.get("unifiedTooltips", [])),
-                        }
-                    )
+    # ---- items ----
+    for itm in monster.get("items", []):
+        card = itm["card"]
+        tier: str = itm.get("tierType", "").strip()
+        enchantment: Optional[str] = itm.get("enchantmentType")
 
-                result.append(m)
+        m["items"].append(
+            {
+                "name": build_item_name(tier, card["name"], enchantment),
+                "tooltips": collect_item_tooltips(card, enchantment),
+            }
+        )
+
+    # ---- skills ----
+    for skl in monster.get("skills", []):
+        card = skl["card"]
+        tier: str = skl.get("tierType", "").strip()
+        m["skills"].append(
+            {
+                "name": f"{tier} {card['name']}".strip(),
+                "tooltips": list(card.get("unifiedTooltips", [])),
+            }
+        )
 
-    return result
+    return m
 
 
 # --------------------------- Message builders ------------------------------ #
@@ -378,19 +481,260 @@ def build_event_message(event: Dict[str, Any]) -> Optional[str]:
 # --------------------------------------------------------------------------- #
 #                            ---- main routine ----                           #
 # --------------------------------------------------------------------------- #
-def main() -> None:
-    # ─── Ensure output dirs exist ───────────────────────────────────────────
-    ENTITY_OUT_PATH.parent.mkdir(parents=True, exist_ok=True)
+_MESSAGE_BUILDERS: Dict[str, Callable[[Dict[str, Any]], Optional[str]]] = {
+    "event": build_event_message,
+    "item": build_item_message,
+    "monster": build_monster_message,
+    "expedition": build_monster_message,
+}
+_ENTITY_TYPES = {"event": "event", "item": "item", "monster": "monster", "expedition": "monster"}
+
+
+def build_entity(kind: str, record: Dict[str, Any], decorator: DecorationEngine) -> Dict[str, Any]:
+    """The entities.json entry for one source record of *kind* ("event", "item", "monster", "expedition")."""
+    entity: Dict[str, Any] = {
+        "name": record["name"],
+        "type": _ENTITY_TYPES[kind],
+        "display_message": _MESSAGE_BUILDERS[kind](record),
+    }
+    msg = cleanup_display_message(entity["display_message"])
+
+    entity["display_message"] = decorator.decorate(msg)
+
+    entity_name = entity.get("name")
+    if entity_name in ALT_TEXT_MAP:
+        entity["alt_text"] = ALT_TEXT_MAP[entity_name]
+
+    if entity_name in DO_NOT_DISPLAY:
+        entity.pop("display_message")
+    return entity
+
+
+def build_entities(
+    events: Iterable[Dict[str, Any]],
+    items: Iterable[Dict[str, Any]],
+    monsters: Iterable[Dict[str, Any]],
+    expeditions: Iterable[Dict[str, Any]],
+    decorate_rules: List[Dict[str, str]],
+    *,
+    cache: Optional[Dict[str, Dict[str, Any]]] = None,
+    jobs: Optional[int] = None,
+) -> List[Dict[str, Any]]:
+    """The entities.json list for the sources (*monsters* already reformatted).
+
+    The sources may be iterators (see :func:`iter_monsters`); each record
+    is consumed once and not kept after its entity is built.
+
+    cache
+        Entities of earlier builds keyed by :func:`record_key`; entities of
+        unchanged records are taken from it, and it is updated in place to
+        hold exactly this build's entities.
+    jobs
+        Processes building the records not in *cache* (default: one per
+        CPU); ``1`` builds in this process.
+    """
+    records = chain(
+        (("event", ev) for ev in events),
+        (("item", itm) for itm in items),
+        (("monster", mon) for mon in monsters),
+        (("expedition", expedition) for expedition in expeditions),
+    )
+    context = build_context(decorate_rules) if cache is not None else b""
+    entities: List[Optional[Dict[str, Any]]] = []
+    keys: List[str] = []
+    with _RecordBuilder(decorate_rules, jobs, entities) as builder:
+        for kind, record in records:
+            if cache is not None:
+                key = record_key(context, kind, record)
+                keys.append(key)
+                if key in cache:
+                    entities.append(cache[key])
+                    continue
+            entities.append(None)
+            builder.add(len(entities) - 1, kind, record)
+
+    if cache is not None:
+        cache.clear()
+        cache.update(zip(keys, entities))  # type: ignore[arg-type]
+    return entities  # type: ignore[return-value]
+
+
+CATALOGUE_FORMAT = 2
+MESSAGE_SEPARATOR = "<br>"
+
+
+def intern_catalogue(entities: Iterable[Dict[str, Any]]) -> Dict[str, Any]:
+    """The entities.json document for *entities*: duplicates dropped, messages as fragment references."""
+    fragments: List[str] = []
+    index: Dict[str, int] = {}
+    interned: List[Dict[str, Any]] = []
+    seen = set()
+    for entity in entities:
+        identity = json.dumps(entity, sort_keys=True, ensure_ascii=False)
+        if identity in seen:
+            continue
+        seen.add(identity)
+        fields = dict(entity)
+        message = fields.pop("display_message", None)
+        if message is not None:
+            refs = []
+            for line in message.split(MESSAGE_SEPARATOR):
+                if line not in index:
+                    index[line] = len(fragments)
+                    fragments.append(line)
+                refs.append(index[line])
+            fields = {"name": fields.pop("name"), "type": fields.pop("type"), "message": refs, **fields}
+        interned.append(fields)
+    return {"format": CATALOGUE_FORMAT, "fragments": fragments, "entities": interned}
+
+
+def catalogue_json(entities: Iterable[Dict[str, Any]]) -> str:
+    """entities.json for *entities*: one fragment, one entity per line, so builds diff line by line."""
+    catalogue = intern_catalogue(entities)
+
+    def array(values: List[Any]) -> str:
+        return ",\n".join(f"    {json.dumps(value, ensure_ascii=False)}" for value in values)
+
+    return (
+        f'{{\n  "format": {catalogue["format"]},\n'
+        f'  "fragments": [\n{array(catalogue["fragments"])}\n  ],\n'
+        f'  "entities": [\n{array(catalogue["entities"])}\n  ]\n}}'
+    )
+
+
+def build_context(decorate_rules: List[Dict[str, str]]) -> bytes:
+    """Digest of everything besides a record that shapes its entity: this script and the decoration rules."""
+    digest = hashlib.sha256(Path(__file__).read_bytes())
+    digest.update(json.dumps(decorate_rules, sort_keys=True).encode("utf-8"))
+    return digest.digest()
+
+
+def record_key(context: bytes, kind: str, record: Dict[str, Any]) -> str:
+    digest = hashlib.sha256(context)
+    digest.update(json.dumps([kind, record], sort_keys=True, ensure_ascii=False).encode("utf-8"))
+    return digest.hexdigest()
+
+
+class _RecordBuilder:
+    """Builds entities into their slots of *entities* as records come in.
+
+    With one job, or until ``PARALLEL_MIN_RECORDS`` records are waiting, they
+    are built in this process (a pool costs more to start than a handful of
+    entities take to build); past that a process pool takes batches, with a
+    few batches in flight per process so records are not read faster than
+    they are built.
+    """
+
+    def __init__(self, decorate_rules: List[Dict[str, str]], jobs: Optional[int], entities: List[Any]) -> None:
+        self._decorate_rules = decorate_rules
+        self._jobs = jobs or os.cpu_count() or 1
+        self._entities = entities
+        self._decorator: Optional[DecorationEngine] = None
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._waiting: List[Tuple[int, str, Dict[str, Any]]] = []
+        self._in_flight: Deque[Tuple[List[int], Future]] = deque()
+
+    def __enter__(self) -> _RecordBuilder:
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        try:
+            if exc_type is None:
+                self._finish()
+        finally:
+            if self._pool is not None:
+                self._pool.shutdown(cancel_futures=True)
+
+    def add(self, slot: int, kind: str, record: Dict[str, Any]) -> None:
+        if self._jobs == 1:
+            self._entities[slot] = build_entity(kind, record, self._local_decorator())
+            return
+        self._waiting.append((slot, kind, record))
+        if self._pool is None and len(self._waiting) < PARALLEL_MIN_RECORDS:
+            return
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(
+                max_workers=self._jobs, initializer=_init_build_worker, initargs=(self._decorate_rules,)
+            )
+        while len(self._waiting) >= BATCH_SIZE:
+            self._submit(self._waiting[:BATCH_SIZE])
+            del self._waiting[:BATCH_SIZE]
+
+    def _finish(self) -> None:
+        if self._pool is None:
+            for slot, kind, record in self._waiting:
+                self._entities[slot] = build_entity(kind, record, self._local_decorator())
+        elif self._waiting:
+            self._submit(self._waiting)
+        self._waiting = []
+        while self._in_flight:
+            self._collect()
+
+    def _submit(self, batch: List[Tuple[int, str, Dict[str, Any]]]) -> None:
+        while len(self._in_flight) >= self._jobs * 2:
+            self._collect()
+        future = self._pool.submit(_build_batch, [(kind, record) for _, kind, record in batch])  # type: ignore[union-attr]
+        self._in_flight.append(([slot for slot, _, _ in batch], future))
+
+    def _collect(self) -> None:
+        slots, future = self._in_flight.popleft()
+        for slot, entity in zip(slots, future.result()):
+            self._entities[slot] = entity
+
+    def _local_decorator(self) -> DecorationEngine:
+        if self._decorator is None:
+            self._decorator = DecorationEngine(self._decorate_rules)
+        return self._decorator
+
+
+_worker_decorator: Optional[DecorationEngine] = None
+
+
+def _init_build_worker(decorate_rules: List[Dict[str, str]]) -> None:
+    global _worker_decorator
+    _worker_decorator = DecorationEngine(decorate_rules)
+
+
+def _build_batch(batch: List[Tuple[str, Dict[str, Any]]]) -> List[Dict[str, Any]]:
+    return [build_entity(kind, record, _worker_decorator) for kind, record in batch]
+
+
+def load_build_cache(path: Path) -> Dict[str, Dict[str, Any]]:
+    try:
+        with path.open(encoding="utf-8") as fp:
+            cache = json.load(fp)
+    except (OSError, ValueError):
+        return {}
+    return cache if isinstance(cache, dict) else {}
+
+
+def write_if_changed(path: Path, text: str) -> bool:
+    """Write *text* to *path* unless it already holds exactly that; ``True`` if it was written."""
+    try:
+        if path.read_text(encoding="utf-8") == text:
+            return False
+    except (OSError, UnicodeDecodeError):
+        pass
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("w", encoding="utf-8") as fp:
+        fp.write(text)
+    return True
+
+
+def main(argv: Optional[List[str]] = None) -> Dict[str, Any]:
+    parser = argparse.ArgumentParser(description="Build entities.json, the OCR term files and the catalogue bundle.")
+    parser.add_argument("--jobs", type=int, help="processes building changed entities (default: one per CPU)")
+    parser.add_argument("--no-cache", action="store_true", help="rebuild every entity")
+    args = parser.parse_args(argv)
+    started = time.perf_counter()
 
     # ─── Load input JSON ────────────────────────────────────────────────────
     with EVENTS_PATH.open(encoding="utf-8") as fp:
         events = json.load(fp)
 
-    with ITEMS_PATH.open(encoding="utf-8") as fp:
-        items = json.load(fp).get("items", [])
-
-    with MONSTERS_PATH.open(encoding="utf-8") as fp:
-        monsters = json.load(fp)
+    # the big ones are streamed, one record at a time
+    items = iter_json(ITEMS_PATH, ITEM_RECORDS)
+    monsters = iter_monsters(MONSTERS_PATH)
 
     with EXPEDITIONS_PATH.open(encoding="utf-8") as fp:
         expeditions = json.load(fp)
@@ -398,63 +742,15 @@ def main() -> None:
     with DECORATOR_PATH.open(encoding="utf-8") as fp:
         decorate_rules = json.load(fp)
 
-    monsters: List[Dict[str, Any]] = reformat_monsters(monsters)
-
     # ─── Build combined entities list ───────────────────────────────────────
-    entities: List[Dict[str, Any]] = []
-
-    # Events
-    for ev in events:
-        entities.append(
-            {
-                "name": ev["name"],
-                "type": "event",
-                "display_message": build_event_message(ev),
-            }
-        )
-
-    # Items
-    for itm in items:
-        entities.append(
-            {
-                "name": itm["name"],
-                "type": "item",
-                "display_message": build_item_message(itm),
-            }
-        )
-
-    # Monsters
-    for mon in monsters:
-        ent: Dict[str, Any] = {
-            "name": mon["name"],
-            "type": "monster",
-            "display_message": build_monster_message(mon),
-        }
-        entities.append(ent)
-
-    for expedition in expeditions:
-        ent: Dict[str, Any] = {
-            "name": expedition["name"],
-            "type": "monster",
-            "display_message": build_monster_message(expedition),
-        }
-        entities.append(ent)
-
-    for entity in entities:
-        msg = cleanup_display_message(entity["display_message"])
+    cache = {} if args.no_cache else load_build_cache(BUILD_CACHE_PATH)
+    previous = set(cache)
+    entities = build_entities(events, items, monsters, expeditions, decorate_rules, cache=cache, jobs=args.jobs)
+    # distinct entities: identical records share a cache entry
+    built, reused = len(cache.keys() - previous), len(cache.keys() & previous)
+    write_if_changed(BUILD_CACHE_PATH, json.dumps(cache, ensure_ascii=False))
 
-        entity["display_message"] = decorate_display_message(msg, decorate_rules)
-        
-        entity_name = entity.get("name")
-        if entity_name in ALT_TEXT_MAP:
-            entity["alt_text"] = ALT_TEXT_MAP[entity_name]
-        
-        if entity_name in DO_NOT_DISPLAY:
-            entity.pop("display_message")
-
-    # ─── Write entities.json ────────────────────────────────────────────────
-    with ENTITY_OUT_PATH.open("w", encoding="utf-8") as fp:
-        json.dump(entities, fp, indent=2, ensure_ascii=False)
+    outputs: Dict[Path, str] = {ENTITY_OUT_PATH: catalogue_json(entities)}
 
     # ─── Build OCR term files (word set & char whitelist) ───────────────────
     word_set = set()
@@ -466,11 +762,7 @@ def main() -> None:
             word_set.update(alt) 
 
     # eng.bazaar_terms  (newline-separated words)
-    with WINDOWS_TERMS_PATH.open("w", encoding="utf-8") as fp:
-        fp.write("\n".join(sorted(word_set)))
-
-    with MAC_TERMS_PATH.open("w", encoding="utf-8") as fp:
-        fp.write("\n".join(sorted(word_set)))
+    outputs[WINDOWS_TERMS_PATH] = outputs[MAC_TERMS_PATH] = "\n".join(sorted(word_set))
 
     # bazaar_terms config  (whitelisted characters)
     char_set = set("".join(word_set))
@@ -484,13 +776,24 @@ def main() -> None:
         "tessedit_pageseg_mode 11\n"
         "oem 1"
     )
-    with WINDOWS_CHAR_SET_PATH.open("w", encoding="utf-8") as fp:
-        fp.write(config_body)
-
-    with MAC_CHAR_SET_PATH.open("w", encoding="utf-8") as fp:
-        fp.write(config_body)
-
-    print("✔ entities.json, eng.bazaar_terms, and bazaar_terms created.")
+    outputs[WINDOWS_CHAR_SET_PATH] = outputs[MAC_CHAR_SET_PATH] = config_body
+
+    written = [path for path, text in outputs.items() if write_if_changed(path, text)]
+
+    # ─── Hot-update bundle for clients already installed ────────────────────
+    manifest = None
+    if ENTITY_OUT_PATH in written or not (BUNDLE_DIR / MANIFEST_NAME).exists():
+        manifest = build_bundle(ENTITY_OUT_PATH, BUNDLE_DIR)
+
+    elapsed = time.perf_counter() - started
+    print(f"✔ {len(entities)} entities in {elapsed:.2f}s ({built} built, {reused} from cache).")
+    for path in written:
+        print(f"✔ {path} updated.")
+    if not written:
+        print("✔ entities.json, eng.bazaar_terms, and bazaar_terms already up to date.")
+    if manifest:
+        print(f"✔ catalogue bundle {manifest['version']} ({manifest['bundle_size']} bytes) created.")
+    return {"entities": len(entities), "built": built, "reused": reused, "written": len(written), "seconds": elapsed}
 
 
 if __name__ == "__main__":
@@ -1,13 +1,134 @@
-import json, re, time, requests
+#!/usr/bin/env python3
+"""
+event_scraper.py
+
+• Reads:  <base-url>/wiki/Category:Event and every event page it links to
+• Writes: events.json
+
+Pages are fetched over one pooled session, `--workers` at a time, with a
+timeout and retries with backoff on connection errors and 429/5xx answers.
+Every page is kept in .http-cache/ with its ETag / Last-Modified and
+revalidated on the next run, so pages the wiki did not change are not
+downloaded again.  Events are written in the order the category lists
+them, whatever order their pages arrive in.
+
+`--base-url` points the scraper at another server, e.g. a local stand-in
+serving fixture pages (see benchmarks/event_scraping.py).
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import requests
 from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 BASE = "https://thebazaar.wiki.gg"
 
+CURRENT_DIR = Path(__file__).resolve().parent
+EVENTS_PATH = CURRENT_DIR / "events.json"
+HTTP_CACHE_DIR = CURRENT_DIR / ".http-cache"
+
+WORKERS = 8  # concurrent requests; the wiki is a shared, rate-limited host
+RETRIES = 4
+BACKOFF_S = 0.5  # waits 0.5, 1, 2, 4 s between attempts
+TIMEOUT_S = (5, 30)  # connect, read
+
+
 def clean(text: str) -> str:
     """Strip inline image placeholders like “Heal.png20”, collapse doublespaces."""
     return re.sub(r'\b\w+\.png', '', text).replace('  ', ' ').strip()
 
-def event_links() -> list[str]:
+
+class CachedFetcher:
+    """GETs pages over one pooled session, revalidating them against an on-disk cache.
+
+    Safe to share between threads: the session's connection pool holds
+    ``workers`` connections, and every cache entry is one file written
+    atomically.  ``cache_dir=None`` disables the cache.
+    """
+
+    def __init__(self, cache_dir: Optional[Path] = HTTP_CACHE_DIR, *, workers: int = WORKERS, retries: int = RETRIES) -> None:
+        self._cache_dir = cache_dir
+        retry = Retry(
+            total=retries,
+            backoff_factor=BACKOFF_S,
+            status_forcelist=(429, 500, 502, 503, 504),
+            allowed_methods=("GET",),
+            raise_on_status=False,  # the last answer reaches raise_for_status below
+        )
+        adapter = HTTPAdapter(pool_connections=workers, pool_maxsize=workers, max_retries=retry)
+        self._session = requests.Session()
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+        self._lock = threading.Lock()
+        self.stats: Counter[str] = Counter()
+
+    def get(self, url: str) -> str:
+        entry = self._load(url)
+        headers = {}
+        if entry and entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry and entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+
+        response = self._session.get(url, headers=headers, timeout=TIMEOUT_S)
+        if response.status_code == 304 and entry:
+            self._count("revalidated")
+            return entry["body"]
+        response.raise_for_status()
+        self._count("downloaded")
+        body = response.text
+        etag, last_modified = response.headers.get("ETag"), response.headers.get("Last-Modified")
+        if etag or last_modified:
+            self._store(url, {"url": url, "etag": etag, "last_modified": last_modified, "body": body})
+        return body
+
+    def close(self) -> None:
+        self._session.close()
+
+    # -------------------------- internal utilities ----------------------- #
+    def _path(self, url: str) -> Path:
+        return self._cache_dir / f"{hashlib.sha256(url.encode('utf-8')).hexdigest()[:32]}.json"  # type: ignore[operator]
+
+    def _load(self, url: str) -> Optional[Dict[str, Any]]:
+        if self._cache_dir is None:
+            return None
+        try:
+            with self._path(url).open(encoding="utf-8") as fp:
+                entry = json.load(fp)
+        except (OSError, ValueError):
+            return None
+        return entry if entry.get("url") == url else None
+
+    def _store(self, url: str, entry: Dict[str, Any]) -> None:
+        if self._cache_dir is None:
+            return
+        path = self._path(url)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temporary = path.parent / f"{path.name}.{threading.get_ident()}.tmp"
+        with temporary.open("w", encoding="utf-8") as fp:
+            json.dump(entry, fp, ensure_ascii=False)
+        os.replace(temporary, path)
+
+    def _count(self, key: str) -> None:
+        with self._lock:
+            self.stats[key] += 1
+
+
+def event_links(fetcher: CachedFetcher, base: str = BASE) -> list[str]:
     """
     Return a list of full event‑page URLs.
 
@@ -15,14 +136,14 @@ def event_links() -> list[str]:
     we parse the sortable wikitable at the top of the page.  Every row’s first
     <td> holds a single <a> whose href is the page we want.
     """
-    html  = requests.get(f"{BASE}/wiki/Category:Event").text
+    html  = fetcher.get(f"{base}/wiki/Category:Event")
     soup  = BeautifulSoup(html, "html.parser")
 
     table = soup.select_one("table.wikitable.sortable")
     if not table:                       # Fallback: old behaviour
         print("⚠️  Table not found – falling back to #mw-pages list")
         return [
-            BASE + a["href"]
+            base + a["href"]
             for a in soup.select('#mw-pages a[href^="/wiki/"]')
         ]
 
@@ -30,14 +151,15 @@ def event_links() -> list[str]:
     for tr in table.select("tr")[1:]:   # skip header row
         a = tr.select_one("td a[href^='/wiki/']")
         if a:
-            links.append(BASE + a["href"])
+            links.append(base + a["href"])
 
     # Remove dups while preserving order
     return list(dict.fromkeys(links))
 
-def scrape_event(url: str) -> dict:
+
+def scrape_event(fetcher: CachedFetcher, url: str) -> dict:
+    html = fetcher.get(url)
     print(url)
-    html = requests.get(url).text
     soup = BeautifulSoup(html, "html.parser")
 
     name = soup.select_one('#firstHeading').text.strip()
@@ -51,8 +173,39 @@ def scrape_event(url: str) -> dict:
         options = [clean(desc.find_parent().find_next('p').text)]
 
     return {"name": name, "options": options}
-# ---------- main ----------
-all_events = [scrape_event(url) for url in event_links()]
-with open("events.json", "w", encoding="utf-8") as f:
-    json.dump(all_events, f, ensure_ascii=False, indent=4)
-print("Wrote", len(all_events), "events to events.json")
+
+
+def scrape_events(fetcher: CachedFetcher, base: str = BASE, workers: int = WORKERS) -> List[dict]:
+    """Every event listed in the category, in the category's order."""
+    links = event_links(fetcher, base)
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="event-scraper") as pool:
+        return list(pool.map(lambda url: scrape_event(fetcher, url), links))
+
+
+def main(argv: Optional[List[str]] = None) -> Dict[str, Any]:
+    parser = argparse.ArgumentParser(description="Scrape the wiki's event pages into events.json.")
+    parser.add_argument("--base-url", default=BASE, help=f"wiki to scrape (default: {BASE})")
+    parser.add_argument("--workers", type=int, default=WORKERS, help="concurrent requests")
+    parser.add_argument("--out", type=Path, default=EVENTS_PATH, help="where to write the events")
+    parser.add_argument("--no-cache", action="store_true", help="download every page again")
+    args = parser.parse_args(argv)
+    started = time.perf_counter()
+
+    fetcher = CachedFetcher(None if args.no_cache else HTTP_CACHE_DIR, workers=args.workers)
+    try:
+        all_events = scrape_events(fetcher, args.base_url.rstrip("/"), args.workers)
+    finally:
+        fetcher.close()
+
+    with open(args.out, "w", encoding="utf-8") as f:
+        json.dump(all_events, f, ensure_ascii=False, indent=4)
+    elapsed = time.perf_counter() - started
+    print(
+        f"Wrote {len(all_events)} events to {args.out} in {elapsed:.2f}s "
+        f"({fetcher.stats['downloaded']} pages downloaded, {fetcher.stats['revalidated']} unchanged)"
+    )
+    return {"events": len(all_events), "seconds": elapsed, **fetcher.stats}
+
+
+if __name__ == "__main__":
+    main()
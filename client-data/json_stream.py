@@ -0,0 +1,230 @@
+#!/usr/bin/env python3
+"""
+json_stream.py
+
+Iterates over the values at a path of a large JSON document without
+loading the document:
+
+    for monster in iter_json(MONSTERS_PATH, ("monsterEncounterDays", "*", "groups", "*", "*")):
+        ...
+
+A path step is an object key, an array index or "*" (every key / index).
+The file is read in chunks; only the value being yielded is ever decoded in
+full, everything off the path is skipped as it is read, so memory use is
+bounded by the largest single value yielded rather than by the file.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+from pathlib import Path
+from typing import Any, Iterator, Sequence, TextIO, Union
+
+PathStep = Union[str, int]
+
+CHUNK_SIZE = 64 * 1024
+
+_DECODER = json.JSONDecoder()
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+_STRUCTURAL = re.compile(r'["{}\[\]]')  # what matters while skipping a container
+_STRING_END = re.compile(r'["\\]')
+_SCALAR_END = re.compile(r"[,\]} \t\n\r]")
+
+
+def iter_json(path: Path, json_path: Sequence[PathStep], *, chunk_size: int = CHUNK_SIZE) -> Iterator[Any]:
+    """Decoded values at *json_path* in the JSON file at *path*, in document order."""
+    with path.open(encoding="utf-8") as fp:
+        yield from iter_json_stream(fp, json_path, chunk_size=chunk_size)
+
+
+def iter_json_stream(fp: TextIO, json_path: Sequence[PathStep], *, chunk_size: int = CHUNK_SIZE) -> Iterator[Any]:
+    reader = _Reader(fp, chunk_size)
+    yield from _walk(reader, tuple(json_path))
+    if reader.peek() != "":
+        raise reader.error("Extra data")
+
+
+def _walk(reader: _Reader, json_path: tuple[PathStep, ...]) -> Iterator[Any]:
+    if not json_path:
+        yield reader.decode_value()
+        return
+
+    step, rest = json_path[0], json_path[1:]
+    opening = reader.peek()
+    if opening not in ("{", "["):
+        reader.skip_value()  # a scalar where the path wants a container: nothing there
+        return
+    closing = "}" if opening == "{" else "]"
+    reader.advance()
+    if reader.peek() == closing:
+        reader.advance()
+        return
+
+    index = 0
+    while True:
+        if opening == "{":
+            if reader.peek() != '"':
+                raise reader.error("Expecting property name enclosed in double quotes")
+            key: PathStep = reader.decode_value()
+            reader.expect(":")
+        else:
+            key = index
+        if step == "*" or step == key:
+            yield from _walk(reader, rest)
+        else:
+            reader.skip_value()
+        index += 1
+
+        separator = reader.peek()
+        reader.advance()
+        if separator == closing:
+            return
+        if separator != ",":
+            raise reader.error(f"Expecting ',' or {closing!r}")
+
+
+class _Reader:
+    """A window onto the file: ``buffer[pos:]`` is what has been read but not consumed."""
+
+    def __init__(self, fp: TextIO, chunk_size: int) -> None:
+        self._fp = fp
+        self._chunk_size = chunk_size
+        self._buffer = ""
+        self._pos = 0
+        self._consumed = 0  # characters dropped from the front of the buffer, for error offsets
+        self._eof = False
+
+    # ------------------------------ public API --------------------------- #
+    def peek(self) -> str:
+        """The next non-whitespace character, without consuming it ("" at the end)."""
+        while True:
+            self._pos = _WHITESPACE.match(self._buffer, self._pos).end()
+            if self._pos < len(self._buffer) or not self._fill():
+                return self._buffer[self._pos : self._pos + 1]
+
+    def advance(self) -> None:
+        self._pos += 1
+
+    def expect(self, char: str) -> None:
+        if self.peek() != char:
+            raise self.error(f"Expecting {char!r} delimiter")
+        self.advance()
+
+    def decode_value(self) -> Any:
+        if self.peek() not in ('"', "{", "["):
+            # a prefix of a number decodes too ("1." as 1): read up to its end first
+            while _SCALAR_END.search(self._buffer, self._pos) is None and self._fill():
+                pass
+        while True:
+            try:
+                value, self._pos = _DECODER.raw_decode(self._buffer, self._pos)
+                return value
+            except json.JSONDecodeError as exc:
+                # most likely the value runs past what has been read so far
+                if not self._fill():
+                    raise self.error(exc.msg) from None
+
+    def skip_value(self) -> None:
+        char = self.peek()
+        if char == '"':
+            self.advance()
+            self._skip_string()
+        elif char in ("{", "["):
+            self._skip_container()
+        elif char:
+            self._skip_scalar()
+        else:
+            raise self.error("Expecting value")
+
+    def error(self, message: str) -> json.JSONDecodeError:
+        # line and column are those within the buffer; the message carries the offset in the file
+        offset = self._consumed + self._pos
+        return json.JSONDecodeError(f"{message} at character {offset}", self._buffer, self._pos)
+
+    # -------------------------- internal utilities ----------------------- #
+    def _fill(self) -> bool:
+        """Read the next chunk; ``False`` at the end of the file."""
+        if self._eof:
+            return False
+        if self._pos > len(self._buffer) // 2:
+            # drop what has been consumed so the buffer does not grow with the file
+            self._consumed += self._pos
+            self._buffer, self._pos = self._buffer[self._pos :], 0
+        chunk = self._fp.read(self._chunk_size)
+        if not chunk:
+            self._eof = True
+            return False
+        self._buffer += chunk
+        return True
+
+    def _skip_string(self) -> None:
+        # positioned just after the opening quote
+        while True:
+            match = _STRING_END.search(self._buffer, self._pos)
+            if match is None:
+                self._pos = len(self._buffer)
+            elif match.group() == "\\":
+                if match.end() < len(self._buffer):
+                    self._pos = match.end() + 1  # the escaped character
+                    continue
+                self._pos = match.start()  # keep the backslash for the next chunk
+            else:
+                self._pos = match.end()
+                return
+            if not self._fill():
+                raise self.error("Unterminated string")
+
+    def _skip_container(self) -> None:
+        depth = 0
+        while True:
+            match = _STRUCTURAL.search(self._buffer, self._pos)
+            if match is None:
+                self._pos = len(self._buffer)
+                if not self._fill():
+                    raise self.error("Unterminated container")
+                continue
+            self._pos = match.end()
+            char = match.group()
+            if char == '"':
+                self._skip_string()
+            elif char in "{[":
+                depth += 1
+            else:
+                depth -= 1
+                if depth == 0:
+                    return
+
+    def _skip_scalar(self) -> None:
+        while True:
+            match = _SCALAR_END.search(self._buffer, self._pos)
+            if match is not None:
+                self._pos = match.start()
+                return
+            self._pos = len(self._buffer)
+            if not self._fill():
+                return
+
+
+# --------------------------------------------------------------------- #
+# Quick self-test — run `python json_stream.py`
+# --------------------------------------------------------------------- #
+if __name__ == "__main__":  # pragma: no cover
+    import io
+    import time
+
+    document = {"version": "x", "skip": [{"a": "b\\\"]}"}, 1.5e3, None], "items": [{"n": i, "s": "é\n"} for i in range(5)]}
+    text = json.dumps(document)
+    for size in (1, 2, 3, 7, 64):
+        assert list(iter_json_stream(io.StringIO(text), ("items", "*"), chunk_size=size)) == document["items"]
+        assert list(iter_json_stream(io.StringIO(text), ("skip", 1), chunk_size=size)) == [1500.0]
+    print("✔ small documents")
+
+    here = Path(__file__).resolve().parent
+    for name, json_path in (
+        ("items.json", ("items", "*")),
+        ("monsters.json", ("monsterEncounterDays", "*", "groups", "*", "*")),
+    ):
+        started = time.perf_counter()
+        count = sum(1 for _ in iter_json(here / name, json_path))
+        print(f"✔ {name}: {count} records streamed in {time.perf_counter() - started:.2f}s")
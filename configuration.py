@@ -1,10 +1,16 @@
 from typing import Optional
 from pydantic import BaseModel
 import json
+import os
 import sys
 import platform
 from pathlib import Path
 
+# Manifest of the hot-updatable entity catalogue (see catalogue_updater.py)
+CATALOGUE_URL = (
+    "https://github.com/stonehenge-collective/bazaar-buddy-client/releases/download/catalogue/catalogue-manifest.json"
+)
+
 
 class Configuration(BaseModel):
     """Runtime configuration for the Bazaar Buddy client.
@@ -20,12 +26,25 @@ class Configuration(BaseModel):
 
     current_version: str
     update_with_test_release: bool
+    update_download_segments: int
+    background_updates: bool
+    update_check_interval_minutes: int
+    update_bandwidth_kbps: int
     operating_system: str
     system_path: Path
     executable_path: Path
     is_local: bool
     save_images: bool
+    session_quota_mb: int
     target_test_release: Optional[str]
+    profiling_enabled: bool
+    profiling_trace_memory: bool
+    profiling_sample_interval_ms: int
+    profiling_dump_interval_s: int
+    catalogue_updates: bool
+    process_scan_max_interval_s: float
+    ocr_workers: int
+    catalogue_url: str
 
     def __init__(self):  # type: ignore[override]
         """Populate the model from disk and runtime context.
@@ -60,6 +79,14 @@ class Configuration(BaseModel):
         except FileNotFoundError as exc:
             raise FileNotFoundError(f"Configuration file not found at {config_path!s}.") from exc
 
+        # ──────────────────────────────────────────────────────────────────────
+        # Profiling can be forced on without editing the bundled JSON, e.g.
+        # ``BAZAAR_BUDDY_PROFILE=1`` or ``BAZAAR_BUDDY_PROFILE=tracemalloc``
+        # ──────────────────────────────────────────────────────────────────────
+        profile_env = os.environ.get("BAZAAR_BUDDY_PROFILE", "").strip().lower()
+        profiling_enabled = cfg.get("profiling", False) or profile_env in ("1", "true", "yes", "tracemalloc")
+        profiling_trace_memory = cfg.get("profiling_trace_memory", False) or profile_env == "tracemalloc"
+
         # ──────────────────────────────────────────────────────────────────────
         # Assemble the final data dictionary, giving priority to user‑supplied
         # overrides (``data``)
@@ -67,12 +94,25 @@ class Configuration(BaseModel):
         auto_values = dict(
             current_version=cfg.get("version"),
             update_with_test_release=cfg.get("update_with_test_release", False),
+            update_download_segments=cfg.get("update_download_segments", 1),
+            background_updates=cfg.get("background_updates", False),
+            update_check_interval_minutes=cfg.get("update_check_interval_minutes", 60),
+            update_bandwidth_kbps=cfg.get("update_bandwidth_kbps", 512),
             operating_system=operating_system,
             system_path=system_path,
             executable_path=executable_path,
             is_local=is_local,
             save_images=cfg.get("save_images", False),
-            target_test_release=cfg.get("target_test_release", None)
+            session_quota_mb=cfg.get("session_quota_mb", 512),
+            target_test_release=cfg.get("target_test_release", None),
+            profiling_enabled=profiling_enabled,
+            profiling_trace_memory=profiling_trace_memory,
+            profiling_sample_interval_ms=cfg.get("profiling_sample_interval_ms", 50),
+            profiling_dump_interval_s=cfg.get("profiling_dump_interval_s", 300),
+            catalogue_updates=cfg.get("catalogue_updates", True),
+            process_scan_max_interval_s=cfg.get("process_scan_max_interval_s", 10.0),
+            ocr_workers=max(1, cfg.get("ocr_workers", 1)),
+            catalogue_url=cfg.get("catalogue_url", CATALOGUE_URL),
         )
 
         super().__init__(**auto_values)
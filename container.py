@@ -1,23 +1,41 @@
+from __future__ import annotations
+
 import sys
+from functools import cached_property
+from typing import TYPE_CHECKING
 from PyQt6.QtWidgets import QApplication
 from pathlib import Path
 
 from logger import logger
 from configuration import Configuration
-from security import Security
-from message_builder import MessageBuilder
-from system_handler import WindowsSystemHandler, MacSystemHandler, BaseSystemHandler
-from updater import TestUpdateSource, ProductionUpdateSource, BaseUpdater, WindowsUpdater, MacUpdater, BaseUpdateSource
 from overlay import Overlay
-from capture_worker import MacCaptureWorker, WindowsCaptureWorkerV2
-from bazaar_buddy import BazaarBuddy
 from worker_framework import ThreadController
-from timer_worker import TimerWorker
-from text_extractor_worker import TextExtractor, TextExtractorWorkerFactory
-from file_writer import BaseFileSystem, MacFileSystem, WindowsFileSystem, FileType
+from file_writer import BaseFileSystem, MacFileSystem, WindowsFileSystem, FileType, ConfigStore, ConfigData
+
+if TYPE_CHECKING:
+    from security import Security
+    from message_builder import MessageBuilder
+    from catalogue_updater import CatalogueStore, CatalogueUpdater
+    from system_handler import BaseSystemHandler
+    from updater import BaseUpdater, BaseUpdateSource
+    from capture_worker import BaseCaptureWorker
+    from bazaar_buddy import BazaarBuddy
+    from profiler import SamplingProfiler
+    from session_recorder import SessionRecorder
+    from scheduler_worker import SchedulerWorker
+    from process_discovery import ProcessDiscoveryJob
+    from text_extractor_worker import TextExtractor, TextExtractorWorkerFactory
 
 
 class Container:
+    """Builds the application's services.
+
+    Only what is needed to put the overlay on screen is built in
+    ``__init__``.  Everything else is a :func:`~functools.cached_property`
+    whose module is imported on first access, so heavy dependencies
+    (``requests``, PIL, pytesseract, the entity catalogue…) stay off the
+    cold-start path.
+    """
 
     def __init__(self):
 
@@ -26,11 +44,76 @@ class Container:
         self.logger = logger
         self.configuration = Configuration()
 
-        self.security = Security(self.configuration, self.logger)
-        self.message_builder = MessageBuilder(self.configuration, self.logger)
-        self.text_extractor = TextExtractor(self.configuration, self.logger)
+        # File system handler for writing application data
+        self.file_system: BaseFileSystem = (
+            WindowsFileSystem(Path.home() / "AppData" / "Roaming" / "BazaarBuddy", self.configuration)
+            if self.configuration.operating_system == "Windows"
+            else MacFileSystem(Path.home() / "Library" / "Application Support" / "BazaarBuddy", self.configuration)
+        )
+
+        # user config lives in memory; writes are debounced on a background thread
+        self.config_store: ConfigStore[ConfigData] = ConfigStore(
+            self.file_system.get_file_writer(FileType.CONFIG),
+            ConfigData,
+            logger=self.logger,
+        )
+
+        self.overlay: Overlay = Overlay(
+            "Checking for updates…",
+            self.configuration,
+            self.config_store,
+        )
+
+        self.thread_controller = ThreadController(self.logger)
+
+    @cached_property
+    def security(self) -> Security:
+        from security import Security
+
+        return Security(self.configuration, self.logger)
+
+    @cached_property
+    def message_builder(self) -> MessageBuilder:
+        from message_builder import MessageBuilder
+
+        return MessageBuilder(self.configuration, self.logger, catalogue_path=self.catalogue_store.active_path())
+
+    @cached_property
+    def catalogue_store(self) -> CatalogueStore:
+        from catalogue_updater import CatalogueStore
+
+        return CatalogueStore(
+            self.file_system.get_file_writer(FileType.CATALOGUE),
+            self.configuration.system_path / "entities.json",
+            self.configuration.current_version,
+        )
+
+    @cached_property
+    def catalogue_updater(self) -> CatalogueUpdater | None:
+        if not self.configuration.catalogue_updates:
+            return None
+
+        from catalogue_updater import CatalogueUpdater
+
+        return CatalogueUpdater(
+            self.logger,
+            self.thread_controller,
+            self.catalogue_store,
+            self.configuration.catalogue_url,
+            self.message_builder.reload,
+        )
+
+    @cached_property
+    def text_extractor(self) -> TextExtractor:
+        from text_extractor_worker import TextExtractor
+
+        return TextExtractor(self.configuration, self.logger)
 
-        self.capture_worker = (
+    @cached_property
+    def capture_worker(self) -> BaseCaptureWorker:
+        from capture_worker import MacCaptureWorker, WindowsCaptureWorkerV2
+
+        return (
             MacCaptureWorker(
                 self.logger,
                 "The Bazaar",
@@ -42,57 +125,109 @@ class Container:
             )
         )
 
-        self.text_extractor_worker_factory = TextExtractorWorkerFactory(
+    @cached_property
+    def session_recorder(self) -> SessionRecorder | None:
+        # Frames, OCR text and matches are only recorded when save_images is on
+        if not self.configuration.save_images:
+            return None
+
+        from session_recorder import SessionRecorder
+
+        return SessionRecorder(
+            self.logger,
+            self.file_system.base_path / "sessions",
+            self.configuration.current_version,
+            quota_bytes=self.configuration.session_quota_mb * 1024 * 1024,
+        )
+
+    @cached_property
+    def text_extractor_worker_factory(self) -> TextExtractorWorkerFactory:
+        from text_extractor_worker import TextExtractorWorkerFactory
+
+        return TextExtractorWorkerFactory(
             self.configuration,
             self.message_builder,
             self.text_extractor,
             self.capture_worker,
             self.logger,
+            self.session_recorder,
         )
 
-        self.system_handler: BaseSystemHandler = (
-            WindowsSystemHandler() if self.configuration.operating_system == "Windows" else MacSystemHandler()
-        )
+    @cached_property
+    def system_handler(self) -> BaseSystemHandler:
+        from system_handler import WindowsSystemHandler, MacSystemHandler
 
-        # File system handler for writing application data
-        self.file_system: BaseFileSystem = (
-            WindowsFileSystem(Path.home() / "AppData" / "Roaming" / "BazaarBuddy", self.configuration)
-            if self.configuration.operating_system == "Windows"
-            else MacFileSystem(Path.home() / "Library" / "Application Support" / "BazaarBuddy", self.configuration)
-        )
+        return WindowsSystemHandler() if self.configuration.operating_system == "Windows" else MacSystemHandler()
+
+    @cached_property
+    def update_source(self) -> BaseUpdateSource:
+        from updater import TestUpdateSource, ProductionUpdateSource
 
-        self.update_source: BaseUpdateSource = (
-            TestUpdateSource(self.logger)
+        cache_writer = self.file_system.get_file_writer(FileType.RELEASE_CACHE)
+        return (
+            TestUpdateSource(self.logger, cache_writer)
             if self.configuration.update_with_test_release
-            else ProductionUpdateSource(self.logger)
+            else ProductionUpdateSource(self.logger, cache_writer)
         )
 
-        self.overlay: Overlay = Overlay(
-            "Checking for updates…",
+    @cached_property
+    def updater(self) -> BaseUpdater:
+        from updater import WindowsUpdater, MacUpdater
+
+        updater_class = WindowsUpdater if self.configuration.operating_system == "Windows" else MacUpdater
+        return updater_class(
+            self.overlay,
+            self.logger,
             self.configuration,
-            self.file_system.get_file_writer(FileType.CONFIG),
+            self.update_source,
+            self.thread_controller,
+            self.file_system.base_path / "updates",
+            self.configuration.update_download_segments,
+            self.file_system.get_file_writer(FileType.PENDING_UPDATE),
+            self.configuration.background_updates,
+            self.configuration.update_bandwidth_kbps,
         )
 
-        if self.configuration.operating_system == "Windows":
-            self.updater: BaseUpdater = WindowsUpdater(
-                self.overlay, self.logger, self.configuration, self.update_source.latest_release
-            )
-        else:
-            self.updater: BaseUpdater = MacUpdater(
-                self.overlay, self.logger, self.configuration, self.update_source.latest_release
-            )
+    @cached_property
+    def scheduler(self) -> SchedulerWorker:
+        from scheduler_worker import SchedulerWorker
 
-        self.one_second_timer = TimerWorker(self.logger, 1000, "one-second-timer")
+        return SchedulerWorker(self.logger)
 
-        self.thread_controller = ThreadController(self.logger)
+    @cached_property
+    def process_discovery_job(self) -> ProcessDiscoveryJob:
+        from process_discovery import ProcessDiscovery, ProcessDiscoveryJob
+
+        process_name = "TheBazaar.exe" if self.configuration.operating_system == "Windows" else "The Bazaar"
+        return ProcessDiscoveryJob(self.logger, ProcessDiscovery(self.system_handler, process_name))
+
+    @cached_property
+    def profiler(self) -> SamplingProfiler | None:
+        if not self.configuration.profiling_enabled:
+            return None
+
+        from profiler import SamplingProfiler
+
+        return SamplingProfiler(
+            self.logger,
+            self.thread_controller,
+            self.file_system.base_path / "profiles",
+            sample_interval_ms=self.configuration.profiling_sample_interval_ms,
+            dump_interval_s=self.configuration.profiling_dump_interval_s,
+            trace_memory=self.configuration.profiling_trace_memory,
+        )
+
+    @cached_property
+    def bazaar_buddy(self) -> BazaarBuddy:
+        from bazaar_buddy import BazaarBuddy
 
-        self.bazaar_buddy: BazaarBuddy = BazaarBuddy(
+        return BazaarBuddy(
             self.overlay,
             self.logger,
             self.thread_controller,
             self.text_extractor_worker_factory,
-            self.one_second_timer,
-            self.system_handler,
+            self.scheduler,
+            self.process_discovery_job,
             self.configuration,
         )
 
@@ -0,0 +1,249 @@
+"""
+Delta Patches
+=============
+
+Binary delta patches between two builds of the client, so an update only
+has to download what changed.
+
+A patch is ``MAGIC``, a length-prefixed JSON header and an LZMA-compressed
+stream of operations:
+
+* ``C <offset:u64> <length:u32>`` – copy ``length`` bytes of the old file,
+* ``I <length:u32> <bytes>`` – insert literal bytes.
+
+The header carries the SHA‑256 of the source and of the result, so a patch
+is never applied to the wrong file and a bad result is never installed.
+
+Patches are built by matching fixed-size blocks of the old file against a
+rolling Adler‑32 over the new file (rsync style), extending every hit as far
+as it goes in both directions.
+
+    python delta_patch.py create OLD NEW PATCH
+    python delta_patch.py apply OLD PATCH OUT
+    python delta_patch.py selftest
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import lzma
+import struct
+import sys
+import zlib
+from pathlib import Path
+
+MAGIC = b"BBDELTA1"
+DEFAULT_BLOCK_SIZE = 2048
+_MOD_ADLER = 65521
+_COPY = b"C"
+_INSERT = b"I"
+_COPY_FORMAT = struct.Struct("<QI")
+_LENGTH_FORMAT = struct.Struct("<I")
+_MAX_INSERT = 1 << 20
+
+
+class PatchError(ValueError):
+    """The patch is malformed or does not belong to the given source."""
+
+
+def _sha256(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def patch_asset_name(asset_name: str, from_version: str) -> str:
+    """Name under which the patch from ``from_version`` is published next to ``asset_name``."""
+    return f"{asset_name}.from-{from_version}.patch"
+
+
+def create_patch(old: bytes, new: bytes, block_size: int = DEFAULT_BLOCK_SIZE) -> bytes:
+    """Return a patch that turns ``old`` into ``new``."""
+    # Index every aligned block of the old file by its weak checksum
+    index: dict[int, list[int]] = {}
+    for offset in range(0, len(old) - block_size + 1, block_size):
+        index.setdefault(zlib.adler32(old[offset : offset + block_size]), []).append(offset)
+
+    ops = bytearray()
+    literal_start = 0  # start of the new-file bytes not yet covered by an op
+
+    def emit_literal(end: int) -> None:
+        for start in range(literal_start, end, _MAX_INSERT):
+            chunk = new[start : min(end, start + _MAX_INSERT)]
+            ops.extend(_INSERT + _LENGTH_FORMAT.pack(len(chunk)) + chunk)
+
+    position = 0
+    checksum = zlib.adler32(new[:block_size]) if len(new) >= block_size else None
+    while checksum is not None:
+        match = None
+        for candidate in index.get(checksum, ()):
+            if old[candidate : candidate + block_size] == new[position : position + block_size]:
+                match = candidate
+                break
+
+        if match is not None:
+            # extend backwards into pending literals, then forwards as far as possible
+            start_new, start_old = position, match
+            while start_new > literal_start and start_old > 0 and new[start_new - 1] == old[start_old - 1]:
+                start_new -= 1
+                start_old -= 1
+            end_new, end_old = position + block_size, match + block_size
+            while end_new < len(new) and end_old < len(old):
+                step = min(4096, len(new) - end_new, len(old) - end_old)
+                if new[end_new : end_new + step] == old[end_old : end_old + step]:
+                    end_new += step
+                    end_old += step
+                    continue
+                while end_new < len(new) and end_old < len(old) and new[end_new] == old[end_old]:
+                    end_new += 1
+                    end_old += 1
+                break
+
+            emit_literal(start_new)
+            length = end_new - start_new
+            while length:
+                # u32 lengths; split very long runs
+                step = min(length, 0xFFFFFFFF)
+                ops.extend(_COPY + _COPY_FORMAT.pack(start_old, step))
+                start_old += step
+                length -= step
+            literal_start = position = end_new
+            checksum = zlib.adler32(new[position : position + block_size]) if len(new) - position >= block_size else None
+            continue
+
+        if position + block_size >= len(new):
+            break
+        # roll the Adler-32 window one byte forward
+        outgoing, incoming = new[position], new[position + block_size]
+        a = checksum & 0xFFFF
+        b = checksum >> 16
+        a = (a - outgoing + incoming) % _MOD_ADLER
+        b = (b - block_size * outgoing + a - 1) % _MOD_ADLER
+        checksum = (b << 16) | a
+        position += 1
+
+    emit_literal(len(new))
+
+    header = json.dumps(
+        {
+            "source_sha256": _sha256(old),
+            "target_sha256": _sha256(new),
+            "target_size": len(new),
+            "block_size": block_size,
+        }
+    ).encode()
+    return MAGIC + _LENGTH_FORMAT.pack(len(header)) + header + lzma.compress(bytes(ops), preset=6)
+
+
+def read_patch_header(patch: bytes) -> dict:
+    if not patch.startswith(MAGIC):
+        raise PatchError("Not a delta patch")
+    (header_length,) = _LENGTH_FORMAT.unpack_from(patch, len(MAGIC))
+    start = len(MAGIC) + _LENGTH_FORMAT.size
+    try:
+        return json.loads(patch[start : start + header_length])
+    except ValueError as exc:
+        raise PatchError("Corrupt patch header") from exc
+
+
+def apply_patch(old: bytes, patch: bytes) -> bytes:
+    """Return the file produced by applying ``patch`` to ``old``.
+
+    Raises
+    ------
+    PatchError
+        ``old`` is not the file the patch was built from, the patch is
+        corrupt, or the result does not match the expected digest.
+    """
+    header = read_patch_header(patch)
+    if _sha256(old) != header["source_sha256"]:
+        raise PatchError("Patch does not apply to this file (source digest mismatch)")
+
+    body_start = len(MAGIC) + _LENGTH_FORMAT.size + _LENGTH_FORMAT.unpack_from(patch, len(MAGIC))[0]
+    try:
+        ops = lzma.decompress(patch[body_start:])
+    except lzma.LZMAError as exc:
+        raise PatchError("Corrupt patch body") from exc
+
+    out = bytearray()
+    position = 0
+    try:
+        while position < len(ops):
+            op = ops[position : position + 1]
+            position += 1
+            if op == _COPY:
+                offset, length = _COPY_FORMAT.unpack_from(ops, position)
+                position += _COPY_FORMAT.size
+                out += old[offset : offset + length]
+            elif op == _INSERT:
+                (length,) = _LENGTH_FORMAT.unpack_from(ops, position)
+                position += _LENGTH_FORMAT.size
+                out += ops[position : position + length]
+                position += length
+            else:
+                raise PatchError(f"Unknown patch operation {op!r}")
+    except struct.error as exc:
+        raise PatchError("Truncated patch body") from exc
+
+    if len(out) != header["target_size"] or _sha256(out) != header["target_sha256"]:
+        raise PatchError("Patched file does not match the expected digest")
+    return bytes(out)
+
+
+def apply_patch_file(source: Path, patch: Path, target: Path) -> Path:
+    """File based :func:`apply_patch`; ``target`` is written atomically."""
+    result = apply_patch(source.read_bytes(), patch.read_bytes())
+    temp_path = target.with_name(target.name + ".tmp")
+    temp_path.write_bytes(result)
+    temp_path.replace(target)
+    return target
+
+
+def main(argv: list[str]) -> int:
+    if len(argv) == 4 and argv[0] == "create":
+        old, new = Path(argv[1]).read_bytes(), Path(argv[2]).read_bytes()
+        patch = create_patch(old, new)
+        Path(argv[3]).write_bytes(patch)
+        print(f"✔ {argv[3]}: {len(patch)} bytes for a {len(new)} byte target ({len(patch) / max(len(new), 1):.1%})")
+        return 0
+    if len(argv) == 4 and argv[0] == "apply":
+        apply_patch_file(Path(argv[1]), Path(argv[2]), Path(argv[3]))
+        print(f"✔ {argv[3]} verified")
+        return 0
+    if argv == ["selftest"]:
+        return _selftest()
+    print(__doc__)
+    return 1
+
+
+def _selftest() -> int:
+    """Round-trip a patch between two local files that share most of their bytes."""
+    import os
+    import random
+    import tempfile
+
+    rng = random.Random(0)
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        old = bytearray(os.urandom(2 * 1024 * 1024))
+        new = bytearray(old)
+        for _ in range(20):
+            offset = rng.randrange(len(new))
+            new[offset : offset + 300] = os.urandom(rng.randrange(100, 500))
+        (root / "old.bin").write_bytes(old)
+        (root / "new.bin").write_bytes(bytes(os.urandom(1000)) + new)
+
+        main(["create", str(root / "old.bin"), str(root / "new.bin"), str(root / "update.patch")])
+        main(["apply", str(root / "old.bin"), str(root / "update.patch"), str(root / "patched.bin")])
+        assert (root / "patched.bin").read_bytes() == (root / "new.bin").read_bytes()
+
+        try:
+            apply_patch_file(root / "new.bin", root / "update.patch", root / "wrong.bin")
+        except PatchError as exc:
+            print(f"✔ rejected wrong source: {exc}")
+        else:
+            raise AssertionError("patch applied to the wrong source")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
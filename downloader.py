@@ -0,0 +1,455 @@
+"""
+Asset Downloader
+================
+
+Resumable, verifiable HTTP downloads for update assets.
+
+* data is streamed in large chunks to a ``<target>.part`` file,
+* an interrupted transfer is resumed with an HTTP ``Range`` request – both
+  across retries and across application restarts,
+* optionally the file is fetched as several ranged segments in parallel,
+* the SHA‑256 digest is computed while streaming and compared with the
+  digest published in the release metadata,
+* progress is reported at most every ``progress_interval`` seconds,
+* bandwidth can be capped with a token bucket shared by all segments, so a
+  background download never competes with the game.
+
+:class:`DownloadWorker` runs a download on a :class:`~worker_framework.Worker`
+thread and reports back through Qt signals.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from logging import Logger
+from pathlib import Path
+from typing import Callable, Optional
+
+import requests
+from PyQt6.QtCore import pyqtSignal
+
+from worker_framework import Worker
+
+CHUNK_SIZE = 1024 * 1024
+ProgressCallback = Callable[[int, int], None]
+
+
+class DownloadError(Exception):
+    pass
+
+
+class DownloadCancelledError(DownloadError):
+    pass
+
+
+class ChecksumMismatchError(DownloadError):
+    pass
+
+
+def parse_sha256_digest(digest: Optional[str]) -> Optional[str]:
+    """Normalise GitHub's ``"sha256:<hex>"`` asset digest (or a bare hex digest)."""
+    if not digest:
+        return None
+    algorithm, _, value = digest.strip().partition(":")
+    if not value:
+        algorithm, value = "sha256", algorithm
+    if algorithm.lower() != "sha256" or len(value) != 64:
+        return None
+    return value.lower()
+
+
+class AssetDownloader:
+    """Downloads a URL to a file with resume, parallel segments and verification.
+
+    Parameters
+    ----------
+    logger
+        App‑wide logger instance.
+    segments
+        Number of ranged requests to run in parallel when the server supports
+        ranges and announces the size.  ``1`` streams sequentially, which is
+        the only mode that can resume across application restarts.
+    max_retries
+        Reconnection attempts per stream after a dropped connection.
+    progress
+        Called with ``(downloaded, total)``; ``total`` is 0 when unknown.
+    should_stop
+        Polled between chunks; returning ``True`` aborts the download but
+        keeps the partial file for a later resume.
+    max_bytes_per_second
+        Cap on the combined throughput of all segments; ``None`` for no cap.
+    """
+
+    def __init__(
+        self,
+        logger: Logger,
+        *,
+        segments: int = 1,
+        chunk_size: int = CHUNK_SIZE,
+        max_retries: int = 5,
+        timeout: tuple[float, float] = (5, 30),
+        progress: Optional[ProgressCallback] = None,
+        progress_interval: float = 0.1,
+        should_stop: Callable[[], bool] = lambda: False,
+        max_bytes_per_second: Optional[int] = None,
+    ) -> None:
+        self._logger = logger
+        self._segments = max(segments, 1)
+        self._throttle = TokenBucket(max_bytes_per_second) if max_bytes_per_second else None
+        # small reads keep a throttled transfer smooth instead of bursty
+        self._chunk_size = min(chunk_size, max(max_bytes_per_second // 4, 16 * 1024)) if max_bytes_per_second else chunk_size
+        self._max_retries = max_retries
+        self._timeout = timeout
+        self._progress = progress
+        self._progress_interval = progress_interval
+        self._should_stop = should_stop
+
+        self._session = requests.Session()
+        self._lock = threading.Lock()
+        self._downloaded = 0
+        self._total = 0
+        self._last_progress = 0.0
+
+    # ------------------------------ public API --------------------------- #
+    def download(self, url: str, target: Path, expected_sha256: Optional[str] = None) -> Path:
+        """Download ``url`` to ``target`` and return ``target``.
+
+        Raises
+        ------
+        ChecksumMismatchError
+            The digest does not match ``expected_sha256``; the partial file is
+            removed so the next attempt starts from scratch.
+        DownloadError
+            The transfer failed after all retries (the partial file is kept).
+        """
+        thread_name = threading.current_thread().name
+        target.parent.mkdir(parents=True, exist_ok=True)
+        part_path = target.with_name(target.name + ".part")
+
+        total, accepts_ranges = self._probe(url)
+        self._total = total
+
+        if self._segments > 1 and total and accepts_ranges:
+            self._logger.info(f"[{thread_name}] Downloading {url} in {self._segments} segments")
+            self._download_segmented(url, part_path, total)
+            digest = self._hash_file(part_path)
+        else:
+            digest = self._download_sequential(url, part_path, accepts_ranges)
+
+        self._report(force=True)
+
+        if expected_sha256 and digest != expected_sha256.lower():
+            part_path.unlink(missing_ok=True)
+            raise ChecksumMismatchError(f"SHA-256 mismatch for {url}: expected {expected_sha256}, got {digest}")
+
+        part_path.replace(target)
+        return target
+
+    # -------------------------- internal utilities ----------------------- #
+    def _probe(self, url: str) -> tuple[int, bool]:
+        try:
+            response = self._session.head(url, allow_redirects=True, timeout=self._timeout)
+        except requests.RequestException:
+            return 0, False
+        if response.status_code != 200:
+            return 0, False
+        total = int(response.headers.get("Content-Length", 0) or 0)
+        return total, response.headers.get("Accept-Ranges", "").lower() == "bytes"
+
+    def _download_sequential(self, url: str, part_path: Path, accepts_ranges: bool) -> str:
+        hasher = hashlib.sha256()
+        offset = 0
+        if accepts_ranges and part_path.exists():
+            offset = self._hash_into(part_path, hasher)
+            self._logger.info(f"[{threading.current_thread().name}] Resuming download at {offset} bytes")
+        elif part_path.exists():
+            part_path.unlink()
+        self._downloaded = offset
+
+        attempt = 0
+        while True:
+            try:
+                with open(part_path, "ab") as fp:
+                    offset = self._stream_range(url, fp, offset, None, hasher)
+                if self._total and offset < self._total:
+                    raise requests.ConnectionError(f"Connection closed at {offset} of {self._total} bytes")
+                return hasher.hexdigest()
+            except _RestartFromScratch:
+                hasher = hashlib.sha256()
+                offset = self._downloaded = 0
+                part_path.unlink(missing_ok=True)
+            except (requests.RequestException, OSError) as exc:
+                attempt += 1
+                if attempt > self._max_retries:
+                    raise DownloadError(f"Download of {url} failed after {attempt} attempts: {exc}") from exc
+                offset = part_path.stat().st_size if part_path.exists() else 0
+                if not accepts_ranges:
+                    # cannot resume, start over
+                    hasher, offset = hashlib.sha256(), 0
+                    part_path.unlink(missing_ok=True)
+                self._downloaded = offset
+                self._logger.warning(
+                    f"[{threading.current_thread().name}] Download interrupted ({exc}), "
+                    f"retrying from {offset} bytes ({attempt}/{self._max_retries})"
+                )
+                time.sleep(min(2**attempt, 30))
+
+    def _download_segmented(self, url: str, part_path: Path, total: int) -> None:
+        # preallocate so every segment can write at its own offset
+        with open(part_path, "wb") as fp:
+            fp.truncate(total)
+        self._downloaded = 0
+
+        segment_size = -(-total // self._segments)
+        ranges = [(start, min(start + segment_size, total) - 1) for start in range(0, total, segment_size)]
+
+        def fetch(first: int, last: int) -> None:
+            offset, attempt = first, 0
+            with open(part_path, "r+b") as fp:
+                while offset <= last:
+                    try:
+                        fp.seek(offset)
+                        offset = self._stream_range(url, fp, offset, last, None)
+                    except (requests.RequestException, OSError) as exc:
+                        attempt += 1
+                        if attempt > self._max_retries:
+                            raise DownloadError(f"Segment {first}-{last} of {url} failed: {exc}") from exc
+                        time.sleep(min(2**attempt, 30))
+
+        with ThreadPoolExecutor(max_workers=self._segments, thread_name_prefix="download-segment") as pool:
+            for future in [pool.submit(fetch, first, last) for first, last in ranges]:
+                future.result()
+
+    def _stream_range(self, url: str, fp, offset: int, last: Optional[int], hasher) -> int:
+        """Stream ``[offset, last]`` (or ``offset`` to the end) into ``fp``; returns the next offset."""
+        headers = {}
+        if offset or last is not None:
+            headers["Range"] = f"bytes={offset}-{'' if last is None else last}"
+
+        with self._session.get(url, headers=headers, stream=True, timeout=self._timeout) as response:
+            if offset and last is None and response.status_code == 416:
+                # the partial file is already complete; verification decides if it is usable
+                return offset
+            if offset and response.status_code == 200:
+                # server ignored the range
+                if last is not None:
+                    raise DownloadError("Server does not honour range requests")
+                raise _RestartFromScratch()
+            response.raise_for_status()
+
+            for chunk in response.iter_content(chunk_size=self._chunk_size):
+                if self._should_stop():
+                    raise DownloadCancelledError("Download cancelled")
+                if not chunk:  # keep-alive
+                    continue
+                if self._throttle is not None:
+                    self._throttle.consume(len(chunk), self._should_stop)
+                fp.write(chunk)
+                if hasher is not None:
+                    hasher.update(chunk)
+                offset += len(chunk)
+                with self._lock:
+                    self._downloaded += len(chunk)
+                self._report()
+
+        if last is not None and offset <= last:
+            raise requests.ConnectionError(f"Connection closed at {offset} of {last + 1} bytes")
+        return offset
+
+    def _report(self, force: bool = False) -> None:
+        if self._progress is None:
+            return
+        now = time.monotonic()
+        if not force and now - self._last_progress < self._progress_interval:
+            return
+        self._last_progress = now
+        self._progress(self._downloaded, self._total)
+
+    def _hash_into(self, path: Path, hasher) -> int:
+        size = 0
+        with open(path, "rb") as fp:
+            while chunk := fp.read(self._chunk_size):
+                hasher.update(chunk)
+                size += len(chunk)
+        return size
+
+    def _hash_file(self, path: Path) -> str:
+        hasher = hashlib.sha256()
+        self._hash_into(path, hasher)
+        return hasher.hexdigest()
+
+
+class TokenBucket:
+    """Thread-safe token bucket limiting throughput to ``rate`` bytes/s.
+
+    Up to ``burst`` bytes may pass at once after an idle period.
+    """
+
+    def __init__(self, rate: float, burst: Optional[float] = None) -> None:
+        self.rate = float(rate)
+        self.burst = float(burst if burst is not None else rate)
+        self._tokens = self.burst
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def consume(self, amount: int, should_stop: Callable[[], bool] = lambda: False) -> None:
+        """Block until ``amount`` bytes may pass (or ``should_stop`` returns ``True``)."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            # go into debt so large chunks are paced rather than rejected
+            self._tokens -= amount
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+
+        deadline = time.monotonic() + wait
+        while (remaining := deadline - time.monotonic()) > 0 and not should_stop():
+            time.sleep(min(remaining, 0.25))
+
+
+class _RestartFromScratch(Exception):
+    """The server answered a resume request with the full body."""
+
+
+class DownloadWorker(Worker):
+    """Runs an :class:`AssetDownloader` on its own thread.
+
+    Signals:
+        progress: Emitted with the completed percentage (throttled)
+        download_finished: Emitted with the path of the verified file
+        download_failed: Emitted with a human readable reason
+    """
+
+    progress = pyqtSignal(int)
+    download_finished = pyqtSignal(str)
+    download_failed = pyqtSignal(str)
+
+    def __init__(
+        self,
+        logger: Logger,
+        url: str,
+        target: Path,
+        *,
+        expected_sha256: Optional[str] = None,
+        checksum_url: Optional[str] = None,
+        segments: int = 1,
+        max_bytes_per_second: Optional[int] = None,
+        post_process: Optional[Callable[[Path], Path]] = None,
+        name: str = "update-download-worker",
+    ):
+        super().__init__(logger, name)
+        self._url = url
+        self._target = target
+        self._expected_sha256 = expected_sha256
+        self._checksum_url = checksum_url
+        self._segments = segments
+        self._max_bytes_per_second = max_bytes_per_second
+        # runs on this worker's thread after verification (e.g. applying a delta patch)
+        self._post_process = post_process
+        self._last_percent = -1
+
+    def _run(self):
+        downloader = AssetDownloader(
+            self._logger,
+            segments=self._segments,
+            progress=self._on_progress,
+            should_stop=lambda: self.is_stopping,
+            max_bytes_per_second=self._max_bytes_per_second,
+        )
+        try:
+            expected_sha256 = self._expected_sha256 or self._fetch_checksum()
+            if not expected_sha256:
+                self._logger.warning(f"[{self._thread_name()}] No SHA-256 published for {self._url}, not verifying")
+            path = downloader.download(self._url, self._target, expected_sha256)
+            if self._post_process is not None:
+                path = self._post_process(path)
+        except DownloadCancelledError:
+            self._logger.info(f"[{self._thread_name()}] Download cancelled, partial file kept for resume")
+        except (DownloadError, ValueError, OSError) as exc:
+            self._logger.error(f"[{self._thread_name()}] {exc}")
+            self.download_failed.emit(str(exc))
+        else:
+            self.download_finished.emit(str(path))
+        self.finished.emit()
+
+    def _fetch_checksum(self) -> Optional[str]:
+        """Read a ``<asset>.sha256`` file (``sha256sum`` format) if one was published."""
+        if not self._checksum_url:
+            return None
+        try:
+            response = requests.get(self._checksum_url, timeout=(5, 30))
+            response.raise_for_status()
+        except requests.RequestException as exc:
+            raise DownloadError(f"Failed to fetch checksum from {self._checksum_url}: {exc}") from exc
+        return parse_sha256_digest(response.text.split()[0] if response.text.strip() else None)
+
+    def _on_progress(self, downloaded: int, total: int) -> None:
+        if not total:
+            return
+        percent = int(downloaded * 100 / total)
+        if percent != self._last_percent:
+            self._last_percent = percent
+            self.progress.emit(percent)
+
+
+# --------------------------------------------------------------------- #
+# Quick self‑test — run `python downloader.py` to download from a local
+# stand-in server that supports ranges and drops the first connection
+# half-way through.
+# --------------------------------------------------------------------- #
+if __name__ == "__main__":  # pragma: no cover
+    import os
+    import re
+    import tempfile
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    from logger import logger
+
+    payload = os.urandom(5 * CHUNK_SIZE + 123)
+    payload_sha256 = hashlib.sha256(payload).hexdigest()
+    dropped = threading.Event()
+
+    class RangedAsset(BaseHTTPRequestHandler):
+        def _send(self, body_only: bool) -> None:
+            start, end = 0, len(payload) - 1
+            match = re.match(r"bytes=(\d+)-(\d*)", self.headers.get("Range", ""))
+            if match:
+                start = int(match.group(1))
+                end = int(match.group(2)) if match.group(2) else end
+            self.send_response(206 if match else 200)
+            self.send_header("Accept-Ranges", "bytes")
+            self.send_header("Content-Length", str(end - start + 1))
+            self.end_headers()
+            if not body_only:
+                return
+            body = payload[start : end + 1]
+            if not dropped.is_set() and not match:
+                dropped.set()
+                self.wfile.write(body[: len(body) // 2])
+                return  # connection closes early
+            self.wfile.write(body)
+
+        def do_HEAD(self):
+            self._send(body_only=False)
+
+        def do_GET(self):
+            self._send(body_only=True)
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), RangedAsset)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_port}/BazaarBuddy.exe"
+    out_dir = Path(tempfile.mkdtemp())
+
+    for segments in (1, 4):
+        target = AssetDownloader(
+            logger,
+            segments=segments,
+            progress=lambda done, total: print(f"  {done}/{total}"),
+        ).download(url, out_dir / f"segments_{segments}" / "BazaarBuddy.exe", payload_sha256)
+        print(f"segments={segments}: verified {target} ({target.stat().st_size} bytes)")
+
+    server.shutdown()
+    server.server_close()
@@ -0,0 +1,210 @@
+"""
+Entity Search
+=============
+
+Instant search over the entity catalogue for the overlay's search bar.
+
+The index is built once per catalogue (see
+:py:meth:`message_builder.MessageBuilder.search`) and answers a keystroke
+without scanning the catalogue:
+
+* a **prefix trie** over whole names – "fang" finds *Fang*, *Fanged Inglet*,
+* a **token index** – every query word must start a word of the name, in
+  any order – "inglet fa" finds *Fanged Inglet*,
+* a **typo-tolerant fallback**, used only when nothing else matches: query
+  words within one edit of (the start of) a name's word, found through a
+  deletion-neighbourhood index – "shild" finds *Z-Shield*, *Void Shield*…
+
+Results are ranked exact name, name prefix, word match, typo match, then
+shorter names first.
+"""
+
+from __future__ import annotations
+
+import bisect
+import re
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+_NON_WORD = re.compile(r"[^0-9a-z]+")
+
+# rank of each kind of match; lower is better
+EXACT, PREFIX, WORDS, TYPO = range(4)
+
+MIN_FUZZY_LENGTH = 3  # shorter words are too ambiguous to correct
+NODE_RESULTS = 32  # best entities remembered per trie node
+
+
+def normalize(text: str) -> str:
+    """Lower-case words without punctuation: "Hunter's Boots" → "hunters boots"."""
+    text = text.lower().replace("'", "").replace("’", "")
+    return " ".join(_NON_WORD.sub(" ", text).split())
+
+
+def _deletions(word: str) -> set[str]:
+    return {word[:i] + word[i + 1 :] for i in range(len(word))}
+
+
+def _within_one_edit(a: str, b: str) -> bool:
+    """One insertion, deletion, substitution or adjacent transposition at most."""
+    if abs(len(a) - len(b)) > 1:
+        return False
+    start = 0
+    while start < min(len(a), len(b)) and a[start] == b[start]:
+        start += 1
+    a, b = a[start:], b[start:]
+    if not a or not b:
+        return True
+    return (
+        a[1:] == b[1:]
+        or a[1:] == b
+        or a == b[1:]
+        or (len(a) > 1 and len(b) > 1 and a[0] == b[1] and a[1] == b[0] and a[2:] == b[2:])
+    )
+
+
+class _TrieNode:
+    __slots__ = ("children", "ids")
+
+    def __init__(self) -> None:
+        self.children: Dict[str, _TrieNode] = {}
+        self.ids: List[int] = []
+
+
+class EntitySearch:
+    """Ranked search over entities by name (and ``alt_text``).
+
+    Parameters
+    ----------
+    entities
+        The catalogue, as loaded by :class:`~message_builder.MessageBuilder`.
+    """
+
+    def __init__(self, entities: Sequence[Dict[str, Any]]) -> None:
+        self._entities = [entity for entity in entities if entity.get("display_message")]
+        # shorter, then alphabetical: the tie-break inside every rank
+        self._order = sorted(range(len(self._entities)), key=lambda i: (len(self._entities[i]["name"]), self._entities[i]["name"]))
+        self._position = {entity_id: position for position, entity_id in enumerate(self._order)}
+
+        self._names: Dict[int, List[str]] = {}
+        self._exact: Dict[str, List[int]] = {}
+        self._trie = _TrieNode()
+        self._token_ids: Dict[str, set[int]] = {}
+        for entity_id in self._order:
+            entity = self._entities[entity_id]
+            names = [normalize(name) for name in [entity["name"], *entity.get("alt_text", [])]]
+            self._names[entity_id] = names = [name for name in dict.fromkeys(names) if name]
+            for name in names:
+                self._exact.setdefault(name, []).append(entity_id)
+                self._insert(name, entity_id)
+                for token in name.split():
+                    self._token_ids.setdefault(token, set()).add(entity_id)
+        self._tokens = sorted(self._token_ids)
+        self._fuzzy = self._build_fuzzy_index()
+
+    def __len__(self) -> int:
+        return len(self._entities)
+
+    # ------------------------------ public API --------------------------- #
+    def search(self, query: str, limit: int = 10) -> List[Dict[str, Any]]:
+        """Best ``limit`` entities for ``query``, best first."""
+        query = normalize(query)
+        if not query:
+            return []
+
+        ranks: Dict[int, int] = {}
+        for entity_id in self._exact.get(query, ()):
+            ranks[entity_id] = EXACT
+        for entity_id in self._prefix(query):
+            ranks.setdefault(entity_id, PREFIX)
+        words = query.split()
+        for entity_id in self._word_matches(words, fuzzy=False):
+            ranks.setdefault(entity_id, WORDS)
+        if not ranks:
+            for entity_id in self._word_matches(words, fuzzy=True):
+                ranks.setdefault(entity_id, TYPO)
+
+        best = sorted(ranks, key=lambda entity_id: (ranks[entity_id], self._position[entity_id]))
+        return [self._entities[entity_id] for entity_id in best[:limit]]
+
+    # -------------------------- internal utilities ----------------------- #
+    def _insert(self, name: str, entity_id: int) -> None:
+        # entities arrive in rank order, so each node keeps its best NODE_RESULTS
+        node = self._trie
+        for char in name:
+            node = node.children.setdefault(char, _TrieNode())
+            if len(node.ids) < NODE_RESULTS and entity_id not in node.ids:
+                node.ids.append(entity_id)
+
+    def _prefix(self, query: str) -> List[int]:
+        node = self._trie
+        for char in query:
+            node = node.children.get(char)  # type: ignore[assignment]
+            if node is None:
+                return []
+        return node.ids
+
+    def _word_matches(self, words: List[str], *, fuzzy: bool) -> set[int]:
+        matches: Optional[set[int]] = None
+        for word in words:
+            tokens = self._fuzzy_tokens(word) if fuzzy else self._prefixed_tokens(word)
+            ids: set[int] = set().union(*(self._token_ids[token] for token in tokens))
+            matches = ids if matches is None else matches & ids
+            if not matches:
+                return set()
+        return matches or set()
+
+    def _prefixed_tokens(self, prefix: str) -> Iterable[str]:
+        start = bisect.bisect_left(self._tokens, prefix)
+        end = bisect.bisect_left(self._tokens, prefix + "￿", start)
+        return self._tokens[start:end]
+
+    def _fuzzy_tokens(self, word: str) -> set[str]:
+        if len(word) < MIN_FUZZY_LENGTH:
+            return set(self._prefixed_tokens(word))
+        candidates: set[str] = set()
+        for variant in {word, *_deletions(word)}:
+            candidates.update(self._fuzzy.get(variant, ()))
+        # a shared variant can also mean two edits (one deletion on each side)
+        return {
+            token
+            for token in candidates
+            if any(_within_one_edit(word, token[:length]) for length in (len(word) - 1, len(word), len(word) + 1))
+        }
+
+    def _build_fuzzy_index(self) -> Dict[str, set[str]]:
+        # every prefix (of at least MIN_FUZZY_LENGTH) of every token, and each
+        # with one character deleted: words within one edit share an entry
+        index: Dict[str, set[str]] = {}
+        for token in self._tokens:
+            for length in range(MIN_FUZZY_LENGTH, len(token) + 1):
+                prefix = token[:length]
+                for variant in {prefix, *_deletions(prefix)}:
+                    index.setdefault(variant, set()).add(token)
+        return index
+
+
+# --------------------------------------------------------------------- #
+# Quick self‑test — run `python -m entity_search [query…]`
+# --------------------------------------------------------------------- #
+if __name__ == "__main__":  # pragma: no cover
+    import sys
+    import time
+    from pathlib import Path
+
+    from message_builder import load_catalogue
+
+    catalogue = load_catalogue(Path(__file__).parent / "entities.json")
+
+    started = time.perf_counter()
+    engine = EntitySearch(catalogue)
+    print(f"indexed {len(engine)} entities in {(time.perf_counter() - started) * 1000:.1f} ms")
+
+    for query in sys.argv[1:] or ["fang", "inglet fa", "shild", "hunetrs", "x"]:
+        # every keystroke, as the search bar sees it
+        timings = []
+        for end in range(1, len(query) + 1):
+            started = time.perf_counter()
+            results = engine.search(query[:end])
+            timings.append(time.perf_counter() - started)
+        names = [entity["name"] for entity in results][:5]
+        print(f"{query!r:14} max {max(timings) * 1000:.3f} ms/keystroke → {names}")
@@ -1,10 +1,14 @@
 from abc import ABC, abstractmethod
-from typing import Protocol, TypeVar, Generic, Dict, Any, Optional
+from typing import Protocol, TypeVar, Generic, Dict, Any, Optional, Callable
 from pathlib import Path
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from datetime import datetime
+from logging import Logger
+import atexit
 import json
 import os
+import threading
+import time
 from enum import Enum
 
 from configuration import Configuration
@@ -14,6 +18,9 @@ class FileType(Enum):
     """Enumeration of supported file types."""
 
     CONFIG = "config"
+    RELEASE_CACHE = "release_cache"
+    CATALOGUE = "catalogue"
+    PENDING_UPDATE = "pending_update"
 
 
 class FileData(BaseModel):
@@ -49,8 +56,48 @@ class ConfigData(FileData):
         self.last_updated = datetime.now()
 
 
+class ReleaseCacheData(FileData):
+    """Last known release metadata and the validators to revalidate it."""
+
+    url: Optional[str] = None
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    release: Dict[str, Any] = {}
+    fetched_at: Optional[datetime] = None
+
+
+class CatalogueData(FileData):
+    """State of the hot-updated entity catalogue stored next to it."""
+
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    checked_at: Optional[datetime] = None
+    version: Optional[str] = None  # None while the bundled catalogue is in use
+    sha256: Optional[str] = None
+    client_version: Optional[str] = None
+    installed_at: Optional[datetime] = None
+
+
+class PendingUpdateData(FileData):
+    """A verified update downloaded in the background, installed on next launch."""
+
+    tag_name: str
+    path: str
+    size: int
+    sha256: Optional[str] = None
+    downloaded_at: datetime = Field(default_factory=datetime.now)
+
+
 T = TypeVar("T", bound=FileData)
 
+# Data model stored by each file type
+FILE_DATA_CLASSES: Dict[FileType, type[FileData]] = {
+    FileType.CONFIG: ConfigData,
+    FileType.RELEASE_CACHE: ReleaseCacheData,
+    FileType.CATALOGUE: CatalogueData,
+    FileType.PENDING_UPDATE: PendingUpdateData,
+}
+
 
 class FileWriterProtocol(Protocol[T]):
     """Protocol for file writers that handle specific data types."""
@@ -108,6 +155,173 @@ class BaseFileWriter(ABC, Generic[T]):
             return False
 
 
+MAX_RETRY_DELAY_S = 300.0
+
+
+class ConfigStore(Generic[T]):
+    """In-memory state persisted through a :class:`BaseFileWriter`.
+
+    The file is read once; afterwards :py:meth:`update` only changes the
+    in-memory model and schedules a write.  A background thread writes once
+    the state has been quiet for ``debounce_s`` (or at the latest
+    ``max_delay_s`` after the first pending change), so a burst of updates
+    costs a single write.  A failed write is retried ``max_delay_s`` later,
+    the delay doubling on every further failure up to
+    ``MAX_RETRY_DELAY_S`` (a full disk or a read-only file must not spin
+    the thread), and is logged once per streak of failures.
+    :py:meth:`close` flushes pending changes; it is also registered with
+    :mod:`atexit`.
+
+    Parameters
+    ----------
+    file_writer
+        Writer for the backing file.
+    default
+        Factory for the state when the file is missing or unreadable.
+    """
+
+    def __init__(
+        self,
+        file_writer: BaseFileWriter[T],
+        default: Callable[[], T],
+        *,
+        debounce_s: float = 1.0,
+        max_delay_s: float = 5.0,
+        logger: Optional[Logger] = None,
+    ):
+        self._file_writer = file_writer
+        self._default = default
+        self._debounce_s = debounce_s
+        self._max_delay_s = max_delay_s
+        self._logger = logger
+
+        self._data: Optional[T] = None
+        self._condition = threading.Condition()
+        self._write_lock = threading.Lock()
+        self._dirty_since: Optional[float] = None
+        self._last_update = 0.0
+        self._retry_at: Optional[float] = None  # no write before this after a failure
+        self._retry_delay_s = 0.0  # current backoff; 0 while writes succeed
+        self._closed = False
+        self._thread: Optional[threading.Thread] = None
+
+        # metrics
+        self.updates = 0
+        self.writes = 0
+        self.failed_writes = 0
+        self.last_write_s = 0.0
+
+        atexit.register(self.close)
+
+    @property
+    def data(self) -> T:
+        """Current state; treat as read-only and change it through :py:meth:`update`."""
+        with self._condition:
+            return self._load()
+
+    def update(self, mutate: Callable[[T], None]) -> None:
+        """Apply ``mutate`` to the state and schedule a write."""
+        with self._condition:
+            mutate(self._load())
+            self.updates += 1
+            now = time.monotonic()
+            self._last_update = now
+            if self._dirty_since is None:
+                self._dirty_since = now
+            if not self._closed and self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._flush_loop, name=f"config-store-{self._file_writer.file_path.stem}", daemon=True
+                )
+                self._thread.start()
+            self._condition.notify()
+            closed = self._closed
+        if closed:
+            # no background thread after close(); write straight away
+            self.flush()
+
+    def flush(self) -> bool:
+        """Write pending changes now; returns ``False`` if the write failed."""
+        with self._write_lock:
+            with self._condition:
+                if self._dirty_since is None or self._data is None:
+                    return True
+                snapshot = self._data.model_copy(deep=True)
+                self._dirty_since = None
+
+            started = time.perf_counter()
+            ok = self._file_writer.write(snapshot)
+            self.last_write_s = time.perf_counter() - started
+            with self._condition:
+                failures_before = self.failed_writes
+                if ok:
+                    self.writes += 1
+                    streak_ended = self._retry_delay_s > 0
+                    self._retry_at, self._retry_delay_s = None, 0.0
+                else:
+                    self.failed_writes += 1
+                    first_failure = self._retry_delay_s == 0
+                    self._retry_delay_s = min(max(self._retry_delay_s * 2, self._max_delay_s), MAX_RETRY_DELAY_S)
+                    self._retry_at = time.monotonic() + self._retry_delay_s
+                    if self._dirty_since is None:
+                        self._dirty_since = time.monotonic()
+            if self._logger and ok and streak_ended:
+                self._logger.info(
+                    f"[{threading.current_thread().name}] Wrote {self._file_writer.file_path} again "
+                    f"({failures_before} failed writes so far)"
+                )
+            elif self._logger and not ok and first_failure:
+                self._logger.warning(
+                    f"[{threading.current_thread().name}] Failed to write {self._file_writer.file_path}, "
+                    f"retrying with backoff"
+                )
+            return ok
+
+    def close(self) -> None:
+        """Flush pending changes and stop the background thread."""
+        with self._condition:
+            if self._closed:
+                return
+            self._closed = True
+            self._condition.notify()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+        self.flush()
+        if self._logger:
+            self._logger.info(f"[{threading.current_thread().name}] {self._file_writer.file_path.name}: {self.stats()}")
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "updates": self.updates,
+            "writes": self.writes,
+            "coalesced": max(self.updates - self.writes - self.failed_writes, 0),
+            "failed_writes": self.failed_writes,
+            "last_write_ms": round(self.last_write_s * 1000, 2),
+        }
+
+    # -------------------------- internal utilities ----------------------- #
+    def _load(self) -> T:
+        if self._data is None:
+            self._data = self._file_writer.read() or self._default()
+        return self._data
+
+    def _flush_loop(self) -> None:
+        while True:
+            with self._condition:
+                while self._dirty_since is None and not self._closed:
+                    self._condition.wait()
+                if self._closed:
+                    return
+                # wait for a quiet period, bounded so continuous updates still get written
+                now = time.monotonic()
+                deadline = min(self._last_update + self._debounce_s, self._dirty_since + self._max_delay_s)
+                if self._retry_at is not None:
+                    deadline = max(deadline, self._retry_at)
+                if now < deadline:
+                    self._condition.wait(deadline - now)
+                    continue
+            self.flush()
+
+
 class BaseFileSystem(ABC):
     """Base abstract class for file system operations."""
 
@@ -186,6 +400,9 @@ class MacFileSystem(BaseFileSystem):
 
         return {
             FileType.CONFIG: app_support / "config.json",
+            FileType.RELEASE_CACHE: app_support / "release_cache.json",
+            FileType.CATALOGUE: app_support / "catalogue" / "catalogue.json",
+            FileType.PENDING_UPDATE: app_support / "updates" / "pending.json",
         }
 
     def get_file_writer(self, file_type: FileType, filename: Optional[str] = None) -> BaseFileWriter:
@@ -195,7 +412,7 @@ class MacFileSystem(BaseFileSystem):
         else:
             file_path = self.get_default_paths()[file_type]
 
-        return MacFileWriter(file_path, ConfigData)
+        return MacFileWriter(file_path, FILE_DATA_CLASSES[file_type])
 
 
 class WindowsFileWriter(BaseFileWriter[T]):
@@ -244,6 +461,9 @@ class WindowsFileSystem(BaseFileSystem):
 
         return {
             FileType.CONFIG: app_data / "config.json",
+            FileType.RELEASE_CACHE: app_data / "release_cache.json",
+            FileType.CATALOGUE: app_data / "catalogue" / "catalogue.json",
+            FileType.PENDING_UPDATE: app_data / "updates" / "pending.json",
         }
 
     def get_file_writer(self, file_type: FileType, filename: Optional[str] = None) -> BaseFileWriter:
@@ -253,4 +473,4 @@ class WindowsFileSystem(BaseFileSystem):
         else:
             file_path = self.get_default_paths()[file_type]
 
-        return WindowsFileWriter(file_path, ConfigData)
+        return WindowsFileWriter(file_path, FILE_DATA_CLASSES[file_type])
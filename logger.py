@@ -1,27 +1,135 @@
 import sys
+import atexit
+import queue
+import threading
+import time
 import logging
-from logging.handlers import RotatingFileHandler
+from logging.handlers import RotatingFileHandler, QueueHandler, QueueListener
 from pathlib import Path
 
 LOG_FILE = Path(__file__).with_name("app.log")
+RATE_LIMIT_WINDOW_S = 5.0
 
 logger = logging.getLogger()
 logger.setLevel(logging.INFO)
 
+fmt = logging.Formatter("%(asctime)s %(levelname)-8s %(message)s")
+
+
+class RateLimitFilter(logging.Filter):
+    """Lets each message key through at most once per ``window`` seconds.
+
+    The key is the record's ``rate_key`` attribute if one was passed via
+    ``extra=``, otherwise the *unformatted* message template, so
+    ``logger.info("[%s] parsed text: %s", thread, text)`` is limited as one
+    message no matter what the arguments are.  Suppressed repeats are
+    counted and reported on the next record that gets through, e.g.
+    ``No image captured (×340 in last 5s)``; keys not seen for a whole
+    window are dropped, and the last repeat they suppressed is handed to
+    ``sink`` with its count so bursts that stop are still reported.
+    Warnings and errors are never limited, nor are records logged with
+    ``extra={"rate_limited": False}`` (redirected ``print`` output).
+    """
+
+    def __init__(self, window: float = RATE_LIMIT_WINDOW_S, sink=None):
+        super().__init__()
+        self.window = window
+        self._sink = sink
+        self._lock = threading.Lock()
+        # key -> [window start, suppressed count, last suppressed record]
+        self._state: dict[object, list] = {}
+        self._pruned_at = time.monotonic()
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno >= logging.WARNING or not getattr(record, "rate_limited", True):
+            return True
+
+        key = getattr(record, "rate_key", None)
+        if key is None:
+            if not isinstance(record.msg, str):
+                return True
+            key = (record.levelno, record.msg)
+        now = time.monotonic()
+        with self._lock:
+            expired = self._prune(now) if now - self._pruned_at >= self.window else []
+            state = self._state.get(key)
+            if state is not None and now - state[0] < self.window:
+                state[1] += 1
+                state[2] = record
+                suppressed = True
+            else:
+                self._state[key] = [now, 0, None]
+                suppressed = False
+        self._report(expired, now)
+
+        if suppressed:
+            return False
+        if state is not None and state[1]:
+            record.msg = f"{record.msg} (×{state[1] + 1} in last {now - state[0]:.0f}s)"
+        return True
+
+    def flush(self) -> None:
+        """Report every pending suppressed count, e.g. at exit."""
+        now = time.monotonic()
+        with self._lock:
+            expired = [state for state in self._state.values() if state[1]]
+            self._state.clear()
+        self._report(expired, now)
+
+    def _prune(self, now: float) -> list:
+        """Drop keys whose window has passed; return those that suppressed something."""
+        self._pruned_at = now
+        stale = [key for key, state in self._state.items() if now - state[0] >= self.window]
+        return [state for state in map(self._state.pop, stale) if state[1]]
+
+    def _report(self, expired: list, now: float) -> None:
+        if self._sink is None:
+            return
+        for start, count, last in expired:
+            summary = logging.makeLogRecord(last.__dict__)
+            summary.msg = f"{last.msg} (×{count} in last {now - start:.0f}s)"
+            self._sink(summary)
+
+
+class DeferredQueueHandler(QueueHandler):
+    """Queue handler that hands the raw record to the listener thread.
+
+    The stock :class:`QueueHandler` formats every record on the calling
+    thread; here merging of ``args`` and formatting happen on the listener
+    thread so the hot path only pays for a queue put.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
 # 1️⃣  File handler – always safe
 file_handler = RotatingFileHandler(LOG_FILE, maxBytes=5 * 1024 * 1024, backupCount=3, encoding="utf-8")
-fmt = logging.Formatter("%(asctime)s %(levelname)-8s %(message)s")
 file_handler.setFormatter(fmt)
-logger.addHandler(file_handler)
+handlers: list[logging.Handler] = [file_handler]
 
 # 2️⃣  Console handler – only if stdout really exists
 if sys.__stdout__ is not None:  # works when you build *without* --noconsole
     console_handler = logging.StreamHandler(stream=sys.__stdout__)
     console_handler.setFormatter(fmt)
-    logger.addHandler(console_handler)
+    handlers.append(console_handler)
+
+# 3️⃣  Everything is written by a single background thread fed through a queue
+log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+queue_handler = DeferredQueueHandler(log_queue)
+rate_limit = RateLimitFilter(sink=log_queue.put)
+queue_handler.addFilter(rate_limit)
+logger.addHandler(queue_handler)
+
+listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+listener.start()
+# drain whatever is still queued when the interpreter exits (atexit runs
+# last-registered first, so pending suppressed counts are queued before that)
+atexit.register(listener.stop)
+atexit.register(rate_limit.flush)
 
 
-# 3️⃣  Helper that redirects print(...) to the logger
+# 4️⃣  Helper that redirects print(...) to the logger
 class LoggerWriter:
     def __init__(self, level):
         self.level = level
@@ -29,7 +137,8 @@ class LoggerWriter:
     def write(self, msg):
         msg = msg.rstrip("\n")
         if msg:
-            logger.log(self.level, msg)
+            # printed lines are output (tables, reports), not a log stream to thin out
+            logger.log(self.level, msg, extra={"rate_limited": False})
 
     def flush(self):  # required for file-like objects
         pass
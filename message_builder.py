@@ -2,12 +2,101 @@
 from __future__ import annotations
 
 import json
+from array import array
 from logging import Logger
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Sequence, Tuple
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
 import re
 
 from configuration import Configuration
+from entity_search import EntitySearch
+
+_TIERS = ("Bronze ", "Silver ", "Gold ", "Diamond ", "Legendary ")
+_SEPARATOR = "<br>"  # messages are interned line by line
+
+
+class InternedEntity(dict):
+    """A catalogue entity whose message is kept as references into a shared fragment table.
+
+    Monster messages repeat their items' lines, so the catalogue stores each
+    distinct line once.  ``entity["display_message"]`` (and ``.get``) still
+    work: the message is assembled when it is read, from the table the
+    entity was loaded with, so it stays consistent across a
+    :py:meth:`MessageBuilder.reload`.
+    """
+
+    __slots__ = ("_fragments",)
+
+    def __init__(self, fields: Dict[str, Any], fragments: Sequence[str]) -> None:
+        super().__init__(fields)
+        self._fragments = fragments
+
+    def __getitem__(self, key: str) -> Any:
+        if key == "display_message":
+            if "message" not in self:
+                raise KeyError(key)
+            return self._assemble()
+        return super().__getitem__(key)
+
+    def __contains__(self, key: object) -> bool:
+        return super().__contains__("message" if key == "display_message" else key)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        if key == "display_message":
+            return self._assemble() if "message" in self else default
+        return super().get(key, default)
+
+    def _assemble(self) -> str:
+        fragments = self._fragments
+        return _SEPARATOR.join([fragments[ref] for ref in super().__getitem__("message")])
+
+
+def load_catalogue(path: Path) -> List[Dict[str, Any]]:
+    """Entities of the catalogue at *path*, as :class:`InternedEntity` objects.
+
+    Reads both formats: a list of entities with their ``display_message``
+    (format 1), and ``{"fragments": [...], "entities": [...]}`` where each
+    message is a list of fragment indices (format 2, see
+    ``client-data/entity_processor.py``).
+    """
+    try:
+        with path.open("r", encoding="utf-8") as fp:
+            data: Any = json.load(fp)
+    except FileNotFoundError as exc:
+        raise FileNotFoundError(f"entities file not found at {path!s}") from exc
+    if isinstance(data, list):
+        return _intern(data)
+    if not isinstance(data, dict) or not isinstance(data.get("entities"), list) or not isinstance(data.get("fragments"), list):
+        raise ValueError(f"entities JSON must contain a list or a catalogue, got {type(data).__name__}")
+    fragments: List[str] = data["fragments"]
+    entities = []
+    for entity in data["entities"]:
+        if "message" in entity:
+            message = array("I", entity["message"])
+            if message and max(message) >= len(fragments):
+                raise ValueError(f"entity {entity.get('name')!r} refers to a missing fragment")
+            entity["message"] = message
+        entities.append(InternedEntity(entity, fragments))
+    return entities
+
+
+def _intern(entities: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    fragments: List[str] = []
+    index: Dict[str, int] = {}
+    interned = []
+    for entity in entities:
+        fields = dict(entity)
+        message = fields.pop("display_message", None)
+        if message is not None:
+            refs = array("I")
+            for line in message.split(_SEPARATOR):
+                if line not in index:
+                    index[line] = len(fragments)
+                    fragments.append(line)
+                refs.append(index[line])
+            fields["message"] = refs
+        interned.append(InternedEntity(fields, fragments))
+    return interned
 
 
 class MessageBuilder:
@@ -22,20 +111,48 @@ class MessageBuilder:
     threshold
         Minimum fuzzy‑match score (0‑100) required for a keyword to be
         considered a hit.
+    catalogue_path
+        Entity catalogue to load; defaults to the bundled ``entities.json``.
+        A hot‑updated catalogue is passed in here (see
+        :class:`~catalogue_updater.CatalogueStore`).
     """
 
-    def __init__(self, configuration: Configuration, logger: Logger, threshold: int = 90) -> None:
+    def __init__(
+        self,
+        configuration: Configuration,
+        logger: Logger,
+        threshold: int = 90,
+        catalogue_path: Optional[Path] = None,
+    ) -> None:
         self._configuration = configuration
         self._threshold = threshold
         self._logger = logger
 
-        self._entities: List[Dict[str, Any]] = self._load_json(
-            configuration.system_path / "entities.json",
-            name="entities",
+        self._entities: List[Dict[str, Any]] = load_catalogue(
+            catalogue_path or configuration.system_path / "entities.json",
         )
 
         # Build a look‑up set once so we can match very quickly later
         self._keyword_set: set[str] = self._build_keyword_set(self._entities)
+        self._related: Dict[int, List[Dict[str, Any]]] = self._build_related(self._entities)
+        self._search = EntitySearch(self._entities)
+
+    def reload(self, catalogue_path: Path) -> None:
+        """Swap in the catalogue at *catalogue_path*.
+
+        Safe to call from any thread: the new catalogue is fully built before
+        it replaces the current one.  On error the current one is kept.
+        """
+        try:
+            entities = load_catalogue(catalogue_path)
+            keyword_set = self._build_keyword_set(entities)
+            related = self._build_related(entities)
+            search = EntitySearch(entities)
+        except (OSError, ValueError, KeyError) as exc:
+            self._logger.error("Failed to load catalogue %s: %s", catalogue_path, exc)
+            return
+        self._entities, self._keyword_set, self._related, self._search = entities, keyword_set, related, search
+        self._logger.info("Loaded %d entities from %s", len(entities), catalogue_path)
 
     # --------------------------------------------------------------------- #
     # Public interface
@@ -98,19 +215,40 @@ class MessageBuilder:
 
         return None
 
+    def related_messages(self, message: str) -> List[str]:
+        """Display messages of entities likely to be looked at after the one showing *message*.
+
+        A monster's items are related to the monster and vice versa.
+        """
+        return [entity["display_message"] for entity in self._related.get(hash(message), [])]
+
+    def search(self, query: str, limit: int = 10) -> List[Dict[str, Any]]:
+        """Entities whose name matches what the user typed in the search bar, best first.
+
+        Answered from an index built with the catalogue, so it is cheap
+        enough to run on every keystroke (see :mod:`entity_search`).
+        """
+        return self._search.search(query, limit)
+
     # ------------------------------------------------------------------ #
     # Internal helpers
     # ------------------------------------------------------------------ #
     @staticmethod
-    def _load_json(path: Path, *, name: str) -> List[Dict[str, Any]]:
-        try:
-            with path.open("r", encoding="utf-8") as fp:
-                data: Any = json.load(fp)
-        except FileNotFoundError as exc:
-            raise FileNotFoundError(f"{name!s} file not found at {path!s}") from exc
-        if not isinstance(data, list):
-            raise ValueError(f"{name!s} JSON must contain a list, got {type(data).__name__}")
-        return data  # type: ignore[return-value]
+    def _build_related(entities: Sequence[Dict[str, Any]]) -> Dict[int, List[Dict[str, Any]]]:
+        # keyed by the hash of the message on screen, so the (assembled) messages are not kept
+        by_name = {e["name"]: e for e in entities if "display_message" in e}
+        related: Dict[int, List[Dict[str, Any]]] = {}
+        for e in entities:
+            if e.get("type") != "monster" or "display_message" not in e:
+                continue
+            # a monster's message lists each of its items on a line of its own, e.g. "Bronze Pelt"
+            lines = e["display_message"].split(_SEPARATOR)
+            names = (line.removeprefix(tier) for line in lines for tier in _TIERS if line.startswith(tier))
+            items = [by_name[name] for name in dict.fromkeys(names) if name in by_name and name != e["name"]]
+            related.setdefault(hash(e["display_message"]), []).extend(items)
+            for item in items:
+                related.setdefault(hash(item["display_message"]), []).append(e)
+        return related
 
     @staticmethod
     def _build_keyword_set(entities: Sequence[Dict[str, Any]]) -> set[str]:
@@ -0,0 +1,223 @@
+"""OCR parameter sweep: latency versus accuracy.
+
+Runs the images of one or more corpora (``ocr_tests/`` by default, or the
+frames of ``python -m ocr_tests.synthetic``) through every combination of
+
+* preprocessing – ``none``, ``gray``, ``invert`` (gray, light text made
+  dark on light) or ``binary`` (inverted and thresholded),
+* scale – the image resized by this factor before OCR,
+* page segmentation mode (``--psm``) and OCR engine mode (``--oem``),
+* confidence threshold – words Tesseract is less sure of are dropped,
+
+and reports, per combination, how many images matched their expected entity
+and the median / 95th percentile time of OCR plus matching.  The confidence
+threshold only filters Tesseract's words, so each image is OCRed once per
+preprocessing, scale, PSM and OEM, and every threshold is scored from that
+one pass.  Images run ``--workers`` at a time (Tesseract is a subprocess).
+Before the sweep, the first image is read with every PSM, and a warning
+is logged if they all give the same words (a mode that never reaches
+Tesseract would make the PSM rows identical).
+
+The table is sorted by latency; ★ marks the Pareto frontier, the settings
+no other setting beats on both latency and accuracy, and ◆ the current
+defaults (no preprocessing, full scale, PSM 11, OEM 1, confidence 80).
+``--report`` writes every result as JSON.
+
+    python -m ocr_tests.sweep [--corpus DIR ...] [--psm 11,6] [--scales 1,0.75,0.5] [--workers 4]
+"""
+
+from __future__ import annotations
+
+import argparse
+import itertools
+import json
+import os
+import random
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from PIL import Image, ImageOps
+
+from configuration import Configuration
+from logger import logger
+from message_builder import MessageBuilder
+from ocr_tests.test import TESTS_DIR, SimulatedExtractor, distribution
+from text_extractor_worker import TextExtractor
+
+DEFAULTS = {"preprocess": "none", "scale": 1.0, "psm": 11, "oem": 1, "confidence": 80}
+BINARY_THRESHOLD = 110  # on the inverted gray image: text is darker than this
+
+
+def _gray(image: Image.Image) -> Image.Image:
+    return ImageOps.grayscale(image)
+
+
+def _invert(image: Image.Image) -> Image.Image:
+    return ImageOps.invert(ImageOps.grayscale(image))
+
+
+def _binary(image: Image.Image) -> Image.Image:
+    return _invert(image).point(lambda value: 0 if value < BINARY_THRESHOLD else 255)
+
+
+PREPROCESSORS: Dict[str, Callable[[Image.Image], Image.Image]] = {
+    "none": lambda image: image,
+    "gray": _gray,
+    "invert": _invert,
+    "binary": _binary,
+}
+
+
+def prepare(image: Image.Image, preprocess: str, scale: float) -> Image.Image:
+    image = image.convert("RGB")
+    if scale != 1.0:
+        image = image.resize((max(1, round(image.width * scale)), max(1, round(image.height * scale))), Image.Resampling.BILINEAR)
+    return PREPROCESSORS[preprocess](image)
+
+
+def load_corpora(corpora: List[Path], limit: Optional[int], seed: int) -> List[Tuple[Path, Optional[str]]]:
+    """``(image path, expected entity)`` of every corpus, at most *limit* of each (a random sample)."""
+    images: List[Tuple[Path, Optional[str]]] = []
+    rng = random.Random(seed)
+    for corpus in corpora:
+        with (corpus / "map.json").open(encoding="utf-8") as fp:
+            entries = [(corpus / name, expected) for name, expected in json.load(fp).items()]
+        if limit is not None and len(entries) > limit:
+            entries = rng.sample(entries, limit)
+        images.extend(entries)
+    return images
+
+
+def check_psm_applied(extractors: Dict[Tuple[int, int], Any], image: Image.Image) -> None:
+    """Warn if every PSM reads *image* the same, as when a config file overrides ``--psm``."""
+    for oem in sorted({oem for _, oem in extractors}):
+        outputs = {psm: extractor.extract_words(image) for (psm, mode), extractor in extractors.items() if mode == oem}
+        if len(outputs) > 1 and all(words == next(iter(outputs.values())) for words in outputs.values()):
+            logger.warning(
+                "PSM %s gave identical words with OEM %d; check that the mode reaches Tesseract",
+                ", ".join(map(str, outputs)),
+                oem,
+            )
+
+
+def pareto(results: List[Dict[str, Any]]) -> None:
+    """Mark the results no other result beats on both latency (p50) and accuracy."""
+    for result in results:
+        result["pareto"] = not any(
+            other["latency_ms"]["p50"] <= result["latency_ms"]["p50"]
+            and other["accuracy"] >= result["accuracy"]
+            and (other["latency_ms"]["p50"] < result["latency_ms"]["p50"] or other["accuracy"] > result["accuracy"])
+            for other in results
+        )
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--corpus", type=Path, action="append", help="directory with images and a map.json (repeatable)")
+    parser.add_argument("--limit", type=int, help="images sampled from each corpus")
+    parser.add_argument("--preprocess", default="none,gray,invert,binary", help=f"comma-separated, of {', '.join(PREPROCESSORS)}")
+    parser.add_argument("--scales", default="1,0.75,0.5", help="comma-separated resize factors")
+    parser.add_argument("--psm", default="11,6", help="comma-separated page segmentation modes")
+    parser.add_argument("--oem", default="1", help="comma-separated OCR engine modes")
+    parser.add_argument("--confidence", default="0,60,70,80,90", help="comma-separated confidence thresholds")
+    parser.add_argument("--workers", type=int, default=min(4, os.cpu_count() or 1), help="images processed at once")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--report", type=Path, help="write every result as JSON to this path")
+    parser.add_argument("--simulate-ocr-ms", type=float, help="replace Tesseract with a sleep of this length")
+    args = parser.parse_args()
+
+    preprocessors = args.preprocess.split(",")
+    unknown = set(preprocessors) - set(PREPROCESSORS)
+    if unknown:
+        parser.error(f"unknown preprocessing: {', '.join(sorted(unknown))}")
+    scales = [float(value) for value in args.scales.split(",")]
+    psms = [int(value) for value in args.psm.split(",")]
+    oems = [int(value) for value in args.oem.split(",")]
+    thresholds = [int(value) for value in args.confidence.split(",")]
+
+    cfg = Configuration()
+    message_builder = MessageBuilder(cfg, logger)
+    extractors = {
+        (psm, oem): SimulatedExtractor(args.simulate_ocr_ms) if args.simulate_ocr_ms else TextExtractor(cfg, logger, psm=psm, oem=oem)
+        for psm, oem in itertools.product(psms, oems)
+    }
+    images = load_corpora(args.corpus or [TESTS_DIR], args.limit, args.seed)
+    settings = list(itertools.product(preprocessors, scales, psms, oems))
+    if not args.simulate_ocr_ms and images:
+        with Image.open(images[0][0]) as image:
+            check_psm_applied(extractors, prepare(image, "none", 1.0))
+
+    def run(job: Tuple[Tuple[str, float, int, int], Tuple[Path, Optional[str]]]) -> Dict[int, Tuple[bool, float]]:
+        """``{threshold: (passed, ms)}`` of one image under one setting."""
+        (preprocess, scale, psm, oem), (path, expected) = job
+        with Image.open(path) as image:
+            image.load()
+            started = time.perf_counter()
+            words = extractors[psm, oem].extract_words(prepare(image, preprocess, scale))
+            ocr_ms = (time.perf_counter() - started) * 1000
+        outcome = {}
+        for threshold in thresholds:
+            started = time.perf_counter()
+            entity = message_builder.match_entity(" ".join(text for text, conf in words if conf >= threshold))
+            match_ms = (time.perf_counter() - started) * 1000
+            name = entity.get("name") if entity else None
+            outcome[threshold] = (name == expected, ocr_ms + match_ms)
+        return outcome
+
+    mode = f"simulated OCR ({args.simulate_ocr_ms:g} ms)" if args.simulate_ocr_ms else "Tesseract"
+    print(
+        f"🔬 {len(images)} images × {len(settings)} OCR settings × {len(thresholds)} thresholds, "
+        f"{args.workers} at once, {mode}"
+    )
+    jobs = [(setting, image) for setting in settings for image in images]
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=args.workers, thread_name_prefix="ocr-sweep") as pool:
+        outcomes = list(pool.map(run, jobs))
+    elapsed = time.perf_counter() - started
+
+    by_setting: Dict[Tuple[Any, ...], List[Dict[int, Tuple[bool, float]]]] = {}
+    for (setting, _), outcome in zip(jobs, outcomes):
+        by_setting.setdefault(setting, []).append(outcome)
+    results = []
+    for (preprocess, scale, psm, oem), image_outcomes in by_setting.items():
+        for threshold in thresholds:
+            passed = [outcome[threshold][0] for outcome in image_outcomes]
+            results.append(
+                {
+                    "preprocess": preprocess,
+                    "scale": scale,
+                    "psm": psm,
+                    "oem": oem,
+                    "confidence": threshold,
+                    "accuracy": round(sum(passed) / len(passed), 4) if passed else 0.0,
+                    "latency_ms": distribution([outcome[threshold][1] for outcome in image_outcomes]),
+                }
+            )
+    pareto(results)
+    results.sort(key=lambda result: (result["latency_ms"]["p50"], -result["accuracy"]))
+
+    print("─" * 72)
+    print(f"   {'preprocess':10s} {'scale':>6s} {'psm':>4s} {'oem':>4s} {'conf':>5s} {'accuracy':>9s} {'p50':>10s} {'p95':>10s}")
+    for result in results:
+        is_default = all(result[key] == value for key, value in DEFAULTS.items())
+        mark = ("★" if result["pareto"] else " ") + ("◆" if is_default else " ")
+        print(
+            f"{mark} {result['preprocess']:10s} {result['scale']:6.2f} {result['psm']:4d} {result['oem']:4d} "
+            f"{result['confidence']:5d} {result['accuracy']:8.1%} {result['latency_ms']['p50']:7.1f} ms "
+            f"{result['latency_ms']['p95']:7.1f} ms"
+        )
+    print("─" * 72)
+    print(f"{len(jobs)} OCR runs in {elapsed:.1f}s; ★ Pareto frontier (latency p50 vs accuracy), ◆ current defaults")
+
+    if args.report:
+        report = {"images": len(images), "mode": mode, "workers": args.workers, "results": results}
+        args.report.write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+        print(f"\n📝 Report written to {args.report}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,315 @@
+"""Synthetic tooltip frames for large-scale OCR load tests.
+
+Renders game-like frames for the entities of ``entities.json``: a tooltip
+panel (the entity's name as the title, the first paragraph of its message
+as the body, keywords in their decoration colours) at a random place on a
+background, at a random resolution.  Backgrounds are crops of the
+screenshots in ``ocr_tests/`` blurred past legibility, so their own
+tooltips cannot be read, or plain gradients without ``--no-screenshots``.
+About ``--negatives`` of the frames have no tooltip at all.
+
+The output directory gets the frames plus
+
+* ``map.json`` – ``{frame: entity name or null}``, the format of
+  ``ocr_tests/map.json``, so ``python -m ocr_tests.test --corpus DIR`` runs it,
+* ``labels.jsonl`` – one line per frame: name, type, resolution, the
+  tooltip's box and the title and body text drawn.
+
+Frames are rendered across ``--jobs`` processes and are reproducible for a
+given ``--seed``.  Encoding dominates: a PNG takes about four times as long
+as drawing the frame, so ``--format jpg`` (quality 95) is the faster choice
+when lossless captures are not needed.
+
+    python -m ocr_tests.synthetic --out /tmp/frames [--frames 2000] [--jobs N]
+"""
+
+from __future__ import annotations
+
+import argparse
+import html
+import json
+import os
+import random
+import re
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from PIL import Image, ImageDraw, ImageFilter, ImageFont
+
+from message_builder import load_catalogue
+
+TESTS_DIR = Path(__file__).resolve().parent
+ROOT = TESTS_DIR.parent
+
+RESOLUTIONS = ((1280, 720), (1600, 900), (1920, 1080), (2560, 1440))
+FORMATS = {"png": {"compress_level": 1}, "jpg": {"quality": 95}}
+TITLE_FONTS = ("DejaVuSerif-Bold.ttf", "georgiab.ttf", "Georgia Bold.ttf")
+BODY_FONTS = ("DejaVuSans-Bold.ttf", "arialbd.ttf", "Arial Bold.ttf")
+
+# at 1080p; everything scales with the frame's height
+PANEL_WIDTH = 440
+TITLE_SIZE = 36
+BODY_SIZE = 24
+PADDING = 24
+MAX_BODY_LINES = 6
+
+TITLE_COLOR = (243, 227, 195)
+BODY_COLOR = (240, 230, 210)
+PANEL_COLOR = (38, 27, 20)
+BORDER_COLOR = (138, 106, 58)
+
+_SPAN = re.compile(r"<span style='color:(#[0-9a-fA-F]{3,6});?'>(.*?)</span>", re.DOTALL)
+_TAG = re.compile(r"<[^>]+>")
+
+Run = Tuple[str, Tuple[int, int, int]]  # text and its colour
+
+
+def _rgb(color: str) -> Tuple[int, int, int]:
+    color = color.lstrip("#")
+    if len(color) == 3:
+        color = "".join(char * 2 for char in color)
+    return int(color[0:2], 16), int(color[2:4], 16), int(color[4:6], 16)
+
+
+def tooltip_body(message: str) -> List[List[Run]]:
+    """The lines of *message*'s first paragraph (after the bold title), as coloured runs."""
+    lines = message.split("<br>")
+    if lines and lines[0].lower().startswith("<b>"):
+        lines = lines[1:]
+    while lines and not lines[0].strip():
+        lines = lines[1:]
+    paragraph = []
+    for line in lines:
+        if not line.strip():
+            break
+        paragraph.append(line)
+
+    body = []
+    for line in paragraph[:MAX_BODY_LINES]:
+        runs: List[Run] = []
+        position = 0
+        for match in _SPAN.finditer(line):
+            runs.append((line[position : match.start()], BODY_COLOR))
+            runs.append((match.group(2), _rgb(match.group(1))))
+            position = match.end()
+        runs.append((line[position:], BODY_COLOR))
+        runs = [(html.unescape(_TAG.sub("", text)), color) for text, color in runs]
+        body.append([(text, color) for text, color in runs if text])
+    return body
+
+
+def frame_specs(entities: Sequence[Dict[str, Any]], frames: int, negatives: float, seed: int) -> List[Dict[str, Any]]:
+    """What to draw in each frame: every entity in turn (shuffled), with *negatives* of the frames empty."""
+    rng = random.Random(seed)
+    shown = [entity for entity in entities if entity.get("display_message")]
+    specs: List[Dict[str, Any]] = []
+    order: List[Dict[str, Any]] = []
+    for index in range(frames):
+        if rng.random() < negatives:
+            specs.append({"index": index, "name": None, "type": None, "body": []})
+            continue
+        if not order:
+            order = rng.sample(shown, len(shown))
+        entity = order.pop()
+        specs.append(
+            {
+                "index": index,
+                "name": entity["name"],
+                "type": entity.get("type"),
+                "body": tooltip_body(entity["display_message"]),
+            }
+        )
+    return specs
+
+
+# ─── rendering (in the pool's processes) ────────────────────────────────────
+_backgrounds: List[Image.Image] = []
+_fonts: Dict[Tuple[str, int], ImageFont.FreeTypeFont] = {}
+_font_paths: Dict[str, Optional[str]] = {}
+
+
+def _init_renderer(screenshots: Sequence[str], title_font: Optional[str], body_font: Optional[str]) -> None:
+    _backgrounds.clear()
+    for path in screenshots:
+        with Image.open(path) as image:
+            # past legibility: the screenshots' own tooltips must not be read
+            _backgrounds.append(image.convert("RGB").resize((960, 540)).filter(ImageFilter.GaussianBlur(6)))
+    _font_paths.update(title=title_font, body=body_font)
+
+
+def _font(kind: str, size: int) -> ImageFont.FreeTypeFont:
+    key = (kind, size)
+    if key not in _fonts:
+        candidates = [_font_paths.get(kind)] + list(TITLE_FONTS if kind == "title" else BODY_FONTS)
+        for candidate in filter(None, candidates):
+            try:
+                _fonts[key] = ImageFont.truetype(candidate, size)
+                break
+            except OSError:
+                continue
+        else:
+            _fonts[key] = ImageFont.load_default(size)  # type: ignore[assignment]
+    return _fonts[key]
+
+
+def _background(rng: random.Random, size: Tuple[int, int]) -> Image.Image:
+    if _backgrounds:
+        source = rng.choice(_backgrounds)
+        width, height = rng.randint(480, 960), rng.randint(270, 540)
+        left, top = rng.randint(0, 960 - width), rng.randint(0, 540 - height)
+        return source.resize(size, Image.Resampling.BILINEAR, box=(left, top, left + width, top + height))
+    top, bottom = [tuple(rng.randint(20, 160) for _ in range(3)) for _ in range(2)]
+    gradient = Image.linear_gradient("L").resize(size)
+    return Image.composite(Image.new("RGB", size, bottom), Image.new("RGB", size, top), gradient)  # type: ignore[arg-type]
+
+
+def _wrap(draw: ImageDraw.ImageDraw, runs: List[Run], font: ImageFont.FreeTypeFont, width: float) -> List[List[Run]]:
+    """*runs* broken into lines no wider than *width*, word by word."""
+    lines: List[List[Run]] = [[]]
+    used = 0.0
+    for text, color in runs:
+        for word in re.findall(r"\s+|\S+", text):
+            advance = draw.textlength(" " if word.isspace() else word, font=font)
+            if word.isspace():
+                if lines[-1]:
+                    lines[-1].append((" ", color))
+                    used += advance
+                continue
+            if used + advance > width and lines[-1]:
+                while lines[-1] and lines[-1][-1][0] == " ":
+                    lines[-1].pop()
+                lines.append([])
+                used = 0.0
+            lines[-1].append((word, color))
+            used += advance
+    return [line for line in lines if line]
+
+
+def render(spec: Dict[str, Any], seed: int) -> Tuple[Image.Image, Dict[str, Any]]:
+    """The frame for *spec* and its label."""
+    rng = random.Random(seed * 1_000_003 + spec["index"])
+    size = rng.choice(RESOLUTIONS)
+    scale = size[1] / 1080 * rng.uniform(0.9, 1.1)
+    frame = _background(rng, size)
+    label: Dict[str, Any] = {"name": spec["name"], "type": spec["type"], "resolution": list(size), "box": None}
+    if spec["name"] is None:
+        return frame, label
+
+    draw = ImageDraw.Draw(frame)
+    title_font, body_font = _font("title", round(TITLE_SIZE * scale)), _font("body", round(BODY_SIZE * scale))
+    padding, width = round(PADDING * scale), round(PANEL_WIDTH * scale)
+    title_lines = _wrap(draw, [(spec["name"], TITLE_COLOR)], title_font, width - 2 * padding)
+    body_lines = [wrapped for line in spec["body"] for wrapped in _wrap(draw, line, body_font, width - 2 * padding)]
+    title_height, body_height = round(TITLE_SIZE * scale * 1.2), round(BODY_SIZE * scale * 1.35)
+    height = 2 * padding + len(title_lines) * title_height + (padding + len(body_lines) * body_height if body_lines else 0)
+
+    left = rng.randint(0, max(0, size[0] - width))
+    top = rng.randint(0, max(0, size[1] - height))
+    shade = rng.uniform(0.8, 1.2)
+    panel = tuple(min(255, round(channel * shade)) for channel in PANEL_COLOR)
+    draw.rounded_rectangle(
+        (left, top, left + width, top + height), radius=round(10 * scale), fill=panel, outline=BORDER_COLOR, width=max(1, round(2 * scale))
+    )
+
+    y = top + padding
+    for lines, font, line_height in ((title_lines, title_font, title_height), (body_lines, body_font, body_height)):
+        for line in lines:
+            x = left + padding
+            for text, color in line:
+                draw.text((x, y), text, font=font, fill=color)
+                x += draw.textlength(text, font=font)
+            y += line_height
+        if body_lines and lines is title_lines:
+            y += padding
+            draw.line((left + padding // 2, y - padding // 2, left + width - padding // 2, y - padding // 2), fill=BORDER_COLOR)
+
+    if rng.random() < 0.3:
+        # scaled or compressed captures; only the tooltip is read, so only it is blurred
+        box = (left, top, min(size[0], left + width), min(size[1], top + height))
+        frame.paste(frame.crop(box).filter(ImageFilter.GaussianBlur(rng.uniform(0.3, 0.8))), box[:2])
+    label.update(
+        box=[left, top, left + width, top + height],
+        title=spec["name"],
+        body=["".join(text for text, _ in line) for line in body_lines],
+    )
+    return frame, label
+
+
+def _render_to_file(job: Tuple[Dict[str, Any], int, str, str]) -> Dict[str, Any]:
+    spec, seed, out_dir, image_format = job
+    frame, label = render(spec, seed)
+    label["file"] = f"frame_{spec['index']:05d}.{image_format}"
+    frame.save(Path(out_dir) / label["file"], **FORMATS[image_format])
+    return label
+
+
+def generate(
+    out_dir: Path,
+    frames: int,
+    *,
+    jobs: Optional[int] = None,
+    seed: int = 0,
+    negatives: float = 0.05,
+    image_format: str = "png",
+    screenshots: bool = True,
+    title_font: Optional[str] = None,
+    body_font: Optional[str] = None,
+) -> List[Dict[str, Any]]:
+    """Render *frames* frames into *out_dir* with their ``map.json`` and ``labels.jsonl``; the labels."""
+    out_dir.mkdir(parents=True, exist_ok=True)
+    specs = frame_specs(load_catalogue(ROOT / "entities.json"), frames, negatives, seed)
+    sources = [str(path) for path in sorted(TESTS_DIR.glob("*.png"))] if screenshots else []
+    work = [(spec, seed, str(out_dir), image_format) for spec in specs]
+
+    jobs = jobs or os.cpu_count() or 1
+    if jobs == 1:
+        _init_renderer(sources, title_font, body_font)
+        labels = [_render_to_file(job) for job in work]
+    else:
+        with ProcessPoolExecutor(jobs, initializer=_init_renderer, initargs=(sources, title_font, body_font)) as pool:
+            labels = list(pool.map(_render_to_file, work, chunksize=16))
+
+    with (out_dir / "map.json").open("w", encoding="utf-8") as fp:
+        json.dump({label["file"]: label["name"] for label in labels}, fp, indent=4, ensure_ascii=False)
+    with (out_dir / "labels.jsonl").open("w", encoding="utf-8") as fp:
+        for label in labels:
+            fp.write(json.dumps(label, ensure_ascii=False) + "\n")
+    return labels
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--out", type=Path, required=True, help="directory for the frames and labels")
+    parser.add_argument("--frames", type=int, default=2000, help="frames to render")
+    parser.add_argument("--jobs", type=int, help="rendering processes (default: one per CPU)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--negatives", type=float, default=0.05, help="fraction of frames without a tooltip")
+    parser.add_argument("--format", choices=sorted(FORMATS), default="png", help="image format of the frames")
+    parser.add_argument("--no-screenshots", action="store_true", help="gradient backgrounds only")
+    parser.add_argument("--title-font", help="TrueType font for titles (default: a bold serif)")
+    parser.add_argument("--body-font", help="TrueType font for the body (default: a bold sans-serif)")
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    labels = generate(
+        args.out,
+        args.frames,
+        jobs=args.jobs,
+        seed=args.seed,
+        negatives=args.negatives,
+        image_format=args.format,
+        screenshots=not args.no_screenshots,
+        title_font=args.title_font,
+        body_font=args.body_font,
+    )
+    elapsed = time.perf_counter() - started
+    entities = len({label["name"] for label in labels if label["name"]})
+    print(f"🖼️  {len(labels)} frames ({entities} entities) in {args.out} in {elapsed:.1f}s ({len(labels) / elapsed:.0f} frames/s)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,94 +1,289 @@
-from pathlib import Path
-from typing import Any, Mapping
+"""OCR regression harness.
+
+Runs every image in ``map.json`` through :class:`TextExtractor` and
+:class:`MessageBuilder` ``--runs`` times, ``--workers`` images at a time
+(Tesseract is a subprocess, so threads overlap), and records for each image
+whether the expected entity was matched and how long OCR and matching took.
+
+The result is compared against ``ocr_tests/baseline.json``; the run fails
+when
+
+* an image the baseline passes now fails, or the overall pass rate dropped
+  by more than ``--max-accuracy-drop``,
+* the median or 95th percentile OCR or match latency grew by more than
+  ``--latency-tolerance`` (the 95th percentile only from
+  ``MIN_P95_SAMPLES`` timings on, below that it is about the maximum).
+
+Latencies are only comparable under the same load, so a baseline recorded
+with other ``--workers`` or ``--runs`` is refused before anything runs.
+
+Without a baseline any failed image fails the run.  ``--report`` writes the
+whole result as JSON; ``--update-baseline`` stores it as the new baseline
+(on the reference machine, with the real Tesseract).  ``--simulate-ocr-ms``
+replaces Tesseract with a sleep to check the harness itself on machines
+without the bundled binaries.
+
+``--corpus`` runs another directory with a ``map.json``, such as the frames
+of ``python -m ocr_tests.synthetic`` (give it its own ``--baseline``).
+
+    python -m ocr_tests.test [--runs 3] [--workers 4] [--report report.json] [--update-baseline]
+"""
+
+from __future__ import annotations
+
+import argparse
 import json
 import logging
+import os
+import platform
 import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+
+from PIL import Image
 
 from configuration import Configuration
 from text_extractor_worker import TextExtractor
 from message_builder import MessageBuilder
 from logger import logger
 
+TESTS_DIR = Path(__file__).resolve().parent
+BASELINE_PATH = TESTS_DIR / "baseline.json"
+LATENCY_KEYS = ("ocr_ms", "match_ms")
+PERCENTILES = {"p50": 50, "p95": 95}
+SUMMARY_ROWS = 50  # larger corpora only list their failing images
+MIN_P95_SAMPLES = 40  # e.g. --runs 4 on the 13 bundled images
+
+
+class SimulatedExtractor:
+    """Stands in for :class:`TextExtractor` when Tesseract is not available."""
+
+    def __init__(self, cost_ms: float):
+        self._cost_s = cost_ms / 1000
+
+    def extract_text(self, image: Image.Image, **_kwargs) -> str:
+        time.sleep(self._cost_s)
+        return ""
 
-NUM_RUNS = 1  # Number of times to process each image
+    def extract_words(self, image: Image.Image) -> List[Tuple[str, float]]:
+        time.sleep(self._cost_s)
+        return []
 
 
-def main() -> None:
-    """Run OCR entity‑matching test NUM_RUNS times per image and summarise results."""
-    logger.setLevel(logging.DEBUG)
+def percentile(values: List[float], q: float) -> float:
+    """Nearest-rank percentile; ``0.0`` for no values."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, max(0, round(q / 100 * len(ordered)) - 1))]
+
+
+def distribution(values: List[float]) -> Dict[str, float]:
+    summary = {name: round(percentile(values, q), 2) for name, q in PERCENTILES.items()}
+    summary["max"] = round(max(values, default=0.0), 2)
+    return summary
+
+
+def run_image(extractor, message_builder: MessageBuilder, path: Path, expected: Optional[str]) -> Dict[str, Any]:
+    # decoded before the clock starts, so file I/O is not part of the OCR latency
+    with Image.open(path) as image:
+        image.load()
+        started = time.perf_counter()
+        text = extractor.extract_text(image)
+    extracted = time.perf_counter()
+    matched_entity = message_builder.match_entity(text)
+    matched = time.perf_counter()
+
+    name = matched_entity.get("name") if matched_entity else None
+    return {
+        "passed": name == expected,
+        "matched": name,
+        "ocr_ms": (extracted - started) * 1000,
+        "match_ms": (matched - extracted) * 1000,
+    }
+
+
+def run_corpus(
+    extractor,
+    message_builder: MessageBuilder,
+    corpus: Path,
+    entity_map: Mapping[str, Optional[str]],
+    runs: int,
+    workers: int,
+) -> Dict[str, Any]:
+    jobs = [(run, img_name) for run in range(1, runs + 1) for img_name in entity_map]
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="ocr-test") as pool:
+        outcomes = list(
+            pool.map(lambda job: run_image(extractor, message_builder, corpus / job[1], entity_map[job[1]]), jobs)
+        )
+    wall_s = time.perf_counter() - started
+
+    per_image: Dict[str, Dict[str, Any]] = {}
+    for (run, img_name), outcome in zip(jobs, outcomes):
+        entry = per_image.setdefault(
+            img_name,
+            {"expected": entity_map[img_name], "success": 0, "failure": 0, "matched": [], **{key: [] for key in LATENCY_KEYS}},
+        )
+        entry["success" if outcome["passed"] else "failure"] += 1
+        entry["matched"].append(outcome["matched"])
+        for key in LATENCY_KEYS:
+            entry[key].append(outcome[key])
+        if outcome["passed"]:
+            logger.debug("✅ PASS | file=%s run=%d matched=%s", img_name, run, outcome["matched"])
+        else:
+            logger.error("❌ FAIL | file=%s run=%d expected=%s got=%s", img_name, run, entity_map[img_name], outcome["matched"])
+
+    passed = sum(entry["success"] for entry in per_image.values())
+    return {
+        "runs": runs,
+        "workers": workers,
+        "samples": len(jobs),
+        "wall_s": round(wall_s, 3),
+        "images_per_s": round(len(jobs) / wall_s, 2) if wall_s else 0.0,
+        "pass_rate": round(passed / len(jobs), 4) if jobs else 0.0,
+        "latency": {key: distribution([value for entry in per_image.values() for value in entry[key]]) for key in LATENCY_KEYS},
+        "images": {
+            img_name: {
+                "expected": entry["expected"],
+                "success": entry["success"],
+                "failure": entry["failure"],
+                "pass_rate": round(entry["success"] / runs, 4),
+                "matched": sorted(set(entry["matched"]), key=str),  # every entity it came out as
+                **{key: distribution(entry[key]) for key in LATENCY_KEYS},
+            }
+            for img_name, entry in per_image.items()
+        },
+    }
+
+
+def compare(result: Dict[str, Any], baseline: Dict[str, Any], max_accuracy_drop: float, latency_tolerance: float) -> List[str]:
+    """Regressions of *result* against *baseline*, one line each."""
+    regressions = []
+    for img_name, entry in result["images"].items():
+        before = baseline.get("images", {}).get(img_name)
+        if before and entry["pass_rate"] < before["pass_rate"]:
+            regressions.append(f"{img_name}: passed {entry['pass_rate']:.0%} of runs vs baseline {before['pass_rate']:.0%}")
+    if result["pass_rate"] < baseline["pass_rate"] - max_accuracy_drop:
+        regressions.append(f"pass rate: {result['pass_rate']:.1%} vs baseline {baseline['pass_rate']:.1%}")
+    # with few timings the 95th percentile is about the slowest one, too noisy to gate on
+    gated = [name for name in PERCENTILES if name != "p95" or result["samples"] >= MIN_P95_SAMPLES]
+    for key in LATENCY_KEYS:
+        for name in gated:
+            now, before = result["latency"][key][name], baseline["latency"][key][name]
+            if now > before * (1 + latency_tolerance):
+                regressions.append(f"{key} {name}: {now:.1f} ms vs baseline {before:.1f} ms")
+    return regressions
+
+
+def environment(extractor) -> Dict[str, Any]:
+    info: Dict[str, Any] = {"platform": platform.platform(), "python": platform.python_version(), "cpus": os.cpu_count()}
+    if isinstance(extractor, SimulatedExtractor):
+        info["tesseract"] = "simulated"
+    else:
+        try:
+            import pytesseract
+
+            info["tesseract"] = str(pytesseract.get_tesseract_version())
+        except Exception as exc:  # the version is informational only
+            info["tesseract"] = f"unknown ({exc.__class__.__name__})"
+    return info
+
+
+def main() -> int:
+    """Run the OCR corpus, summarise it and gate it against the baseline."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=1, help="times each image is processed")
+    parser.add_argument("--workers", type=int, default=min(4, os.cpu_count() or 1), help="images processed at once")
+    parser.add_argument("--corpus", type=Path, default=TESTS_DIR, help="directory with the images and their map.json")
+    parser.add_argument("--report", type=Path, help="write the full result as JSON to this path")
+    parser.add_argument("--baseline", type=Path, default=BASELINE_PATH)
+    parser.add_argument("--update-baseline", action="store_true", help="store this run as the new baseline")
+    parser.add_argument("--max-accuracy-drop", type=float, default=0.0, help="allowed drop of the overall pass rate (fraction)")
+    parser.add_argument("--latency-tolerance", type=float, default=0.25, help="allowed latency growth as a fraction")
+    parser.add_argument("--simulate-ocr-ms", type=float, help="replace Tesseract with a sleep of this length")
+    parser.add_argument("--verbose", action="store_true", help="log every image of every run")
+    args = parser.parse_args()
+    # print() goes through the logger at INFO (see logger.py)
+    logger.setLevel(logging.DEBUG if args.verbose else logging.INFO)
+
+    if args.update_baseline and args.simulate_ocr_ms:
+        parser.error("a baseline must come from the real Tesseract, not --simulate-ocr-ms")
+
+    baseline: Optional[Dict[str, Any]] = None
+    if not args.update_baseline and args.baseline.exists():
+        baseline = json.loads(args.baseline.read_text(encoding="utf-8"))
+        recorded = {"workers": baseline.get("workers"), "runs": baseline.get("runs")}
+        if recorded != {"workers": args.workers, "runs": args.runs}:
+            parser.error(
+                f"{args.baseline} was recorded with --workers {recorded['workers']} --runs {recorded['runs']}; "
+                "latencies are only comparable with the same values"
+            )
 
     cfg = Configuration()
-    extractor = TextExtractor(cfg, logger)
+    extractor = SimulatedExtractor(args.simulate_ocr_ms) if args.simulate_ocr_ms else TextExtractor(cfg, logger)
     message_builder = MessageBuilder(cfg, logger)
 
     # ── Load the expected entity map ──────────────────────────────────────────
-    map_path = Path(cfg.system_path / "ocr_tests" / "map.json")
-    with map_path.open("r", encoding="utf-8") as fp:
-        entity_map: Mapping[str, Any] = json.load(fp)
-
-    # Prepare result counters: {img_name: {"success": int, "failure": int}}
-    results: dict[str, dict[str, int]] = {
-        img_name: {"success": 0, "failure": 0} for img_name in entity_map
-    }
+    with (args.corpus / "map.json").open("r", encoding="utf-8") as fp:
+        entity_map: Mapping[str, Optional[str]] = json.load(fp)
 
     # ── Run the tests ────────────────────────────────────────────────────────
-    for run in range(1, NUM_RUNS + 1):
-        logger.info("▶️  Run %d/%d", run, NUM_RUNS)
-
-        for img_name, expected in entity_map.items():
-            img_path = Path(cfg.system_path / "ocr_tests" / img_name)
-
-            # Extract text from the image and attempt entity match
-            text = extractor.extract_text_from_file(img_path)
-            matched_entity = message_builder.match_entity(text)
-
-            # Determine pass/fail
-            passed: bool
-            if expected is None:
-                passed = matched_entity is None
-            else:
-                passed = matched_entity is not None and matched_entity.get("name") == expected
-
-            # Update counters
-            if passed:
-                results[img_name]["success"] += 1
-                logger.debug(
-                    "✅ PASS | file=%s run=%d matched=%s", img_name, run, getattr(matched_entity, "name", None)
-                )
-            else:
-                results[img_name]["failure"] += 1
-                logger.error(
-                    "❌ FAIL | file=%s run=%d expected=%s got=%s",
-                    img_name,
-                    run,
-                    expected,
-                    getattr(matched_entity, "name", None),
-                )
+    result = run_corpus(extractor, message_builder, args.corpus, entity_map, args.runs, args.workers)
+    result["environment"] = environment(extractor)
 
     # ── Print summary ────────────────────────────────────────────────────────
-    total_success = total_failure = 0
-    print("\n\n📊 Test Summary (each file processed", NUM_RUNS, "times):")
+    print(f"\n\n📊 Test Summary (each file processed {args.runs} times, {args.workers} at once):")
+    print("─" * 72)
+    print(f"{'image':30s} {'✅':>4s} {'❌':>4s} {'rate':>7s} {'ocr p50':>9s} {'ocr p95':>9s} {'match p50':>10s}")
+    rows = list(result["images"].items())
+    if len(rows) > SUMMARY_ROWS and not args.verbose:
+        rows = [(img_name, entry) for img_name, entry in rows if entry["failure"]]
+        print(f"({len(result['images'])} images, listing the {len(rows)} that failed; --verbose lists all)")
+    for img_name, entry in rows:
+        print(
+            f"{img_name:30s} {entry['success']:4d} {entry['failure']:4d} {entry['pass_rate']:6.1%} "
+            f"{entry['ocr_ms']['p50']:6.1f} ms {entry['ocr_ms']['p95']:6.1f} ms {entry['match_ms']['p50']:7.2f} ms"
+        )
     print("─" * 72)
-    for img_name, counts in results.items():
-        success, failure = counts["success"], counts["failure"]
-        total_success += success
-        total_failure += failure
-        rate = success / NUM_RUNS * 100
-        print(f"{img_name:30s}  ✅ {success:2d}  ❌ {failure:2d}  ({rate:5.1f}%)")
+    latency = result["latency"]
+    print(
+        f"OVERALL: {result['pass_rate']:.1%} passed, {result['images_per_s']:.2f} images/s; "
+        f"ocr p50 {latency['ocr_ms']['p50']:.1f} ms / p95 {latency['ocr_ms']['p95']:.1f} ms, "
+        f"match p50 {latency['match_ms']['p50']:.2f} ms / p95 {latency['match_ms']['p95']:.2f} ms"
+    )
 
-    overall_runs = NUM_RUNS * len(entity_map)
-    overall_rate = total_success / overall_runs * 100 if overall_runs else 0.0
+    if args.report:
+        args.report.write_text(json.dumps(result, indent=2) + "\n", encoding="utf-8")
+        print(f"\n📝 Report written to {args.report}")
 
-    print("─" * 72)
-    print(f"OVERALL: ✅ {total_success}/{overall_runs}  ({overall_rate:.1f}% passed)")
+    if args.update_baseline:
+        args.baseline.write_text(json.dumps(result, indent=2) + "\n", encoding="utf-8")
+        print(f"\n✅ Baseline written to {args.baseline}")
+        return 0
+
+    if baseline is None:
+        failed = [img_name for img_name, entry in result["images"].items() if entry["failure"]]
+        print(f"\n⚠️  No baseline at {args.baseline}; run with --update-baseline to create one")
+        if failed:
+            logger.warning("Some tests failed → exiting with status 1")
+            return 1
+        print("\n✅ All checks passed across all runs!")
+        return 0
 
-    # Exit with non‑zero status if any failures occurred
-    if total_failure:
-        logger.warning("Some tests failed → exiting with status 1")
-        sys.exit(1)
+    regressions = compare(result, baseline, args.max_accuracy_drop, args.latency_tolerance)
+    if regressions:
+        print("\n❌ Regressed against the baseline:")
+        for line in regressions:
+            print("   " + line)
+        return 1
 
-    print("\n✅ All checks passed across all runs!")
+    checked = "p50 and p95" if result["samples"] >= MIN_P95_SAMPLES else f"p50 (p95 needs {MIN_P95_SAMPLES} timings)"
+    print(f"\n✅ No image regressed, latency {checked} within {args.latency_tolerance:.0%} of baseline")
+    return 0
 
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
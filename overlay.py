@@ -1,28 +1,32 @@
 from __future__ import annotations
 
-from typing import Optional, Dict
+import html
+from typing import Any, Callable, Optional, Dict, List
 
-from PyQt6.QtCore import QPoint, QSize, Qt, pyqtSignal, QEvent, QObject
+from PyQt6.QtCore import QPoint, QSize, Qt, pyqtSignal, QEvent, QObject, QTimer
 from PyQt6.QtGui import QColor, QFont, QGuiApplication, QPainter, QPaintEvent, QMouseEvent, QKeyEvent, QResizeEvent
 from PyQt6.QtWidgets import (
     QFrame,
     QHBoxLayout,
-    QLabel,
     QPushButton,
     QScrollArea,
     QSizeGrip,
-    QSizePolicy,
     QVBoxLayout,
     QWidget,
+    QLabel,
     QLineEdit,
     QToolButton,
 )
 
+from rich_text_view import DocumentCache, RichTextView
+
 # ──────────────────────────  constants  ──────────────────────────
 INITIAL_SIZE = QSize(300, 200)  # starting overlay size
 MARGIN = 20  # min distance to screen edge (px)
 PADDING = 10
 BG_COLOR = QColor(0, 0, 0)  # semi-transparent black
+PREWARM_LIMIT = 8  # related messages laid out ahead of time per update
+SEARCH_RESULTS = 8  # entities listed for a search
 # ─────────────────────────────────────────────────────────────────
 
 
@@ -33,17 +37,28 @@ class Overlay(QWidget):
     yes_clicked = pyqtSignal()
     no_clicked = pyqtSignal()
     about_to_close = pyqtSignal()
+    first_painted = pyqtSignal()
 
     # ──────────────────────────  life-cycle  ─────────────────────
-    def __init__(self, text: str, configuration, file_writer=None) -> None:
+    def __init__(self, text: str, configuration, config_store=None) -> None:
         super().__init__(flags=Qt.WindowType.WindowStaysOnTopHint | Qt.WindowType.FramelessWindowHint)
         self.setWindowOpacity(0.85)
 
         self._font = QFont("Segoe UI" if configuration.operating_system == "Windows" else "Helvetica", 12)
         self.text = text
         self._drag_pos: Optional[QPoint] = None  # start corner while dragging
-        self._file_writer = file_writer
+        self._config_store = config_store
+        self._painted = False
         self._saved_position = self._load_saved_position()
+        # parsed, laid-out messages; an entity that comes back is shown without re-parsing its HTML
+        self._documents = DocumentCache(self._font)
+        self._related_messages: Optional[Callable[[str], List[str]]] = None
+        self._prewarm_queue: List[str] = []
+        self._search: Optional[Callable[[str, int], List[Dict[str, Any]]]] = None
+        self._results: List[Dict[str, Any]] = []
+        self._selected = 0
+        # question shown with the prompt buttons; nothing replaces it until they are gone
+        self._prompt: Optional[str] = None
 
         self._build_ui()
         self.label.installEventFilter(self)
@@ -61,6 +76,9 @@ class Overlay(QWidget):
     def eventFilter(self, obj: QObject, event: QEvent) -> bool:  # type: ignore[override]
         from PyQt6.QtGui import QMouseEvent  # local import to avoid circular issues
 
+        if obj is self.search_bar and event.type() == QEvent.Type.KeyPress:
+            return self._search_key(event)  # type: ignore[arg-type]
+
         if obj in (self.label, self.scroll_area.viewport()) and isinstance(
             event, QMouseEvent
         ):  # ensure we have a mouse event
@@ -93,6 +111,10 @@ class Overlay(QWidget):
         painter.setPen(Qt.PenStyle.NoPen)
         painter.drawRoundedRect(self.rect(), 12, 12)
 
+        if not self._painted:
+            self._painted = True
+            self.first_painted.emit()
+
     # ──────────────────────  mouse interaction  ─────────────────
     def mousePressEvent(self, event: QMouseEvent) -> None:  # type: ignore[override]
         if event.button() == Qt.MouseButton.LeftButton:
@@ -134,8 +156,14 @@ class Overlay(QWidget):
         self.size_grips[3].move(self.width() - grip_w, self.height() - grip_h)
 
         self._update_button_positions()
+        self._save_position()
         super().resizeEvent(event)
 
+    def moveEvent(self, event) -> None:  # type: ignore[override]
+        # cheap: the config store coalesces a whole drag into one write
+        self._save_position()
+        super().moveEvent(event)
+
     # ─────────────────────────  UI building  ─────────────────────
     def _build_ui(self) -> None:
         self.search_bar = QLineEdit(self)
@@ -157,15 +185,15 @@ class Overlay(QWidget):
         )
         self.search_bar.hide()
 
+        # ── other search results; kept out of the message so its cached document is used ──
+        self.search_header = QLabel(self)
+        self.search_header.setFont(self._font)
+        self.search_header.setWordWrap(True)
+        self.search_header.setStyleSheet("color:#999999;background:transparent;")
+        self.search_header.hide()
+
         # ── main text inside scroll-area ──
-        self.label = QLabel(
-            self.text,
-        )
-        self.label.setWordWrap(True)
-        self.label.setAlignment(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignTop)
-        self.label.setFont(self._font)
-        self.label.setStyleSheet("color:white;background:transparent;")
-        self.label.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Preferred)
+        self.label = RichTextView(self.text, self._documents, QColor("white"))
         self.label.setContentsMargins(1, 0, 0, 0)
 
         self.scroll_area = QScrollArea()
@@ -180,6 +208,7 @@ class Overlay(QWidget):
         layout = QVBoxLayout(self)
         layout.setContentsMargins(PADDING, PADDING, PADDING, PADDING)  # right margin now = PADDING
         layout.addWidget(self.search_bar)
+        layout.addWidget(self.search_header)
         layout.addWidget(self.scroll_area)  # type: ignore
 
         # ── corner size-grips ──
@@ -278,10 +307,93 @@ class Overlay(QWidget):
         if text == self.text:
             return
         self.text = text
-        self.label.setTextFormat(Qt.TextFormat.RichText)
+        if self.search_bar.text().strip():
+            return  # the search results stay up; shown once the search is cleared
+        self._show(text)
+        self._schedule_prewarm(text)
+
+    def _show(self, text: str, header: str = "") -> None:
+        if self._prompt is not None:
+            return  # messages and search results are kept and shown once the prompt is answered
+        self._render(text, header)
+
+    def _render(self, text: str, header: str = "") -> None:
+        self.search_header.setText(header)
+        self.search_header.setVisible(bool(header))
         self.label.setText(text)
         self.scroll_area.verticalScrollBar().setValue(0)  # type: ignore
 
+    def _show_current(self) -> None:
+        """Show the search results if a query is typed, otherwise the latest message."""
+        if self.search_bar.text().strip():
+            self._show_result()
+        else:
+            self._show(self.text)
+
+    # ───── search ─────
+    def set_search(self, search: Callable[[str, int], List[Dict[str, Any]]]) -> None:
+        """Show the search bar; *search* returns the entities matching a query, best first."""
+        self._search = search
+        self.search_bar.textChanged.connect(self._on_search_changed)
+        self.search_bar.installEventFilter(self)
+        self.search_bar.show()
+
+    def _on_search_changed(self, query: str) -> None:
+        if self._search is None:
+            return
+        if not query.strip():
+            self._results = []
+            self._show(self.text)
+            return
+        self._results = self._search(query, SEARCH_RESULTS)
+        self._selected = 0
+        self._show_result()
+
+    def _show_result(self) -> None:
+        if not self._results:
+            self._show('<span style="color:#999999">No matches</span>')
+            return
+        entity = self._results[self._selected]
+        others = [result for result in self._results if result is not entity]
+        header = f'Also: {", ".join(html.escape(result["name"]) for result in others)}' if others else ""
+        self._show(entity["display_message"], header)
+        # Up/Down shows the other results next
+        self._prewarm([result["display_message"] for result in others])
+
+    def _search_key(self, event: QKeyEvent) -> bool:
+        # Esc leaves the search rather than closing the overlay; Up/Down pick a result
+        if event.key() == Qt.Key.Key_Escape and self.search_bar.text():
+            self.search_bar.clear()
+            return True
+        if event.key() in (Qt.Key.Key_Up, Qt.Key.Key_Down) and len(self._results) > 1:
+            step = 1 if event.key() == Qt.Key.Key_Down else -1
+            self._selected = (self._selected + step) % len(self._results)
+            self._show_result()
+            return True
+        return False
+
+    def set_related_messages(self, related_messages: Callable[[str], List[str]]) -> None:
+        """Source of the messages likely to follow a message, laid out while the UI is idle."""
+        self._related_messages = related_messages
+
+    def _schedule_prewarm(self, text: str) -> None:
+        if self._related_messages is not None:
+            self._prewarm(self._related_messages(text))
+
+    def _prewarm(self, messages: List[str]) -> None:
+        was_idle = not self._prewarm_queue
+        self._prewarm_queue = messages[:PREWARM_LIMIT]
+        if was_idle and self._prewarm_queue:
+            QTimer.singleShot(0, self._prewarm_next)
+
+    def _prewarm_next(self) -> None:
+        # one document per event-loop turn so input and repaints are never held up
+        if not self._prewarm_queue:
+            return
+        self._documents.prewarm(self._prewarm_queue.pop(0), self.label.text_width())
+        if self._prewarm_queue:
+            QTimer.singleShot(0, self._prewarm_next)
+
     def _toggle_content(self) -> None:
         if self.toggle_button.isChecked():
             self.scroll_area.hide()
@@ -298,7 +410,9 @@ class Overlay(QWidget):
 
     # ───── prompt-button public API ─────
     def show_prompt_buttons(self, question: str, yes_text: str | None = None, no_text: str | None = None) -> None:
-        self.set_message(question)
+        self.hide_prompt_buttons()
+        self._prompt = question
+        self._render(question)
 
         self.button_container = QWidget(self)
         button_layout = QHBoxLayout(self.button_container)
@@ -327,43 +441,36 @@ class Overlay(QWidget):
             self.button_container.hide()
             self.button_container.deleteLater()
             self.button_container = None
+        if self._prompt is not None:
+            self._prompt = None
+            self._show_current()
 
     def _load_saved_position(self) -> Optional[Dict[str, int]]:
-        """Load saved overlay position from config file."""
-        if not self._file_writer:
+        """Load saved overlay position from the config store."""
+        if not self._config_store:
             return None
 
         try:
-            if self._file_writer.exists():
-                config_data = self._file_writer.read()
-                if config_data and config_data.overlay_position:
-                    return config_data.overlay_position
+            return self._config_store.data.overlay_position
         except Exception:
             # If loading fails, just use default position
-            pass
-        return None
+            return None
 
     def _save_position(self) -> None:
-        """Save the current overlay position and size to config."""
-        if self._file_writer:
-            try:
-                # Read current config
-                config_data = self._file_writer.read()
-                if not config_data:
-                    from file_writer import ConfigData
-
-                    config_data = ConfigData()
-
-                # Update overlay position
-                pos = self.pos()
-                size = self.size()
-                config_data.update_overlay_position(pos.x(), pos.y(), size.width(), size.height())
-
-                # Save to file
-                self._file_writer.write(config_data)
-            except Exception:
-                # Silently fail - position saving is not critical
-                pass
+        """Record the current overlay position and size in the config store."""
+        if not self._config_store or not self.isVisible():
+            return
+
+        pos = self.pos()
+        size = self.size()
+        position = {"x": pos.x(), "y": pos.y(), "width": size.width(), "height": size.height()}
+        try:
+            if self._config_store.data.overlay_position == position:
+                return
+            self._config_store.update(lambda config_data: config_data.update_overlay_position(**position))
+        except Exception:
+            # Silently fail - position saving is not critical
+            pass
 
     def _handle_close(self) -> None:
         self._save_position()
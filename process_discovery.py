@@ -0,0 +1,159 @@
+"""
+Process Discovery
+=================
+
+Finds The Bazaar's process and main window without scanning the whole
+process table every second.
+
+* only PIDs that appeared since the previous scan have their name looked up
+  (the table is re-read in full every ``full_scan_every`` scans, in case a
+  PID was reused); a PID whose name could not be read is looked up again
+  on the next scan,
+* once found, the PID and window handle are kept and only re-validated with
+  cheap existence checks,
+* :class:`ProcessDiscoveryJob` runs the scans as a
+  :class:`~scheduler_worker.SchedulerWorker` job, which backs off
+  exponentially while the game is not running.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from logging import Logger
+from typing import Optional
+
+from PyQt6.QtCore import QObject, pyqtSignal
+
+from system_handler import BaseSystemHandler
+
+
+class ProcessDiscovery:
+    """Incremental search for a process by name and its main window.
+
+    Parameters
+    ----------
+    system_handler
+        Provides the process table and window look-ups.
+    process_name
+        Executable name to look for.
+    full_scan_every
+        Number of scans after which every PID is looked up again.
+    """
+
+    def __init__(self, system_handler: BaseSystemHandler, process_name: str, *, full_scan_every: int = 60):
+        self._system_handler = system_handler
+        self.process_name = process_name
+        self._full_scan_every = full_scan_every
+
+        self._seen: set[int] = set()
+        self._candidate: Optional[int] = None  # running, but its window may not exist yet
+        self.found: Optional[tuple[int, int]] = None
+
+        self.scans = 0
+        self.name_lookups = 0
+        self.last_scan_s = 0.0
+
+    def scan(self) -> Optional[tuple[int, int]]:
+        """Return ``(pid, window_handle)`` of the game, or ``None`` if not (or no longer) available."""
+        started = time.perf_counter()
+        try:
+            if self.found is not None:
+                return self._validate()
+            return self._search()
+        finally:
+            self.last_scan_s = time.perf_counter() - started
+
+    def reset(self) -> None:
+        """Forget what was found and re-read the whole table on the next scan."""
+        self.found = None
+        self._candidate = None
+        self._seen.clear()
+
+    # -------------------------- internal utilities ----------------------- #
+    def _validate(self) -> Optional[tuple[int, int]]:
+        pid, window_handle = self.found  # type: ignore[misc]
+        if self._system_handler.is_process_alive(pid) and self._system_handler.is_window_valid(window_handle):
+            return self.found
+        self.reset()
+        return None
+
+    def _search(self) -> Optional[tuple[int, int]]:
+        self.scans += 1
+        if self.scans % self._full_scan_every == 0:
+            self._seen.clear()
+
+        pids = set(self._system_handler.pids())
+        if self._candidate is not None and self._candidate not in pids:
+            self._candidate = None
+        unresolved: set[int] = set()
+        if self._candidate is None:
+            for pid in pids - self._seen:
+                self.name_lookups += 1
+                name = self._system_handler.process_name(pid)
+                if name is None:
+                    # denied or still starting up: look again next scan rather than after a full rescan
+                    unresolved.add(pid)
+                elif name == self.process_name:
+                    self._candidate = pid
+                    break
+        self._seen = pids - unresolved
+
+        if self._candidate is None:
+            return None
+        window_handle = self._system_handler.find_process_main_window_handle(self._candidate)
+        if not window_handle:
+            return None
+        self.found = (self._candidate, window_handle)
+        return self.found
+
+
+class ProcessDiscoveryJob(QObject):
+    """One discovery scan per call, for :class:`scheduler_worker.SchedulerWorker`.
+
+    Returns ``False`` while the game is absent so the scheduler backs off,
+    and ``True`` once found (validation only) so it polls at the base
+    interval again.
+
+    Signals:
+        process_found: Emitted with ``(pid, window_handle)`` when the game appears
+        process_lost: Emitted when a found process or window disappears
+    """
+
+    NAME = "process-discovery"
+
+    process_found = pyqtSignal(int, int)
+    process_lost = pyqtSignal()
+
+    def __init__(self, logger: Logger, discovery: ProcessDiscovery):
+        super().__init__()
+        self._logger = logger
+        self._discovery = discovery
+        self._rescan_requested = False
+
+    def rescan(self) -> None:
+        """Drop the current result on the next run (any thread); pair with ``SchedulerWorker.run_now``."""
+        self._rescan_requested = True
+
+    def __call__(self) -> bool:
+        thread_name = threading.current_thread().name
+        if self._rescan_requested:
+            self._rescan_requested = False
+            self._discovery.reset()
+
+        was_found = self._discovery.found is not None
+        result = self._discovery.scan()
+        self._logger.debug(
+            "[%s] process scan took %.2f ms (%d name look-ups so far)",
+            thread_name,
+            self._discovery.last_scan_s * 1000,
+            self._discovery.name_lookups,
+        )
+
+        if result is not None and not was_found:
+            self._logger.info(f"[{thread_name}] found {self._discovery.process_name} (PID {result[0]}, window {result[1]})")
+            self.process_found.emit(*result)
+        elif result is None and was_found:
+            self._logger.info(f"[{thread_name}] lost {self._discovery.process_name}")
+            self.process_lost.emit()
+        return result is not None
@@ -0,0 +1,199 @@
+"""
+Sampling Profiler
+=================
+
+A low-overhead, always-on capable profiler for the worker threads managed by
+:class:`~worker_framework.ThreadController`.
+
+Every ``sample_interval_ms`` the profiler grabs the current Python stack of the
+main thread and of each running worker thread and counts it.  Every
+``dump_interval_s`` the accumulated counts are written as a *folded stack* file
+(one ``thread;frame;frame… count`` line per unique stack) that can be fed
+straight into ``flamegraph.pl`` or speedscope.  Optionally a ``tracemalloc``
+snapshot is written alongside, including the growth since the previous dump.
+
+Nothing is ever injected into the profiled threads, so the cost is paid only
+on the profiler's own daemon thread and scales with the sampling rate.
+"""
+
+from __future__ import annotations
+
+import sys
+import threading
+import time
+import tracemalloc
+from collections import Counter
+from datetime import datetime
+from logging import Logger
+from pathlib import Path
+from types import FrameType
+from typing import Optional
+
+from worker_framework import ThreadController
+
+
+class SamplingProfiler:
+    """Periodically samples worker thread stacks and writes profile dumps.
+
+    Parameters
+    ----------
+    logger
+        App‑wide logger instance.
+    thread_controller
+        Controller whose workers should be sampled.
+    output_dir
+        Directory the ``.folded`` and ``.tracemalloc.txt`` dumps are written to.
+    sample_interval_ms
+        Time between two stack samples.  50 ms (20 Hz) is cheap enough to
+        leave on in production.
+    dump_interval_s
+        Time between two dumps to disk.
+    trace_memory
+        Also record ``tracemalloc`` snapshots (noticeably more expensive).
+    max_dumps
+        Number of dump files of each kind kept on disk; older ones are removed.
+    max_stack_depth
+        Stacks deeper than this are truncated at the root side.
+    """
+
+    def __init__(
+        self,
+        logger: Logger,
+        thread_controller: ThreadController,
+        output_dir: Path,
+        *,
+        sample_interval_ms: int = 50,
+        dump_interval_s: int = 300,
+        trace_memory: bool = False,
+        max_dumps: int = 20,
+        max_stack_depth: int = 48,
+    ) -> None:
+        self._logger = logger
+        self._thread_controller = thread_controller
+        self._output_dir = output_dir
+        self._sample_interval = max(sample_interval_ms, 1) / 1000
+        self._dump_interval = max(dump_interval_s, 1)
+        self._trace_memory = trace_memory
+        self._max_dumps = max_dumps
+        self._max_stack_depth = max_stack_depth
+
+        self._stacks: Counter[str] = Counter()
+        self._sample_count = 0
+        self._previous_snapshot: Optional[tracemalloc.Snapshot] = None
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._main_thread_ident = threading.main_thread().ident
+
+    # ------------------------------ public API --------------------------- #
+    @property
+    def is_running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        """Start sampling on a background daemon thread."""
+        if self.is_running:
+            return
+
+        self._output_dir.mkdir(parents=True, exist_ok=True)
+        if self._trace_memory and not tracemalloc.is_tracing():
+            # a single frame per allocation keeps the overhead tolerable
+            tracemalloc.start(1)
+
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._sample_loop, name="sampling-profiler", daemon=True)
+        self._thread.start()
+        self._logger.info(
+            f"[{threading.current_thread().name}] Profiling enabled, sampling every "
+            f"{self._sample_interval * 1000:.0f} ms, writing to {self._output_dir}"
+        )
+
+    def stop(self) -> None:
+        """Stop sampling and write a final dump."""
+        if not self.is_running:
+            return
+
+        self._stop_event.set()
+        self._thread.join(timeout=2)  # type: ignore[union-attr]
+        self._thread = None
+        self.dump()
+
+        if self._trace_memory and tracemalloc.is_tracing():
+            tracemalloc.stop()
+
+    def dump(self) -> None:
+        """Write the samples collected since the last dump to disk."""
+        stacks, sample_count = self._stacks, self._sample_count
+        self._stacks, self._sample_count = Counter(), 0
+
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        try:
+            if stacks:
+                folded_path = self._output_dir / f"profile_{timestamp}.folded"
+                with folded_path.open("w", encoding="utf-8") as fp:
+                    for stack, count in stacks.most_common():
+                        fp.write(f"{stack} {count}\n")
+                self._logger.info(
+                    f"[{threading.current_thread().name}] Wrote {sample_count} profile samples to {folded_path}"
+                )
+
+            if self._trace_memory and tracemalloc.is_tracing():
+                self._dump_memory(self._output_dir / f"profile_{timestamp}.tracemalloc.txt")
+
+            self._prune_dumps()
+        except OSError as exc:
+            self._logger.warning(f"[{threading.current_thread().name}] Failed to write profile dump: {exc}")
+
+    # -------------------------- internal utilities ----------------------- #
+    def _sample_loop(self) -> None:
+        next_dump = time.monotonic() + self._dump_interval
+        while not self._stop_event.wait(self._sample_interval):
+            self._take_sample()
+            if time.monotonic() >= next_dump:
+                self.dump()
+                next_dump = time.monotonic() + self._dump_interval
+
+    def _take_sample(self) -> None:
+        threads = self._thread_controller.worker_threads()
+        if self._main_thread_ident is not None:
+            threads.setdefault(self._main_thread_ident, "main")
+
+        frames = sys._current_frames()
+        for ident, thread_label in threads.items():
+            frame = frames.get(ident)
+            if frame is not None:
+                self._stacks[self._fold(thread_label, frame)] += 1
+        self._sample_count += 1
+
+    def _fold(self, thread_label: str, frame: Optional[FrameType]) -> str:
+        parts: list[str] = []
+        while frame is not None and len(parts) < self._max_stack_depth:
+            code = frame.f_code
+            parts.append(f"{code.co_name} ({Path(code.co_filename).name}:{frame.f_lineno})")
+            frame = frame.f_back
+        parts.append(thread_label)
+        return ";".join(reversed(parts))
+
+    def _dump_memory(self, path: Path) -> None:
+        snapshot = tracemalloc.take_snapshot().filter_traces(
+            (tracemalloc.Filter(False, tracemalloc.__file__),)
+        )
+        current, peak = tracemalloc.get_traced_memory()
+
+        with path.open("w", encoding="utf-8") as fp:
+            fp.write(f"traced current={current / 1024:.1f} KiB peak={peak / 1024:.1f} KiB\n\n")
+            fp.write("Top allocations\n")
+            for stat in snapshot.statistics("lineno")[:30]:
+                fp.write(f"{stat}\n")
+            if self._previous_snapshot is not None:
+                fp.write("\nGrowth since previous dump\n")
+                for stat in snapshot.compare_to(self._previous_snapshot, "lineno")[:30]:
+                    fp.write(f"{stat}\n")
+
+        self._previous_snapshot = snapshot
+
+    def _prune_dumps(self) -> None:
+        for pattern in ("profile_*.folded", "profile_*.tracemalloc.txt"):
+            dumps = sorted(self._output_dir.glob(pattern))
+            # not dumps[:-max_dumps], which is dumps[:0] (keep everything) for max_dumps == 0
+            for stale in dumps[: max(len(dumps) - self._max_dumps, 0)]:
+                stale.unlink(missing_ok=True)
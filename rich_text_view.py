@@ -0,0 +1,165 @@
+"""
+Rich Text View
+==============
+
+Displays the overlay's (rich) text from pre-built :class:`QTextDocument`\\ s.
+
+``QLabel.setText`` parses the HTML and lays it out again on every call,
+which for a monster message (several KB, many coloured spans) is the bulk
+of the UI-thread time of an overlay update.  :class:`DocumentCache` keeps
+parsed documents keyed by their text in a small LRU, so an entity that
+comes back is shown without parsing (and without layout unless the width
+changed), and :py:meth:`DocumentCache.prewarm` builds the documents of
+entities likely to be shown next while the UI is idle.  Resizing only
+re-lays-out the documents, it never fills the cache.
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+
+from PyQt6.QtCore import QRectF, QSize, Qt
+from PyQt6.QtGui import QAbstractTextDocumentLayout, QColor, QFont, QPainter, QPaintEvent, QPalette, QResizeEvent, QTextDocument
+from PyQt6.QtWidgets import QSizePolicy, QWidget
+
+HEIGHT_MEMO = 16  # widths whose height is remembered for the text on display
+
+
+class DocumentCache:
+    """LRU of parsed documents keyed by their text, laid out at the last width asked for.
+
+    Parameters
+    ----------
+    font
+        Default font of every document.
+    capacity
+        Documents kept; the least recently shown is dropped first.
+    """
+
+    def __init__(self, font: QFont, *, capacity: int = 64) -> None:
+        self._font = font
+        self._capacity = capacity
+        self._documents: OrderedDict[str, QTextDocument] = OrderedDict()
+
+        self.hits = 0
+        self.misses = 0
+        self.prewarmed = 0
+
+    def get(self, text: str, width: int) -> QTextDocument:
+        document = self._documents.get(text)
+        if document is not None:
+            self._documents.move_to_end(text)
+            self.hits += 1
+            if document.textWidth() != width:
+                document.setTextWidth(width)  # layout only, the HTML is not parsed again
+            return document
+        self.misses += 1
+        return self._store(text, self._build(text, width))
+
+    def prewarm(self, text: str, width: int) -> bool:
+        """Build the document for ``text`` unless it is cached; ``True`` if it was built."""
+        if text in self._documents:
+            return False
+        self.prewarmed += 1
+        self._store(text, self._build(text, width))
+        return True
+
+    def clear(self) -> None:
+        self._documents.clear()
+
+    def stats(self) -> dict[str, int]:
+        return {"size": len(self._documents), "hits": self.hits, "misses": self.misses, "prewarmed": self.prewarmed}
+
+    # -------------------------- internal utilities ----------------------- #
+    def _build(self, text: str, width: int) -> QTextDocument:
+        document = QTextDocument()
+        document.setDefaultFont(self._font)
+        document.setDocumentMargin(0)
+        if Qt.mightBeRichText(text):
+            document.setHtml(text)
+        else:
+            document.setPlainText(text)
+        document.setTextWidth(width)
+        document.size()  # forces the layout now rather than on first paint
+        return document
+
+    def _store(self, key: str, document: QTextDocument) -> QTextDocument:
+        self._documents[key] = document
+        while len(self._documents) > self._capacity:
+            self._documents.popitem(last=False)
+        return document
+
+
+class RichTextView(QWidget):
+    """Word-wrapped, top-left aligned text painted from a :class:`DocumentCache`.
+
+    A drop-in for the overlay's ``QLabel``: same text handling (HTML when
+    it looks like HTML, plain text otherwise) and a height-for-width size
+    hint, so it works inside a resizable ``QScrollArea``.
+    """
+
+    def __init__(self, text: str, cache: DocumentCache, color: QColor, parent: QWidget | None = None) -> None:
+        super().__init__(parent)
+        self._text = text
+        self._cache = cache
+        # heights of the current text by width: QScrollArea asks for the width with and without
+        # its scroll bar in turn, which would otherwise re-lay-out the one document every time
+        self._heights: dict[int, int] = {}
+        self._context = QAbstractTextDocumentLayout.PaintContext()
+        palette = QPalette(self._context.palette)
+        palette.setColor(QPalette.ColorRole.Text, color)
+        self._context.palette = palette
+        policy = QSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Preferred)
+        policy.setHeightForWidth(True)  # what QScrollArea checks, as for a word-wrapping QLabel
+        self.setSizePolicy(policy)
+
+    def text(self) -> str:
+        return self._text
+
+    def setText(self, text: str) -> None:
+        if text == self._text:
+            return
+        self._text = text
+        self._heights.clear()
+        self.updateGeometry()
+        self.update()
+
+    def text_width(self, width: int | None = None) -> int:
+        margins = self.contentsMargins()
+        return max((self.width() if width is None else width) - margins.left() - margins.right(), 1)
+
+    def document(self) -> QTextDocument:
+        return self._cache.get(self._text, self.text_width())
+
+    # ──────────────────────────  Qt overrides  ──────────────────────────
+    def hasHeightForWidth(self) -> bool:  # type: ignore[override]
+        return True
+
+    def heightForWidth(self, width: int) -> int:  # type: ignore[override]
+        text_width = self.text_width(width)
+        height = self._heights.get(text_width)
+        if height is None:
+            if len(self._heights) >= HEIGHT_MEMO:
+                self._heights.clear()  # a resize drag: the old widths will not come back
+            margins = self.contentsMargins()
+            document = self._cache.get(self._text, text_width)
+            height = self._heights[text_width] = int(document.size().height()) + margins.top() + margins.bottom()
+        return height
+
+    def sizeHint(self) -> QSize:  # type: ignore[override]
+        return QSize(self.width(), self.heightForWidth(self.width()))
+
+    def minimumSizeHint(self) -> QSize:  # type: ignore[override]
+        return QSize(0, 0)
+
+    def resizeEvent(self, event: QResizeEvent) -> None:  # type: ignore[override]
+        if event.size().width() != event.oldSize().width():
+            self.updateGeometry()
+        super().resizeEvent(event)
+
+    def paintEvent(self, event: QPaintEvent) -> None:  # type: ignore[override]
+        painter = QPainter(self)
+        margins = self.contentsMargins()
+        painter.translate(margins.left(), margins.top())
+        self._context.clip = QRectF(event.rect().translated(-margins.left(), -margins.top()))
+        self.document().documentLayout().draw(painter, self._context)
@@ -0,0 +1,261 @@
+"""
+Scheduler Worker
+================
+
+Runs many named periodic jobs on a single worker thread.
+
+Every job has its own interval, optional jitter and optional exponential
+backoff, and can be paused, resumed or triggered immediately from any
+thread.  A job backs off when it returns ``False`` or raises, and returns to
+its base interval on any other result; e.g. process discovery polls slowly
+while the game is absent and every second once it is running.
+
+Jobs normally run on the scheduler thread.  Jobs that touch Qt objects or
+the :class:`~worker_framework.ThreadController` are added with
+``ui_thread=True`` and are dispatched to the thread that created the
+scheduler (the UI thread) instead.
+
+Run count, run time, failures, lateness and overruns (a run longer than the
+job's interval) are tracked per job; see :py:meth:`SchedulerWorker.stats`.
+"""
+
+from __future__ import annotations
+
+import random
+import threading
+import time
+import traceback
+from dataclasses import dataclass, field
+from logging import Logger
+from typing import Any, Callable, Dict, Optional
+
+from PyQt6.QtCore import QObject, pyqtSignal
+
+from worker_framework import Worker
+
+
+@dataclass
+class JobStats:
+    runs: int = 0
+    failures: int = 0
+    backoffs: int = 0
+    overruns: int = 0
+    total_run_s: float = 0.0
+    max_run_s: float = 0.0
+    last_run_s: float = 0.0
+    max_late_s: float = 0.0
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "runs": self.runs,
+            "failures": self.failures,
+            "backoffs": self.backoffs,
+            "overruns": self.overruns,
+            "mean_run_ms": round(self.total_run_s / self.runs * 1000, 2) if self.runs else 0.0,
+            "max_run_ms": round(self.max_run_s * 1000, 2),
+            "max_late_ms": round(self.max_late_s * 1000, 2),
+        }
+
+
+@dataclass
+class Job:
+    """A periodic job; see :py:meth:`SchedulerWorker.add_job` for the fields."""
+
+    name: str
+    callback: Callable[[], Any]
+    interval_s: float
+    max_interval_s: Optional[float] = None
+    jitter: float = 0.0
+    ui_thread: bool = False
+    paused: bool = False
+    current_interval_s: float = 0.0
+    next_run: float = 0.0
+    running: bool = False
+    run_requested: bool = False
+    stats: JobStats = field(default_factory=JobStats)
+
+
+class _UiDispatcher(QObject):
+    """Lives on the UI thread (it is not moved with the worker); runs ``ui_thread`` jobs there."""
+
+    run_job = pyqtSignal(str)
+
+    def __init__(self, execute: Callable[[str], None]):
+        super().__init__()
+        self._execute = execute
+        self.run_job.connect(self._on_run_job)
+
+    def _on_run_job(self, name: str) -> None:
+        self._execute(name)
+
+
+class SchedulerWorker(Worker):
+    """Hosts named periodic jobs on one thread.
+
+    All public methods are thread-safe.
+    """
+
+    def __init__(self, logger: Logger, name: str = "scheduler-worker"):
+        super().__init__(logger, name)
+        self._jobs: Dict[str, Job] = {}
+        self._condition = threading.Condition()
+        self._random = random.Random()
+        self._dispatcher = _UiDispatcher(self._run_ui_job)
+
+    # ------------------------------ public API --------------------------- #
+    def add_job(
+        self,
+        name: str,
+        callback: Callable[[], Any],
+        interval_s: float,
+        *,
+        max_interval_s: Optional[float] = None,
+        jitter: float = 0.0,
+        initial_delay_s: float = 0.0,
+        ui_thread: bool = False,
+    ) -> None:
+        """Schedule ``callback`` every ``interval_s`` seconds.
+
+        Args:
+            max_interval_s: Enables exponential backoff up to this interval
+            jitter: Random spread of each interval, as a fraction (0.1 = ±10 %)
+            initial_delay_s: Delay before the first run
+            ui_thread: Run on the UI thread instead of the scheduler thread
+        """
+        with self._condition:
+            self._jobs[name] = Job(
+                name=name,
+                callback=callback,
+                interval_s=interval_s,
+                max_interval_s=max_interval_s,
+                jitter=jitter,
+                ui_thread=ui_thread,
+                current_interval_s=interval_s,
+                next_run=time.monotonic() + initial_delay_s,
+            )
+            self._condition.notify()
+
+    def remove_job(self, name: str) -> None:
+        with self._condition:
+            self._jobs.pop(name, None)
+
+    def has_job(self, name: str) -> bool:
+        with self._condition:
+            return name in self._jobs
+
+    def pause(self, name: str) -> None:
+        with self._condition:
+            if name in self._jobs:
+                self._jobs[name].paused = True
+
+    def resume(self, name: str, run_now: bool = False) -> None:
+        with self._condition:
+            job = self._jobs.get(name)
+            if job is None or not job.paused:
+                return
+            job.paused = False
+            job.next_run = time.monotonic() + (0 if run_now else self._jittered(job))
+            self._condition.notify()
+
+    def run_now(self, name: str) -> None:
+        """Run a job as soon as possible and drop any backoff."""
+        with self._condition:
+            job = self._jobs.get(name)
+            if job is None:
+                return
+            job.current_interval_s = job.interval_s
+            if job.running:
+                job.run_requested = True
+            else:
+                job.next_run = time.monotonic()
+            self._condition.notify()
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        with self._condition:
+            return {
+                name: dict(job.stats.as_dict(), interval_s=round(job.current_interval_s, 3), paused=job.paused)
+                for name, job in self._jobs.items()
+            }
+
+    # -------------------------- worker internals ------------------------- #
+    def _on_stop_requested(self):
+        with self._condition:
+            self._condition.notify()
+
+    def _run(self):
+        while True:
+            with self._condition:
+                # checked under the lock: stop_work's notify cannot slip in before wait()
+                if self.is_stopping:
+                    break
+                job = self._next_job()
+                now = time.monotonic()
+                if job is None or job.next_run > now:
+                    self._condition.wait(None if job is None else job.next_run - now)
+                    continue
+                job.running = True
+                scheduled_for = job.next_run
+
+            if job.ui_thread:
+                self._dispatcher.run_job.emit(job.name)
+            else:
+                self._execute(job, scheduled_for)
+
+        self._logger.info(f"[{self._thread_name()}] {self.name} stopped, job stats: {self.stats()}")
+        self.finished.emit()
+
+    def _run_ui_job(self, name: str) -> None:
+        with self._condition:
+            job = self._jobs.get(name)
+            if job is None:
+                return
+            scheduled_for = job.next_run
+        self._execute(job, scheduled_for)
+
+    def _execute(self, job: Job, scheduled_for: float) -> None:
+        started = time.monotonic()
+        result: Any = None
+        failed = False
+        try:
+            result = job.callback()
+        except Exception as exc:
+            failed = True
+            self._logger.warning(f"[{self._thread_name()}] job {job.name} failed: {exc}")
+            self._logger.debug(traceback.format_exc())
+        finished = time.monotonic()
+        self._complete(job, scheduled_for, started, finished, failed or result is False, failed)
+
+    def _complete(self, job: Job, scheduled_for: float, started: float, finished: float, back_off: bool, failed: bool):
+        run_s = finished - started
+        with self._condition:
+            stats = job.stats
+            stats.runs += 1
+            stats.failures += failed
+            stats.total_run_s += run_s
+            stats.last_run_s = run_s
+            stats.max_run_s = max(stats.max_run_s, run_s)
+            stats.max_late_s = max(stats.max_late_s, started - scheduled_for)
+            if run_s > job.current_interval_s:
+                stats.overruns += 1
+
+            if back_off and job.max_interval_s:
+                stats.backoffs += 1
+                job.current_interval_s = min(job.current_interval_s * 2, job.max_interval_s)
+            elif not back_off:
+                job.current_interval_s = job.interval_s
+
+            job.running = False
+            # a run_now() that arrived during the run is honoured straight away
+            job.next_run = finished if job.run_requested else finished + self._jittered(job)
+            job.run_requested = False
+            self._condition.notify()
+
+    def _next_job(self) -> Optional[Job]:
+        ready = [job for job in self._jobs.values() if not job.paused and not job.running]
+        return min(ready, key=lambda job: job.next_run, default=None)
+
+    def _jittered(self, job: Job) -> float:
+        if not job.jitter:
+            return job.current_interval_s
+        spread = job.current_interval_s * job.jitter
+        return max(job.current_interval_s + self._random.uniform(-spread, spread), 0.0)
@@ -0,0 +1,296 @@
+"""
+Session Recorder
+================
+
+Records captured frames together with the OCR text and matched entity into a
+single SQLite file per session, without blocking the capture/OCR pipeline.
+
+``record()`` only enqueues the frame; fingerprinting, PNG encoding and the
+database writes happen on a background thread.  Frames whose downscaled
+fingerprint was already stored are not stored again, and consecutive
+identical observations are collapsed into one row with a ``repeats`` count.
+The sessions directory is kept under a disk quota by removing the oldest
+sessions first; if the current session alone exceeds it, further frames are
+recorded as text only.
+
+Layout of a session file::
+
+    meta(key, value)                         -- format version, client version…
+    frames(id, fingerprint, width, height, png)
+    records(id, captured_at, frame_id, ocr_text, entity, repeats)
+
+Use :class:`SessionReader` to iterate a session for regression or benchmark
+replay (see :class:`capture_worker.ReplayCaptureWorker`).
+"""
+
+from __future__ import annotations
+
+import hashlib
+import io
+import queue
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from logging import Logger
+from pathlib import Path
+from typing import Iterator, Optional
+
+from PIL import Image
+
+FORMAT_VERSION = "1"
+FINGERPRINT_SIZE = (64, 36)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT);
+CREATE TABLE IF NOT EXISTS frames (
+    id INTEGER PRIMARY KEY,
+    fingerprint BLOB UNIQUE NOT NULL,
+    width INTEGER NOT NULL,
+    height INTEGER NOT NULL,
+    png BLOB NOT NULL
+);
+CREATE TABLE IF NOT EXISTS records (
+    id INTEGER PRIMARY KEY,
+    captured_at REAL NOT NULL,
+    frame_id INTEGER REFERENCES frames(id),
+    ocr_text TEXT NOT NULL,
+    entity TEXT,
+    repeats INTEGER NOT NULL DEFAULT 1
+);
+CREATE INDEX IF NOT EXISTS records_entity ON records(entity);
+CREATE INDEX IF NOT EXISTS records_frame ON records(frame_id);
+"""
+
+
+def frame_fingerprint(image: Image.Image) -> bytes:
+    """Digest of a small greyscale thumbnail; equal for visually unchanged frames."""
+    thumbnail = image.convert("L").resize(FINGERPRINT_SIZE, Image.Resampling.BILINEAR)
+    return hashlib.blake2b(thumbnail.tobytes(), digest_size=16).digest()
+
+
+class SessionRecorder:
+    """Background writer of frames, OCR text and matched entities.
+
+    Parameters
+    ----------
+    logger
+        App‑wide logger instance.
+    output_dir
+        Directory holding one ``session_*.sqlite`` file per session.
+    client_version
+        Stored in the session metadata.
+    quota_bytes
+        Upper bound for the total size of ``output_dir``.
+    max_pending
+        Frames waiting to be written; further frames are dropped (and counted)
+        rather than blocking the caller.
+    """
+
+    def __init__(
+        self,
+        logger: Logger,
+        output_dir: Path,
+        client_version: str,
+        *,
+        quota_bytes: int = 512 * 1024 * 1024,
+        max_pending: int = 8,
+    ) -> None:
+        self._logger = logger
+        self._output_dir = output_dir
+        self._client_version = client_version
+        self._quota_bytes = quota_bytes
+        self._queue: "queue.Queue[Optional[tuple[float, Image.Image, str, Optional[str]]]]" = queue.Queue(
+            maxsize=max_pending
+        )
+        self._thread: Optional[threading.Thread] = None
+        self.session_path: Optional[Path] = None
+
+        self.recorded = 0
+        self.deduplicated = 0
+        self.dropped = 0
+        self._frames_disabled = False
+        self._failed = False  # the writer thread gave up; nothing is queued any more
+
+    # ------------------------------ public API --------------------------- #
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self._output_dir.mkdir(parents=True, exist_ok=True)
+        self.session_path = self._output_dir / f"session_{datetime.now().strftime('%Y%m%d_%H%M%S')}.sqlite"
+        self._thread = threading.Thread(target=self._write_loop, name="session-recorder", daemon=True)
+        self._thread.start()
+        self._logger.info(f"[{threading.current_thread().name}] Recording session to {self.session_path}")
+
+    def stop(self) -> None:
+        if self._thread is None:
+            return
+        if self._thread.is_alive():
+            try:
+                self._queue.put(None, timeout=5)
+            except queue.Full:
+                self._logger.warning(f"[{threading.current_thread().name}] Session recorder is not draining its queue")
+            self._thread.join(timeout=5)
+        self._thread = None
+        self._logger.info(
+            f"[{threading.current_thread().name}] Session recorder stopped: {self.recorded} records, "
+            f"{self.deduplicated} duplicate frames skipped, {self.dropped} frames dropped"
+        )
+
+    def record(self, image: Image.Image, ocr_text: str, entity: Optional[str]) -> None:
+        """Queue a frame for recording; never blocks the calling thread."""
+        if self._failed:
+            self.dropped += 1
+            return
+        try:
+            self._queue.put_nowait((time.time(), image, ocr_text, entity))
+        except queue.Full:
+            self.dropped += 1
+
+    # -------------------------- internal utilities ----------------------- #
+    def _write_loop(self) -> None:
+        try:
+            self._write_session()
+        except Exception as exc:
+            self._failed = True
+            self._logger.error(f"[{threading.current_thread().name}] Session recording failed, recording is off: {exc}")
+
+    def _write_session(self) -> None:
+        connection = sqlite3.connect(self.session_path)  # type: ignore[arg-type]
+        try:
+            connection.executescript(_SCHEMA)
+            connection.executemany(
+                "INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)",
+                [
+                    ("format_version", FORMAT_VERSION),
+                    ("client_version", self._client_version),
+                    ("created_at", datetime.now().isoformat()),
+                ],
+            )
+            connection.commit()
+            self._enforce_quota()
+
+            known_frames: dict[bytes, int] = {}
+            last: Optional[tuple[Optional[int], str, Optional[str], int]] = None  # frame, text, entity, row id
+
+            while (item := self._queue.get()) is not None:
+                captured_at, image, ocr_text, entity = item
+                try:
+                    frame_id = self._store_frame(connection, known_frames, image)
+                    if last is not None and last[:3] == (frame_id, ocr_text, entity):
+                        connection.execute("UPDATE records SET repeats = repeats + 1 WHERE id = ?", (last[3],))
+                    else:
+                        cursor = connection.execute(
+                            "INSERT INTO records (captured_at, frame_id, ocr_text, entity) VALUES (?, ?, ?, ?)",
+                            (captured_at, frame_id, ocr_text, entity),
+                        )
+                        last = (frame_id, ocr_text, entity, cursor.lastrowid)  # type: ignore[assignment]
+                    connection.commit()
+                    self.recorded += 1
+                except Exception as exc:  # one bad frame (sqlite, disk, PIL) must not end the session
+                    self._logger.warning(f"[{threading.current_thread().name}] Failed to record frame: {exc}")
+        finally:
+            connection.close()
+
+    def _store_frame(self, connection: sqlite3.Connection, known_frames: dict[bytes, int], image: Image.Image) -> Optional[int]:
+        fingerprint = frame_fingerprint(image)
+        if fingerprint in known_frames:
+            self.deduplicated += 1
+            return known_frames[fingerprint]
+        if self._frames_disabled:
+            return None
+
+        buffer = io.BytesIO()
+        # speed over ratio – this runs once per *new* frame
+        image.save(buffer, format="PNG", compress_level=1)
+        cursor = connection.execute(
+            "INSERT INTO frames (fingerprint, width, height, png) VALUES (?, ?, ?, ?)",
+            (fingerprint, image.width, image.height, buffer.getvalue()),
+        )
+        known_frames[fingerprint] = cursor.lastrowid  # type: ignore[assignment]
+
+        if not self._enforce_quota():
+            self._frames_disabled = True
+            self._logger.warning(
+                f"[{threading.current_thread().name}] Session quota reached, recording OCR text without frames"
+            )
+        return cursor.lastrowid
+
+    def _enforce_quota(self) -> bool:
+        """Delete the oldest other sessions until under quota; False if that was not enough."""
+        sessions = sorted(self._output_dir.glob("session_*.sqlite"))
+        total = sum(path.stat().st_size for path in sessions)
+        for stale in sessions:
+            if total <= self._quota_bytes:
+                break
+            if stale == self.session_path:
+                continue
+            total -= stale.stat().st_size
+            stale.unlink(missing_ok=True)
+            self._logger.info(f"[{threading.current_thread().name}] Removed old session {stale.name} to stay under quota")
+        return total <= self._quota_bytes
+
+
+@dataclass
+class RecordedFrame:
+    """A single observation from a recorded session."""
+
+    record_id: int
+    captured_at: float
+    frame_id: Optional[int]
+    ocr_text: str
+    entity: Optional[str]
+    repeats: int
+    png: Optional[bytes]
+
+    def image(self) -> Optional[Image.Image]:
+        if self.png is None:
+            return None
+        return Image.open(io.BytesIO(self.png))
+
+
+class SessionReader:
+    """Read-only access to a session file written by :class:`SessionRecorder`."""
+
+    def __init__(self, path: Path | str) -> None:
+        self.path = Path(path)
+        self._connection = sqlite3.connect(f"file:{self.path}?mode=ro", uri=True, check_same_thread=False)
+
+    def close(self) -> None:
+        self._connection.close()
+
+    def __enter__(self) -> "SessionReader":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    @property
+    def meta(self) -> dict[str, str]:
+        return dict(self._connection.execute("SELECT key, value FROM meta"))
+
+    def __len__(self) -> int:
+        return self._connection.execute("SELECT COUNT(*) FROM records").fetchone()[0]
+
+    def records(self, *, with_frames_only: bool = False) -> Iterator[RecordedFrame]:
+        """Yield every record in capture order."""
+        query = (
+            "SELECT records.id, captured_at, frame_id, ocr_text, entity, repeats, frames.png "
+            "FROM records LEFT JOIN frames ON frames.id = records.frame_id "
+        )
+        if with_frames_only:
+            query += "WHERE records.frame_id IS NOT NULL "
+        query += "ORDER BY records.id"
+        for row in self._connection.execute(query):
+            yield RecordedFrame(*row)
+
+    def labelled_frames(self) -> Iterator[RecordedFrame]:
+        """Yield each distinct stored frame once, with its first observation's labels."""
+        for row in self._connection.execute(
+            "SELECT records.id, captured_at, frame_id, ocr_text, entity, repeats, frames.png "
+            "FROM records JOIN frames ON frames.id = records.frame_id "
+            "WHERE records.id IN (SELECT MIN(id) FROM records GROUP BY frame_id) "
+            "ORDER BY records.id"
+        ):
+            yield RecordedFrame(*row)
@@ -1,23 +1,52 @@
 from abc import ABC, abstractmethod
-from psutil import Process
 from typing import Optional
-from psutil import process_iter
+
+import psutil
+from psutil import Process
+
 
 class BaseSystemHandler(ABC):
-    """Base class for system-specific process and window handling."""
+    """Base class for system-specific process and window handling.
+
+    Process lookups go through :py:meth:`pids`, :py:meth:`process_name` and
+    :py:meth:`is_process_alive` so discovery can scan incrementally (and so a
+    fake process table can stand in for benchmarks).
+    """
+
+    def pids(self) -> list[int]:
+        """PIDs of every running process (cheap: no per-process queries)."""
+        return psutil.pids()
+
+    def process_name(self, pid: int) -> Optional[str]:
+        """Name of process ``pid``, or ``None`` if it is gone or inaccessible."""
+        try:
+            return Process(pid).name()
+        except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
+            return None
+
+    def is_process_alive(self, pid: int) -> bool:
+        return psutil.pid_exists(pid)
 
     def get_process_by_name(self, process_name: str) -> Optional[Process]:
-        """Find a process by its name."""
-        return next(
-            (p for p in process_iter(["name", "pid"]) if p.info["name"] == process_name),
-            None,
-        )
+        """Find a process by its name (full scan)."""
+        for pid in self.pids():
+            if self.process_name(pid) == process_name:
+                try:
+                    return Process(pid)
+                except psutil.NoSuchProcess:
+                    continue
+        return None
 
     @abstractmethod
     def find_process_main_window_handle(self, process_id: int) -> Optional[int]:
         """Find the main window handle for a given process."""
         pass
 
+    @abstractmethod
+    def is_window_valid(self, window_handle: int) -> bool:
+        """Whether a handle returned by :py:meth:`find_process_main_window_handle` still exists."""
+        pass
+
 
 class WindowsSystemHandler(BaseSystemHandler):
     """Windows-specific system handler."""
@@ -44,6 +73,9 @@ class WindowsSystemHandler(BaseSystemHandler):
         self.win32gui.EnumWindows(enum_callback, None)
         return result
 
+    def is_window_valid(self, window_handle: int) -> bool:
+        return bool(self.win32gui.IsWindow(window_handle))
+
 
 class MacSystemHandler(BaseSystemHandler):
     """Mac-specific system handler."""
@@ -52,3 +84,7 @@ class MacSystemHandler(BaseSystemHandler):
         # On macOS, we return the process ID itself as the "handle"
         # since we'll use it with Qt's window management
         return process_id
+
+    def is_window_valid(self, window_handle: int) -> bool:
+        # the "handle" is the PID
+        return self.is_process_alive(window_handle)
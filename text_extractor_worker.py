@@ -9,21 +9,26 @@ If you need pre‑processing, do it upstream and feed the cleaned bitmap to the
 extractor.
 """
 
+import math
 import os
+import time
+from collections import deque
 from pathlib import Path
-from typing import List
+from typing import List, Optional, Tuple
 import threading
 
 from PIL import Image
 import pytesseract
 from pytesseract import Output
-from PyQt6.QtCore import pyqtSignal
+from PyQt6.QtCore import QCoreApplication, QObject, QTimer, Qt, pyqtSignal, pyqtSlot
+from PyQt6.QtGui import QGuiApplication
 
 from configuration import Configuration
 from logging import Logger
 from worker_framework import Worker
 from message_builder import MessageBuilder
-from capture_worker import BaseCaptureWorker, FailedToFindWindowError
+from capture_worker import BaseCaptureWorker, FailedToFindWindowError, SharedCaptureSource
+from session_recorder import SessionRecorder
 
 
 class TextExtractor:
@@ -40,6 +45,15 @@ class TextExtractor:
     tess_config
         Extra config string(s) forwarded to Tesseract.  The historical
         default ``"bazaar_terms"`` is kept for backward compatibility.
+    psm, oem
+        Page segmentation mode and OCR engine mode; ``None`` keeps what
+        ``tess_config`` sets.  The build writes ``tessedit_pageseg_mode 11``
+        into ``bazaar_terms``, and Tesseract lets a config file's mode win
+        over ``--psm``, so the mode is also passed as a ``-c`` variable
+        (those are applied after config files).
+    confidence_threshold
+        Default for :py:meth:`extract_text`.  ``python -m ocr_tests.sweep``
+        measures the trade-offs of these settings.
     """
 
     def __init__(
@@ -49,11 +63,18 @@ class TextExtractor:
         *,
         lang: str = "eng",
         tess_config: str = "bazaar_terms",
+        psm: Optional[int] = None,
+        oem: Optional[int] = None,
+        confidence_threshold: int = 80,
     ) -> None:
         self._configuration = configuration
         self._logger = logger
         self._lang = lang
-        self._tess_config = tess_config
+        flags = [f"--psm {psm}", f"-c tessedit_pageseg_mode={psm}"] if psm is not None else []
+        if oem is not None:
+            flags.append(f"--oem {oem}")
+        self._tess_config = " ".join([*flags, tess_config])
+        self._confidence_threshold = confidence_threshold
 
         self._prepare_tesseract_paths()
 
@@ -62,7 +83,7 @@ class TextExtractor:
         self,
         image: Image.Image,
         *,
-        confidence_threshold: int = 80,
+        confidence_threshold: Optional[int] = None,
     ) -> str:
         """OCR a :class:`PIL.Image.Image` and return a *single* text string.
 
@@ -72,23 +93,22 @@ class TextExtractor:
             RGB or RGBA PIL image.
         confidence_threshold
             Any Tesseract word candidate below this value (0‑100) is thrown
-            away.  Default is **80**.
+            away.  Defaults to the extractor's, **80** unless configured.
         """
-        self._logger.debug(f"[{threading.current_thread().name}] Extracting text (conf>=%d)", confidence_threshold)
+        if confidence_threshold is None:
+            confidence_threshold = self._confidence_threshold
+        self._logger.debug("[%s] Extracting text (conf>=%d)", threading.current_thread().name, confidence_threshold)
+        return " ".join(txt for txt, conf in self.extract_words(image) if conf >= confidence_threshold)
 
+    def extract_words(self, image: Image.Image) -> List[Tuple[str, float]]:
+        """Every word Tesseract found in *image*, with its confidence (0‑100)."""
         tesser_data = pytesseract.image_to_data(
             image,
             lang=self._lang,
             config=self._tess_config,
             output_type=Output.DICT,
         )
-
-        keep: List[str] = [
-            txt
-            for txt, conf in zip(tesser_data["text"], tesser_data["conf"])
-            if txt.strip() and int(conf) >= confidence_threshold
-        ]
-        return " ".join(keep)
+        return [(txt, float(conf)) for txt, conf in zip(tesser_data["text"], tesser_data["conf"]) if txt.strip()]
 
     def extract_text_from_file(
         self,
@@ -118,9 +138,122 @@ class TextExtractor:
         )
 
 
-class TextExtractorWorker(Worker):
+def _refresh_interval_s() -> float:
+    """Time between two refreshes of the primary display (60 Hz when unknown)."""
+    app = QCoreApplication.instance()
+    screen = app.primaryScreen() if isinstance(app, QGuiApplication) else None
+    rate = screen.refreshRate() if screen is not None else 0.0
+    return 1 / rate if rate > 0 else 1 / 60
+
+
+class MessageCoalescer(QObject):
+    """Hands the pool's results to the UI thread, latest wins.
+
+    Workers :py:meth:`submit` from their own threads; ``message_ready`` is
+    emitted on the UI thread at most once per display refresh, with the
+    newest message.  On the way:
+
+    * a result from an older frame than one already submitted is dropped
+      (``stale``) – several workers finish out of order,
+    * a message still waiting for the next refresh is replaced by a newer
+      one (``coalesced``).
+
+    Repeats of the message on screen are still delivered: the overlay's
+    text may have been set from elsewhere since (a status line, the update
+    prompt), and :py:meth:`overlay.Overlay.set_message` skips real repeats.
+
+    Only one wake-up is ever queued to the UI thread, however fast frames
+    come in.  Create it on the UI thread.
+    """
 
     message_ready = pyqtSignal(str)
+    _wake = pyqtSignal()
+
+    def __init__(self, logger: Logger, *, min_interval_s: Optional[float] = None, parent: Optional[QObject] = None):
+        super().__init__(parent)
+        self._logger = logger
+        self._min_interval_s = _refresh_interval_s() if min_interval_s is None else min_interval_s
+        self._lock = threading.Lock()
+        self._latest_sequence = 0
+        self._pending: Optional[str] = None
+        self._scheduled = False
+        self._closed = False
+        self._last_delivery = -math.inf
+
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setTimerType(Qt.TimerType.PreciseTimer)
+        self._timer.timeout.connect(self._flush)
+        self._wake.connect(self._on_wake)
+
+        self.submitted = 0
+        self.delivered = 0
+        self.stale = 0
+        self.coalesced = 0
+
+    def submit(self, sequence: int, message: str) -> bool:
+        """Offer the message built from frame *sequence*; ``False`` if a newer frame was already submitted."""
+        with self._lock:
+            self.submitted += 1
+            if sequence <= self._latest_sequence:
+                self.stale += 1
+                return False
+            self._latest_sequence = sequence
+            if self._pending is not None:
+                self.coalesced += 1
+            self._pending = message
+            if self._scheduled or self._closed:
+                return True
+            self._scheduled = True
+        self._wake.emit()
+        return True
+
+    def close(self) -> None:
+        """Deliver nothing more (the pool is going away)."""
+        with self._lock:
+            self._closed = True
+            self._pending = None
+        self._timer.stop()
+        self._logger.info("Message coalescer closed: %s", self.stats())
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "submitted": self.submitted,
+            "delivered": self.delivered,
+            "stale": self.stale,
+            "coalesced": self.coalesced,
+        }
+
+    # -------------------------- internal utilities ----------------------- #
+    @pyqtSlot()
+    def _on_wake(self) -> None:
+        wait_s = self._last_delivery + self._min_interval_s - time.perf_counter()
+        if wait_s <= 0:
+            self._flush()
+        else:
+            self._timer.start(math.ceil(wait_s * 1000))
+
+    @pyqtSlot()
+    def _flush(self) -> None:
+        with self._lock:
+            message, self._pending = self._pending, None
+            self._scheduled = False
+            if self._closed or message is None:
+                return
+            self.delivered += 1
+        self._last_delivery = time.perf_counter()
+        self.message_ready.emit(message)
+
+
+class TextExtractorWorker(Worker):
+    """OCRs frames from a shared capture source and emits the matched entity's message.
+
+    After ``MAX_CONSECUTIVE_ERRORS`` failed frames in a row ``_run`` raises, so
+    a supervising :class:`~worker_framework.ThreadController` can restart it.
+    """
+
+    MAX_CONSECUTIVE_ERRORS = 10
+
     window_closed = pyqtSignal()
 
     def __init__(
@@ -129,68 +262,77 @@ class TextExtractorWorker(Worker):
         configuration: Configuration,
         message_builder: MessageBuilder,
         text_extractor: TextExtractor,
-        capture_worker: BaseCaptureWorker,
+        frame_source: SharedCaptureSource,
+        coalescer: MessageCoalescer,
         logger: Logger,
+        session_recorder: Optional[SessionRecorder] = None,
     ):
         super().__init__(logger, name)
         self._message_builder = message_builder
         self._text_extractor = text_extractor
         self._configuration = configuration
-        self._capture_worker = capture_worker
+        self._frame_source = frame_source
+        self._coalescer = coalescer
+        self._session_recorder = session_recorder
+        self._thread_label = threading.current_thread().name
+        self.frames_processed = 0
 
-    def process_frame(self, image: Image.Image) -> None:
+    def process_frame(self, image: Image.Image, sequence: int) -> None:
         try:
-            if self._configuration.save_images:
-                from datetime import datetime
-
-                filename = datetime.now().strftime("%Y%m%d_%H%M%S_%f") + ".png"
-                image.save(self._configuration.system_path / filename)
             text = self._text_extractor.extract_text(image)
-            self._logger.info(f"[{threading.current_thread().name}] parsed text: {text}")
-            if message := self._message_builder.get_message(text):
-                self._logger.info(f"[{threading.current_thread().name}] built message: {message}")
-                self.message_ready.emit(message)
+            self._logger.info("[%s] parsed text (frame %d): %s", self._thread_label, sequence, text)
+            entity = self._message_builder.match_entity(text)
+            if self._session_recorder:
+                self._session_recorder.record(image, text, entity.get("name") if entity else None)
+            if entity and (message := entity.get("display_message")):
+                self._logger.debug("[%s] built message: %s", self._thread_label, message)
+                if not self._coalescer.submit(sequence, message):
+                    self._logger.debug("[%s] dropped result of frame %d, a newer frame was shown", self._thread_label, sequence)
         except (AttributeError, PermissionError):
             pass
+        finally:
+            self.frames_processed += 1
 
     def _run(self):
+        # looked up once; the hot loop below only passes it as a lazy log argument
+        self._thread_label = threading.current_thread().name
         internal_capture_error_count = 0
-        arr_of_errors = []
+        recent_errors: deque[Exception] = deque(maxlen=self.MAX_CONSECUTIVE_ERRORS)
         while not self.is_stopping:
             try:
-                image = self._capture_worker.capture_image_sync()
-                if image is None:
-                    self._logger.info(f"[{threading.current_thread().name}] No image captured")
+                frame = self._frame_source.next_frame()
+                if frame is None:
+                    self._logger.debug("[%s] No new image captured", self._thread_label)
                     continue
-                self._logger.info(f"[{threading.current_thread().name}] Captured image, processing frame")
-                self.process_frame(image)
-                self._logger.info(f"[{threading.current_thread().name}] Frame processed")
+                self._logger.debug("[%s] Captured frame %d, processing", self._thread_label, frame.sequence)
+                self.process_frame(frame.image, frame.sequence)
+                self._logger.debug("[%s] Frame processed", self._thread_label)
                 internal_capture_error_count = 0
             except FailedToFindWindowError:
-                self._logger.info(f"[{threading.current_thread().name}] Failed to find window to capture, stopping")
+                self._logger.info("[%s] Failed to find window to capture, stopping", self._thread_label)
                 self.window_closed.emit()
                 break
             except Exception as exc:
                 internal_capture_error_count += 1
                 self._logger.error(
-                    f"[{threading.current_thread().name}] An error occurred while capturing the image and extracting text. This is attempt {internal_capture_error_count} of 10"
+                    "[%s] An error occurred while capturing the image and extracting text. This is attempt %d of %d",
+                    self._thread_label,
+                    internal_capture_error_count,
+                    self.MAX_CONSECUTIVE_ERRORS,
                 )
-                arr_of_errors.append(exc)
-                if internal_capture_error_count >= 10:
-                    self.message_ready.emit(
-                        "An internal error occurred while capturing a screenshot and extracting text. Please visit the Bazaar Buddy discord server and report this issue."
-                    )
+                recent_errors.append(exc)
+                if internal_capture_error_count >= self.MAX_CONSECUTIVE_ERRORS:
                     self._logger.error(
-                        f"[{threading.current_thread().name}] Too many internal capture errors, printing out all errors and raising most recent error as exception"
+                        "[%s] Too many internal capture errors, printing out all errors and raising most recent error as exception",
+                        self._thread_label,
                     )
-                    for index, error in enumerate(arr_of_errors):
-                        self._logger.error(f"[{threading.current_thread().name}] Error ({index}): {error}")
+                    for index, error in enumerate(recent_errors):
+                        self._logger.error("[%s] Error (%d): %s", self._thread_label, index, error)
                     raise exc
                 # continue trying to capture the image
                 continue
 
     def _on_stop_requested(self):
-        self.message_ready.disconnect()
         self.window_closed.disconnect()
 
 
@@ -202,22 +344,31 @@ class TextExtractorWorkerFactory:
         text_extractor: TextExtractor,
         capture_worker: BaseCaptureWorker,
         logger: Logger,
+        session_recorder: Optional[SessionRecorder] = None,
     ):
         self.configuration = configuration
         self.message_builder = message_builder
         self.text_extractor = text_extractor
         self.capture_worker = capture_worker
         self.logger = logger
-
-    def create(self, name: str):
-        return TextExtractorWorker(
-            name,
-            self.configuration,
-            self.message_builder,
-            self.text_extractor,
-            self.capture_worker,
-            self.logger,
-        )
+        self.session_recorder = session_recorder
+
+    def create_pool(self, name: str, size: int, coalescer: MessageCoalescer) -> List[TextExtractorWorker]:
+        """Workers ``<name>-0`` … sharing one capture source and handing their messages to *coalescer*."""
+        frame_source = SharedCaptureSource(self.capture_worker)
+        return [
+            TextExtractorWorker(
+                f"{name}-{index}",
+                self.configuration,
+                self.message_builder,
+                self.text_extractor,
+                frame_source,
+                coalescer,
+                self.logger,
+                self.session_recorder,
+            )
+            for index in range(size)
+        ]
 
 
 # --------------------------------------------------------------------- #
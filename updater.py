@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import hashlib
 import os
 import shutil
 import subprocess
@@ -9,8 +10,10 @@ from abc import ABC, ABCMeta, abstractmethod
 from pathlib import Path
 from typing import Optional
 
+from datetime import datetime
+
 import requests
-from PyQt6.QtCore import QObject, pyqtSignal
+from PyQt6.QtCore import QObject, QThread, pyqtSignal
 import requests, tempfile, subprocess, sys
 import subprocess
 from PyQt6.QtWidgets import QApplication
@@ -19,64 +22,153 @@ import threading
 from configuration import Configuration
 from logging import Logger
 from overlay import Overlay
+from file_writer import BaseFileWriter, PendingUpdateData, ReleaseCacheData
+from worker_framework import ThreadController, Worker
+from downloader import DownloadWorker, parse_sha256_digest
+from scheduler_worker import SchedulerWorker
+from delta_patch import apply_patch_file, patch_asset_name
 
 
 # ───────────────────────────────────────────────────────────────
-#  Update-source helpers (unchanged – included for completeness)
+#  Update-source helpers
 # ───────────────────────────────────────────────────────────────
 
+GITHUB_API_URL = "https://api.github.com"
+
+
 class BaseUpdateSource(ABC):
-    def __init__(self, logger: Logger):
+    """
+    Fetches release metadata from the GitHub API.
+
+    Nothing happens on construction; :py:meth:`fetch_latest_release` is meant
+    to be called off the UI thread (see :class:`UpdateCheckWorker`).  The last
+    response is cached through ``cache_writer`` together with its ``ETag`` /
+    ``Last-Modified`` validators, so repeated checks are conditional requests
+    and a slow or failing network falls back to the last known release.
+    """
+
+    def __init__(
+        self,
+        logger: Logger,
+        cache_writer: Optional[BaseFileWriter] = None,
+        api_url: str = GITHUB_API_URL,
+    ):
         self.logger = logger
-        self.latest_release: dict = self._get_latest_release()
+        self._cache_writer = cache_writer
+        self._api_url = api_url.rstrip("/")
+        self._cache: Optional[ReleaseCacheData] = None
+        self._cache_loaded = False
+
+    @property
+    def latest_release(self) -> dict:
+        """Last known release (empty until a check succeeded or a cache exists)."""
+        cache = self._load_cache()
+        return cache.release if cache else {}
+
+    def fetch_latest_release(self) -> dict:
+        """Revalidate the latest release; returns the last known one on failure."""
+        thread_name = threading.current_thread().name
+        url = self._release_url()
+        cache = self._load_cache()
+
+        headers = {"Accept": "application/vnd.github+json"}
+        if cache and cache.etag:
+            headers["If-None-Match"] = cache.etag
+        if cache and cache.last_modified:
+            headers["If-Modified-Since"] = cache.last_modified
+
+        try:
+            response = requests.get(url, headers=headers, timeout=(5, 30))
+        except requests.RequestException as exc:
+            self.logger.warning(f"[{thread_name}] Failed to reach {url}: {exc}")
+            return self.latest_release
+
+        if response.status_code == 304:
+            self.logger.info(f"[{thread_name}] Latest release unchanged since last check")
+            return self.latest_release
+
+        if response.status_code != 200:
+            self.logger.error(f"[{thread_name}] Failed to get latest version from GitHub ({response.status_code})")
+            return self.latest_release
+
+        self._cache = ReleaseCacheData(
+            url=url,
+            etag=response.headers.get("ETag"),
+            last_modified=response.headers.get("Last-Modified"),
+            release=response.json(),
+            fetched_at=datetime.now(),
+        )
+        if self._cache_writer:
+            self._cache_writer.write(self._cache)
+        return self._cache.release
+
+    def _load_cache(self) -> Optional[ReleaseCacheData]:
+        if not self._cache_loaded:
+            self._cache_loaded = True
+            cached = self._cache_writer.read() if self._cache_writer else None
+            # a cache written for another channel (test vs production) is useless
+            if isinstance(cached, ReleaseCacheData) and cached.url == self._release_url():
+                self._cache = cached
+        return self._cache
 
     @abstractmethod
-    def _get_latest_release(self) -> dict:  # pragma: no cover
+    def _release_url(self) -> str:  # pragma: no cover
         ...
 
 
 class ProductionUpdateSource(BaseUpdateSource):
-    def _get_latest_release(self) -> dict:
-        response = requests.get(
-            "https://api.github.com/repos/stonehenge-collective/bazaar-buddy-client/releases/latest",
-            timeout=30,
-        )
-        if response.status_code != 200:
-            self.logger.error("Failed to get latest version from GitHub")
-            raise RuntimeError("Failed to get latest version from GitHub")
-
-        return response.json()
+    def _release_url(self) -> str:
+        return f"{self._api_url}/repos/stonehenge-collective/bazaar-buddy-client/releases/latest"
 
 
 class TestUpdateSource(BaseUpdateSource):
-    def __init__(self, logger: Logger, specific_version: Optional[str] = None):
+    def __init__(
+        self,
+        logger: Logger,
+        cache_writer: Optional[BaseFileWriter] = None,
+        api_url: str = GITHUB_API_URL,
+        specific_version: Optional[str] = None,
+    ):
         self._specific_version = specific_version
-        super().__init__(logger)
+        super().__init__(logger, cache_writer, api_url)
 
-    def _get_latest_release(self) -> dict:
-        if self._specific_version:
-            url = (
-                "https://api.github.com/repos/stonehenge-collective/"
-                f"bazaar-buddy-client-test/releases/{self._specific_version}"
-            )
-        else:
-            url = (
-                "https://api.github.com/repos/stonehenge-collective/"
-                "bazaar-buddy-client-test/releases/latest"
-            )
+    def _release_url(self) -> str:
+        release = self._specific_version or "latest"
+        return f"{self._api_url}/repos/stonehenge-collective/bazaar-buddy-client-test/releases/{release}"
 
-        response = requests.get(url, timeout=30)
-        if response.status_code != 200:
-            self.logger.error("Failed to get latest version from GitHub")
-            raise RuntimeError("Failed to get latest version from GitHub")
 
-        return response.json()
+class UpdateCheckWorker(Worker):
+    """Runs a single release check off the UI thread.
+
+    Signals:
+        release_ready: Emitted with the latest known release metadata
+    """
+
+    release_ready = pyqtSignal(dict)
+
+    def __init__(self, logger: Logger, update_source: BaseUpdateSource, name: str = "update-check-worker"):
+        super().__init__(logger, name)
+        self._update_source = update_source
+
+    def _run(self):
+        release = self._update_source.fetch_latest_release()
+        if release and not self.is_stopping:
+            self.release_ready.emit(release)
+        self.finished.emit()
 
 
 # ───────────────────────────────────────────────────────────────
 #                    Updater class hierarchy
 # ───────────────────────────────────────────────────────────────
 
+def _file_sha256(path: Path) -> str:
+    digest = hashlib.sha256()
+    with path.open("rb") as handle:
+        for chunk in iter(lambda: handle.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
 class MetaQObjectABC(type(QObject), ABCMeta): # type: ignore
     """Metaclass that inherits from both pyqtWrapperType and ABCMeta."""
     pass
@@ -85,6 +177,11 @@ class BaseUpdater(QObject, metaclass=MetaQObjectABC):
     """
     Houses every bit of behaviour that is **identical** across platforms.
     Concrete subclasses only implement :pymeth:`install_update()`.
+
+    With ``background`` set the user is never prompted: new releases are
+    downloaded at low priority (throttled to ``bandwidth_limit_kbps``),
+    recorded through ``pending_writer`` and installed by
+    :py:meth:`apply_pending_update` on the next launch.
     """
 
     update_completed = pyqtSignal()
@@ -95,24 +192,109 @@ class BaseUpdater(QObject, metaclass=MetaQObjectABC):
         overlay: Overlay,
         logger: Logger,
         configuration: Configuration,
-        latest_release: dict,
+        update_source: BaseUpdateSource,
+        thread_controller: ThreadController,
+        download_dir: Path,
+        download_segments: int = 1,
+        pending_writer: Optional[BaseFileWriter] = None,
+        background: bool = False,
+        bandwidth_limit_kbps: int = 0,
     ):
         super().__init__()
         self.overlay = overlay
         self.logger = logger
         self.configuration = configuration
-        self.latest_release = latest_release
+        self.update_source = update_source
+        self.thread_controller = thread_controller
+        self.download_dir = download_dir
+        self.download_segments = download_segments
+        self.pending_writer = pending_writer
+        self.background = background and pending_writer is not None
+        self.bandwidth_limit_kbps = bandwidth_limit_kbps
+        self.latest_release: dict = {}
+        self._offered_versions: set[str] = set()
         self.thread_name = threading.current_thread().name
 
     # ───────────── public façade ─────────────
 
     def check_for_update(self) -> None:
-        """Entry-point: determine whether to prompt and (possibly) update."""
-        if self._update_available():
+        """Entry-point: check for a release in the background.
+
+        Returns immediately; the prompt (if any) appears once the release
+        metadata arrives from :class:`UpdateCheckWorker`.
+        """
+        worker = UpdateCheckWorker(self.logger, self.update_source)
+        if worker.name in self.thread_controller.workers:
+            self.logger.info(f"[{self.thread_name}] Update check already running")
+            return
+        worker.release_ready.connect(self._on_release_ready)
+        self.thread_controller.add_worker(worker)
+        self.thread_controller.start_worker(worker.name)
+
+    def start_periodic_checks(self, scheduler: SchedulerWorker, interval_minutes: float) -> None:
+        """Re-check for releases every ``interval_minutes`` while the app runs."""
+        interval_s = interval_minutes * 60
+        # jitter keeps a fleet of clients from hitting the release API in step
+        scheduler.add_job(
+            "update-check",
+            self.check_for_update,
+            interval_s,
+            jitter=0.1,
+            initial_delay_s=interval_s,
+            ui_thread=True,
+        )
+
+    def apply_pending_update(self) -> bool:
+        """Install an update downloaded in the background during an earlier run.
+
+        Meant to be called at launch before the event loop starts.  Returns
+        ``True`` when the new version has been launched and this process
+        should exit.
+        """
+        pending = self.pending_writer.read() if self.pending_writer else None
+        if not isinstance(pending, PendingUpdateData):
+            return False
+
+        # one attempt only: never loop on an update that fails to install
+        self.pending_writer.delete()
+        path = Path(pending.path)
+        if pending.tag_name == self.configuration.current_version or self.configuration.is_local:
+            return False
+        if not path.is_file() or path.stat().st_size != pending.size:
+            self.logger.warning(f"[{self.thread_name}] Pending update {pending.tag_name} is missing or incomplete")
+            return False
+        # the file has sat on disk since the last session; it is about to replace the running exe
+        if pending.sha256 and _file_sha256(path) != pending.sha256:
+            self.logger.warning(f"[{self.thread_name}] Pending update {pending.tag_name} does not match its checksum")
+            path.unlink(missing_ok=True)
+            return False
+
+        self.logger.info(f"[{self.thread_name}] Installing update {pending.tag_name} downloaded in the background")
+        try:
+            self._install_update(path)
+        except Exception as exc:
+            self.logger.error(f"[{self.thread_name}] Failed to install pending update: {exc}")
+            return False
+        return True
+
+    def _on_release_ready(self, latest_release: dict) -> None:
+        """Determine whether to prompt and (possibly) update."""
+        self.latest_release = latest_release
+        if not self._update_available():
+            self.update_completed.emit()
+            return
+
+        tag_name = self.latest_release["tag_name"]
+        if self.background and not self.configuration.is_local:
+            self._predownload_update()
+            self.update_completed.emit()
+        elif tag_name in self._offered_versions:
+            # periodic checks must not nag about a release already declined
+            self.update_completed.emit()
+        else:
             self.logger.info(f"[{self.thread_name}] Update available")
+            self._offered_versions.add(tag_name)
             self._prompt_for_update()
-        else:
-            self.update_completed.emit()
 
     # ───────────── common helpers ─────────────
 
@@ -153,70 +335,120 @@ class BaseUpdater(QObject, metaclass=MetaQObjectABC):
             return
 
         self._download_and_install_update()
-        self.update_completed.emit()
 
     def _update_declined(self) -> None:
         self.overlay.yes_clicked.disconnect(self._update_approved)
         self.overlay.no_clicked.disconnect(self._update_declined)
         self.update_completed.emit()
 
-    def _download_asset(self, url: str) -> Path:
-        """
-        Stream the asset into a temporary file and return its path,
-        updating the overlay with progress.
-        """
-        tmp_dir = Path(tempfile.mkdtemp(prefix="bb_update_"))
-        target = tmp_dir / url.split("/")[-1]
-
-        self.overlay.hide_prompt_buttons()
-        self.overlay.set_message("Downloading update… 0 %")
-        QApplication.processEvents()
+    def _find_asset(self, suffix: Optional[str] = None) -> Optional[dict]:
+        suffix = (suffix or self._ASSET_SUFFIX).lower()
+        for asset in self.latest_release.get("assets", []):
+            if asset.get("name", "").lower().endswith(suffix):
+                return asset
+        return None
 
-        with requests.get(url, stream=True, timeout=30) as resp:
-            resp.raise_for_status()
-            total = int(resp.headers.get("content-length", 0))
-            downloaded = 0
-            last_percent = -1
-
-            with open(target, "wb") as fp:
-                for chunk in resp.iter_content(chunk_size=8192):
-                    if not chunk:   # keep-alive
-                        continue
-                    fp.write(chunk)
-                    downloaded += len(chunk)
-
-                    if total:
-                        percent = int(downloaded * 100 / total)
-                        if percent != last_percent:
-                            last_percent = percent
-                            self.overlay.set_message(
-                                f"Downloading update… {percent} %"
-                            )
-                            QApplication.processEvents()
-
-        # Guarantee a final 100 %
-        self.overlay.set_message("Downloading update… 100 %")
-        QApplication.processEvents()
-        return target
-    
     def _find_asset_url(self) -> Optional[str]:
-        for asset in self.latest_release.get("assets", []):
-            if asset.get("name", "").lower().endswith(self._ASSET_SUFFIX):
-                return asset.get("browser_download_url")
+        asset = self._find_asset()
+        return asset.get("browser_download_url") if asset else None
+
+    def _create_download_worker(self, asset: dict, *, background: bool = False, **kwargs) -> DownloadWorker:
+        """Worker that fetches and verifies ``asset`` into the version's download dir."""
+        checksum_asset = self._find_asset(asset["name"] + ".sha256")
+        if background:
+            # sequential downloads resume across restarts; the cap keeps the game's bandwidth free
+            options = {"segments": 1, "max_bytes_per_second": self.bandwidth_limit_kbps * 1024 or None}
+        else:
+            options = {"segments": self.download_segments}
+        return DownloadWorker(
+            self.logger,
+            asset["browser_download_url"],
+            self._version_dir(self.latest_release.get("tag_name", "latest")) / asset["name"],
+            expected_sha256=parse_sha256_digest(asset.get("digest")),
+            checksum_url=checksum_asset.get("browser_download_url") if checksum_asset else None,
+            **options,
+            **kwargs,
+        )
+
+    def _version_dir(self, version: str) -> Path:
+        return self.download_dir / version
+
+    # ───────────── delta updates ─────────────
+
+    def _delta_source(self, asset: dict) -> Optional[Path]:
+        """Local copy of the *current* version of ``asset`` to patch, if any.
+
+        A previous update leaves the asset it installed in its version dir;
+        subclasses may add platform-specific fall-backs.
+        """
+        cached = self._version_dir(self.configuration.current_version) / asset["name"]
+        return cached if cached.is_file() else None
+
+    def _find_patch_asset(self, asset: dict) -> Optional[dict]:
+        name = patch_asset_name(asset["name"], self.configuration.current_version).lower()
+        for candidate in self.latest_release.get("assets", []):
+            if candidate.get("name", "").lower() == name and candidate.get("browser_download_url"):
+                return candidate
         return None
 
+    def _create_delta_worker(
+        self, asset: dict, patch_asset: dict, source: Path, *, background: bool = False
+    ) -> DownloadWorker:
+        """Worker that downloads ``patch_asset`` and applies it to ``source``."""
+        target = self._version_dir(self.latest_release.get("tag_name", "latest")) / asset["name"]
+        expected_sha256 = parse_sha256_digest(asset.get("digest"))
+
+        def apply(patch_path: Path) -> Path:
+            apply_patch_file(source, patch_path, target)
+            if expected_sha256 and _file_sha256(target) != expected_sha256:
+                target.unlink(missing_ok=True)
+                raise ValueError("Patched file does not match the release asset")
+            patch_path.unlink(missing_ok=True)
+            return target
+
+        return self._create_download_worker(
+            patch_asset, background=background, post_process=apply, name="update-delta-worker"
+        )
+
+    def _prune_downloads(self) -> None:
+        """Drop downloads of versions that are neither running nor being installed."""
+        keep = {self.configuration.current_version, self.latest_release.get("tag_name")}
+        if not self.download_dir.is_dir():
+            return
+        for version_dir in self.download_dir.iterdir():
+            if version_dir.is_dir() and version_dir.name not in keep:
+                shutil.rmtree(version_dir, ignore_errors=True)
+
+    def _start_update_download(self, asset: dict, *, background: bool = False) -> None:
+        """Download ``asset`` – through a delta patch when possible – on a worker."""
+        self._prune_downloads()
+
+        patch_asset = self._find_patch_asset(asset)
+        source = self._delta_source(asset) if patch_asset else None
+        if patch_asset and source:
+            self.logger.info(f"[{self.thread_name}] Downloading delta update from {patch_asset['browser_download_url']}")
+            worker = self._create_delta_worker(asset, patch_asset, source, background=background)
+            worker.download_failed.connect(lambda reason: self._on_delta_failed(asset, reason, background))
+        else:
+            self.logger.info(f"[{self.thread_name}] Downloading update from {asset['browser_download_url']}")
+            worker = self._create_download_worker(asset, background=background)
+            worker.download_failed.connect(self._on_predownload_failed if background else self._on_download_failed)
+        self._start_download_worker(worker, background)
+
     def _download_and_install_update(self) -> None:  # pragma: no cover
         """
         • Pick the correct release asset for the platform
-        • Download it (using :py:meth:`_download_asset`)
+        • Prefer a delta patch against the installed version, if one was published
+        • Download and verify on a :class:`DownloadWorker`, falling back to the
+          full asset when the patch cannot be used
         • Invoke the platform-specific helper script
         • Exit the running app (``sys.exit(0)``)
         """
+        self.overlay.hide_prompt_buttons()
         self.overlay.set_message("Downloading update…")
-        QApplication.processEvents()
 
-        download_url = self._find_asset_url()
-        if not download_url:
+        asset = self._find_asset()
+        if not asset or not asset.get("browser_download_url"):
             self.logger.error(f"[{self.thread_name}] No compatible package found, skipping update")
             self.overlay.set_message(
                 "Update failed: no release package found. Skipping."
@@ -224,15 +456,79 @@ class BaseUpdater(QObject, metaclass=MetaQObjectABC):
             self.update_completed.emit()
             return
 
-        self.logger.info(f"[{self.thread_name}] Downloading update from {download_url}")
-        downloaded_exe_path = self._download_asset(download_url)
+        self._start_update_download(asset)
+
+    def _predownload_update(self) -> None:
+        """Fetch the latest release in the background for the next launch."""
+        tag_name = self.latest_release["tag_name"]
+        pending = self.pending_writer.read() if self.pending_writer else None
+        if isinstance(pending, PendingUpdateData) and pending.tag_name == tag_name:
+            self.logger.info(f"[{self.thread_name}] Update {tag_name} already downloaded, installing on next launch")
+            return
+        if any(name in self.thread_controller.workers for name in ("update-download-worker", "update-delta-worker")):
+            self.logger.info(f"[{self.thread_name}] Update download already running")
+            return
+
+        asset = self._find_asset()
+        if not asset or not asset.get("browser_download_url"):
+            self.logger.error(f"[{self.thread_name}] No compatible package found in {tag_name}")
+            return
+        self._start_update_download(asset, background=True)
+
+    def _on_delta_failed(self, asset: dict, reason: str, background: bool = False) -> None:
+        self.logger.warning(f"[{self.thread_name}] Delta update failed ({reason}), downloading the full package")
+        if not background:
+            self.overlay.set_message("Downloading update…")
+        worker = self._create_download_worker(asset, background=background)
+        worker.download_failed.connect(self._on_predownload_failed if background else self._on_download_failed)
+        self._start_download_worker(worker, background)
+
+    def _start_download_worker(self, worker: DownloadWorker, background: bool = False) -> None:
+        if background:
+            tag_name = self.latest_release["tag_name"]
+            worker.download_finished.connect(lambda path: self._on_predownload_finished(tag_name, path))
+            self.thread_controller.add_worker(worker)
+            self.thread_controller.start_worker(worker.name, QThread.Priority.LowestPriority)
+            return
+        worker.progress.connect(lambda percent: self.overlay.set_message(f"Downloading update… {percent} %"))
+        worker.download_finished.connect(self._on_download_finished)
+        self.thread_controller.add_worker(worker)
+        self.thread_controller.start_worker(worker.name)
+
+    def _on_predownload_finished(self, tag_name: str, downloaded_path: str) -> None:
+        path = Path(downloaded_path)
+        asset = self._find_asset()
+        # the download was verified; without a release digest, record what was verified
+        sha256 = (parse_sha256_digest(asset.get("digest")) if asset else None) or _file_sha256(path)
+        self.pending_writer.write(  # type: ignore[union-attr]
+            PendingUpdateData(
+                tag_name=tag_name,
+                path=str(path),
+                size=path.stat().st_size,
+                sha256=sha256,
+                downloaded_at=datetime.now(),
+            )
+        )
+        self.logger.info(f"[{self.thread_name}] Update {tag_name} downloaded, it will be installed on next launch")
+
+    def _on_predownload_failed(self, reason: str) -> None:
+        # retried on the next periodic check, resuming from the partial file
+        self.logger.warning(f"[{self.thread_name}] Background update download failed: {reason}")
+
+    def _on_download_finished(self, downloaded_path: str) -> None:  # pragma: no cover
         self.overlay.set_message("Installing update…")
         QApplication.processEvents()
 
-        self._install_update(downloaded_exe_path)
+        # capture/OCR workers are already running by now
+        self.thread_controller.stop_all()
+        self._install_update(Path(downloaded_path))
 
         sys.exit(0)
 
+    def _on_download_failed(self, reason: str) -> None:
+        self.overlay.set_message(f"Update failed: {reason}. Skipping.")
+        self.update_completed.emit()
+
     @abstractmethod
     def _install_update(self,
         downloaded_exe_path: Path) -> None:
@@ -243,6 +539,11 @@ class WindowsUpdater(BaseUpdater):
 
     _ASSET_SUFFIX = ".exe"
 
+    def _delta_source(self, asset: dict) -> Optional[Path]:
+        # the one-file exe we are running is byte-identical to its release asset
+        running_exe = self.configuration.executable_path / "BazaarBuddy.exe"
+        return super()._delta_source(asset) or (running_exe if running_exe.is_file() else None)
+
     def _install_update(
         self,
         downloaded_exe_path: Path,
@@ -328,15 +629,34 @@ class MockUpdater(BaseUpdater):
         overlay: Overlay,
         logger: Logger,
         configuration: Configuration,
-        latest_release: dict | None = None,
+        update_source: BaseUpdateSource,
+        thread_controller: ThreadController,
+        download_dir: Path,
+        download_segments: int = 1,
+        pending_writer: Optional[BaseFileWriter] = None,
+        background: bool = False,
+        bandwidth_limit_kbps: int = 0,
     ):
-        # Pass an empty dict to satisfy the base class.
-        super().__init__(overlay, logger, configuration, latest_release or {})
+        super().__init__(
+            overlay,
+            logger,
+            configuration,
+            update_source,
+            thread_controller,
+            download_dir,
+            download_segments,
+            pending_writer,
+            background,
+            bandwidth_limit_kbps,
+        )
 
     # Override BOTH public entry-points so that nothing happens.
     def check_for_update(self) -> None:  # noqa: D401
         self.update_completed.emit()
 
+    def apply_pending_update(self) -> bool:
+        return False
+
     def _download_and_install_update(self) -> None:  # pragma: no cover
         pass
 # ───────────────────────────────────────────────────────────────
@@ -344,8 +664,38 @@ class MockUpdater(BaseUpdater):
 # ───────────────────────────────────────────────────────────────
 
 if __name__ == "__main__":  # pragma: no cover
-    from logger import logger
+    # Revalidates a release served by a local stand-in for the GitHub API:
+    # the first fetch gets a 200 with an ETag, the second a 304, the third
+    # (server gone) falls back to the cached release.
+    import json
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 
-    cfg = Configuration()
-    source = ProductionUpdateSource(logger)
-    
\ No newline at end of file
+    from logger import logger
+    from file_writer import WindowsFileWriter
+
+    release = {"tag_name": "v9.9.9", "assets": []}
+
+    class FakeGitHub(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.headers.get("If-None-Match") == '"v9.9.9"':
+                self.send_response(304)
+                self.end_headers()
+                return
+            body = json.dumps(release).encode()
+            self.send_response(200)
+            self.send_header("ETag", '"v9.9.9"')
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), FakeGitHub)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    api_url = f"http://127.0.0.1:{server.server_port}"
+
+    cache_writer = WindowsFileWriter(Path(tempfile.mkdtemp()) / "release_cache.json", ReleaseCacheData)
+    source = ProductionUpdateSource(logger, cache_writer, api_url)
+    print(source.fetch_latest_release())
+    print(ProductionUpdateSource(logger, cache_writer, api_url).fetch_latest_release())
+    server.shutdown()
+    server.server_close()
+    print(ProductionUpdateSource(logger, cache_writer, api_url).fetch_latest_release())
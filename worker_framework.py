@@ -3,14 +3,22 @@ Worker Thread Framework
 ======================
 
 A flexible framework for managing worker threads in PyQt applications.
+
+Workers can be supervised: when ``_run`` raises, the
+:class:`ThreadController` runs the worker again on the same thread (keeping
+its signal connections) after a delay chosen by a :class:`RestartPolicy`.
 """
 
-from PyQt6.QtCore import QObject, QThread, pyqtSignal, QTimer
+from PyQt6.QtCore import QObject, QThread, pyqtSignal, pyqtSlot, QTimer
+from abc import ABC, abstractmethod
+from collections import deque
+from dataclasses import dataclass, field
 import threading
 import logging
+import time
 import uuid
 import traceback
-from typing import TypedDict
+from typing import Callable, Optional, TypedDict
 
 
 class Worker(QObject):
@@ -25,6 +33,7 @@ class Worker(QObject):
     started = pyqtSignal()
     finished = pyqtSignal()
     error = pyqtSignal(str)
+    _restart_requested = pyqtSignal()
 
     def __init__(self, logger: logging.Logger, name=None):
         """Initialize a new worker
@@ -36,12 +45,20 @@ class Worker(QObject):
         self._name = name or f"Worker-{str(uuid.uuid4())[:8]}"
         self._stop_requested = False
         self._logger = logger
+        self._thread_ident: int | None = None
+        # emitted from the controller's thread; start_work runs again on the worker's own thread
+        self._restart_requested.connect(self.start_work)
 
     @property
     def name(self):
         """Get the worker's name"""
         return self._name
 
+    @property
+    def thread_ident(self) -> int | None:
+        """Identifier of the OS thread the worker is running on, if started"""
+        return self._thread_ident
+
     @property
     def is_stopping(self):
         """Check if stop has been requested"""
@@ -55,6 +72,7 @@ class Worker(QObject):
         """Override this method to handle any custom cleanup logic"""
         pass
 
+    @pyqtSlot()
     def start_work(self):
         """Main work method that gets called when thread starts.
 
@@ -62,6 +80,7 @@ class Worker(QObject):
         Override this method in subclasses to implement worker logic.
         """
         try:
+            self._thread_ident = threading.get_ident()
             self._logger.info(
                 f"[{threading.current_thread().name}] {self._name}: starting work on thread: {self._thread_name()}"
             )
@@ -69,17 +88,24 @@ class Worker(QObject):
             self._run()
         except Exception as e:
             self._logger.debug(traceback.format_exc())
-            self.error.emit(str(e))
+            self.error.emit(f"{type(e).__name__}: {e}")
 
     def stop_work(self):
         """Request the worker to stop.
 
         This sets the stop flag which should be checked by the worker's
-        _run method to terminate cleanly.
+        _run method to terminate cleanly.  Repeated calls do nothing until
+        :py:meth:`reset_stop`.
         """
+        if self._stop_requested:
+            return
         self._stop_requested = True
         self._on_stop_requested()
 
+    def reset_stop(self):
+        """Clear the stop flag so the worker can be started again."""
+        self._stop_requested = False
+
     def _thread_name(self):
         """Get the current thread name"""
         return threading.current_thread().name
@@ -90,12 +116,123 @@ class WorkerRecord(TypedDict):
     thread: QThread
 
 
+@dataclass
+class SupervisionRecord:
+    """Crash history of a supervised worker."""
+
+    policy: "RestartPolicy"
+    on_give_up: Optional[Callable[[str, list[str]], None]] = None
+    started_at: float = field(default_factory=time.monotonic)
+    consecutive_crashes: int = 0
+    crashes: int = 0
+    restarts: int = 0
+    circuit_opens: int = 0
+    state: str = "running"
+    errors: deque = field(default_factory=lambda: deque(maxlen=20))
+    crash_times: deque = field(default_factory=lambda: deque(maxlen=50))
+
+    def as_dict(self) -> dict:
+        return {
+            "state": self.state,
+            "crashes": self.crashes,
+            "restarts": self.restarts,
+            "circuit_opens": self.circuit_opens,
+            "last_error": self.errors[-1] if self.errors else None,
+        }
+
+
+class RestartPolicy(ABC):
+    """Decides whether, and how soon, a crashed worker runs again.
+
+    Args:
+        stable_after_s: A run lasting this long resets the consecutive crash count
+    """
+
+    def __init__(self, stable_after_s: float = 60.0):
+        self.stable_after_s = stable_after_s
+
+    @abstractmethod
+    def next_delay(self, record: SupervisionRecord, now: float) -> Optional[float]:
+        """Seconds to wait before restarting, or ``None`` to give up"""
+
+
+class ImmediateRestart(RestartPolicy):
+    """Restart straight away, at most ``max_restarts`` times in a row."""
+
+    def __init__(self, max_restarts: Optional[int] = None, stable_after_s: float = 60.0):
+        super().__init__(stable_after_s)
+        self.max_restarts = max_restarts
+
+    def next_delay(self, record, now):
+        if self.max_restarts is not None and record.consecutive_crashes > self.max_restarts:
+            return None
+        return 0.0
+
+
+class ExponentialBackoffRestart(RestartPolicy):
+    """Wait ``initial_s``, then twice as long after every further crash in a row, up to ``max_s``."""
+
+    def __init__(
+        self,
+        initial_s: float = 1.0,
+        max_s: float = 60.0,
+        max_restarts: Optional[int] = None,
+        stable_after_s: float = 60.0,
+    ):
+        super().__init__(stable_after_s)
+        self.initial_s = initial_s
+        self.max_s = max_s
+        self.max_restarts = max_restarts
+
+    def next_delay(self, record, now):
+        if self.max_restarts is not None and record.consecutive_crashes > self.max_restarts:
+            return None
+        return min(self.initial_s * 2 ** (record.consecutive_crashes - 1), self.max_s)
+
+
+class CircuitBreakerRestart(RestartPolicy):
+    """Restart after ``delay_s`` until ``max_failures`` crashes happen within ``window_s``.
+
+    The circuit then opens: the worker stays down for ``cooldown_s`` and is
+    tried once more (half-open); crashing again soon re-opens it.  After
+    ``max_opens`` openings in a row the controller gives up.
+    """
+
+    def __init__(
+        self,
+        max_failures: int = 5,
+        window_s: float = 60.0,
+        cooldown_s: float = 120.0,
+        delay_s: float = 1.0,
+        max_opens: Optional[int] = None,
+        stable_after_s: float = 60.0,
+    ):
+        super().__init__(stable_after_s)
+        self.max_failures = max_failures
+        self.window_s = window_s
+        self.cooldown_s = cooldown_s
+        self.delay_s = delay_s
+        self.max_opens = max_opens
+
+    def next_delay(self, record, now):
+        recent = sum(1 for crashed_at in record.crash_times if now - crashed_at <= self.window_s)
+        if recent < self.max_failures:
+            return self.delay_s
+        if self.max_opens is not None and record.circuit_opens >= self.max_opens:
+            return None
+        record.circuit_opens += 1
+        record.state = "circuit-open"
+        return self.cooldown_s
+
+
 class ThreadController:
     """Manages worker threads with proper lifecycle management"""
 
     def __init__(self, logger: logging.Logger):
         """Initialize the thread controller"""
         self.workers: dict[str, WorkerRecord] = {}
+        self.pools: dict[str, list[str]] = {}
+        self.supervised: dict[str, SupervisionRecord] = {}
         self._logger = logger
         self._thread_name = threading.current_thread().name
 
@@ -120,6 +257,7 @@ class ThreadController:
         thread.setObjectName(f"thread-{worker.name}")
 
         worker.error.connect(lambda e: self._logger.error(f"[[{self._thread_name}]] {worker.name} error: {e}"))
+        worker.error.connect(lambda e: self._on_worker_error(worker.name, e))
         worker.finished.connect(lambda: self.stop_worker(worker.name))
 
         worker.moveToThread(thread)
@@ -134,11 +272,12 @@ class ThreadController:
 
         return worker.name
 
-    def start_worker(self, worker_name):
+    def start_worker(self, worker_name, priority=QThread.Priority.InheritPriority):
         """Start a specific worker thread
 
         Args:
             worker_name: Name of the worker to start
+            priority: OS scheduling priority of the worker's thread
 
         Returns:
             bool: True if started successfully
@@ -150,12 +289,12 @@ class ThreadController:
             raise ValueError(f"No worker named '{worker_name}' found")
 
         worker_data = self.workers[worker_name]
-        worker_data["worker"]._stop_requested = False
+        worker_data["worker"].reset_stop()
 
         # Connect signals and slots
         worker_data["thread"].started.connect(lambda: QTimer.singleShot(0, worker_data["worker"].start_work))
 
-        worker_data["thread"].start()
+        worker_data["thread"].start(priority)
         self._logger.info(f"[{self._thread_name}] started worker: {worker_name}")
         return True
 
@@ -172,6 +311,9 @@ class ThreadController:
             return None
 
         worker_data = self.workers[worker_name]
+        record = self.supervised.pop(worker_name, None)
+        if record is not None and record.crashes:
+            self._logger.info(f"[{self._thread_name}] {worker_name} supervision: {record.as_dict()}")
         worker_data["worker"].stop_work()
         worker_data["worker"].error.disconnect()
         worker_data["thread"].started.disconnect()
@@ -185,6 +327,106 @@ class ThreadController:
         else:
             self._logger.warning(f"[{self._thread_name}] worker did not stop cleanly: {worker_name}")
 
+    def supervise(self, worker_name, policy: RestartPolicy, on_give_up=None):
+        """Restart a worker according to ``policy`` whenever its ``_run`` raises
+
+        Args:
+            worker_name: Name of a managed worker
+            policy: When (and whether) to restart it
+            on_give_up: Called with the worker's name and recent errors once the policy gives up
+
+        Raises:
+            ValueError: If worker is not found
+        """
+        if worker_name not in self.workers:
+            raise ValueError(f"No worker named '{worker_name}' found")
+        self.supervised[worker_name] = SupervisionRecord(policy, on_give_up)
+
+    def supervision_stats(self) -> dict[str, dict]:
+        """Crash and restart counts of every supervised worker"""
+        return {name: record.as_dict() for name, record in self.supervised.items()}
+
+    def _on_worker_error(self, worker_name, message):
+        record = self.supervised.get(worker_name)
+        worker_data = self.workers.get(worker_name)
+        if record is None or worker_data is None or worker_data["worker"].is_stopping:
+            return
+
+        now = time.monotonic()
+        if now - record.started_at >= record.policy.stable_after_s:
+            record.consecutive_crashes = 0
+            record.circuit_opens = 0
+        record.consecutive_crashes += 1
+        record.crashes += 1
+        record.crash_times.append(now)
+        record.errors.append(message)
+
+        delay = record.policy.next_delay(record, now)
+        if delay is None:
+            record.state = "given-up"
+            self._logger.error(
+                f"[{self._thread_name}] giving up on {worker_name} after {record.consecutive_crashes} crashes in a row"
+            )
+            if record.on_give_up:
+                record.on_give_up(worker_name, list(record.errors))
+            return
+
+        if record.state != "circuit-open":
+            record.state = "restarting"
+        self._logger.warning(f"[{self._thread_name}] restarting {worker_name} in {delay:.1f} s ({record.crashes} crashes)")
+        QTimer.singleShot(int(delay * 1000), lambda: self._restart_worker(worker_name, record))
+
+    def _restart_worker(self, worker_name, record):
+        worker_data = self.workers.get(worker_name)
+        # stopped or re-supervised while we were waiting
+        if worker_data is None or self.supervised.get(worker_name) is not record or worker_data["worker"].is_stopping:
+            return
+        record.restarts += 1
+        record.started_at = time.monotonic()
+        record.state = "running"
+        self._logger.info(f"[{self._thread_name}] restarted worker: {worker_name} (restart {record.restarts})")
+        worker_data["worker"]._restart_requested.emit()
+
+    def add_pool(self, pool_name, workers):
+        """Manage interchangeable workers as one pool that starts and stops together
+
+        Args:
+            pool_name: Name of the pool
+            workers: The Worker instances of the pool (each with a unique name)
+
+        Returns:
+            list: The names of the pool's workers
+        """
+        if pool_name not in self.pools:
+            self.pools[pool_name] = [self.add_worker(worker) for worker in workers]
+            self._logger.info(f"[{self._thread_name}] added pool: {pool_name} ({len(self.pools[pool_name])} workers)")
+        return self.pools[pool_name]
+
+    def start_pool(self, pool_name, priority=QThread.Priority.InheritPriority):
+        """Start every worker of a pool
+
+        Raises:
+            ValueError: If the pool is not found
+        """
+        if pool_name not in self.pools:
+            raise ValueError(f"No pool named '{pool_name}' found")
+        for worker_name in self.pools[pool_name]:
+            self.start_worker(worker_name, priority)
+
+    def stop_pool(self, pool_name):
+        """Stop every worker of a pool and forget the pool"""
+        worker_names = self.pools.pop(pool_name, [])
+        # flag them all first so they wind down in parallel rather than one after another
+        for worker_name in worker_names:
+            if worker_name in self.workers:
+                self.workers[worker_name]["worker"].stop_work()
+        for worker_name in worker_names:
+            self.stop_worker(worker_name)
+
+    def pool_workers(self, pool_name) -> list[Worker]:
+        """Workers of a pool that are still managed"""
+        return [self.workers[name]["worker"] for name in self.pools.get(pool_name, []) if name in self.workers]
+
     def start_all(self):
         """Start all worker threads"""
         self._logger.info(f"[{self._thread_name}] starting all workers")
@@ -207,6 +449,16 @@ class ThreadController:
                 worker_data["thread"].wait()
             self.workers.pop(worker_name, None)
 
+    def worker_threads(self) -> dict[int, str]:
+        """Map the thread identifier of every running worker to its name"""
+        # snapshot first: this may be called from a non-Qt thread (e.g. the profiler)
+        records = list(self.workers.values())
+        return {
+            record["worker"].thread_ident: record["worker"].name
+            for record in records
+            if record["worker"].thread_ident is not None
+        }
+
     def get_worker_by_name(self, worker_name) -> Worker | None:
         """Get a worker by name"""
         worker_data = self.workers.get(worker_name, None)